@@ -36,9 +36,62 @@ def create_app(config_class=None):
     db.init_app(app)
     migrate.init_app(app, db)
     
+    # 요청별 구간 소요 시간 측정 (다른 before_request보다 먼저 시작)
+    from app.utils.request_timing import request_timing
+    request_timing.init_app(app)
+    
+    # Prometheus 지표 수집 및 /metrics 엔드포인트
+    from app.utils.metrics import metrics
+    metrics.init_app(app)
+    
+    # 요청별 SQL 문장 수 집계와 N+1 의심 경고 (개발/테스트용)
+    from app.utils.query_counter import query_counter
+    query_counter.init_app(app)
+    
+    # 헤더/샘플링으로 선택된 요청 프로파일링 (비활성화 시 미들웨어를 끼우지 않음)
+    from app.utils.request_profiler import request_profiler
+    request_profiler.init_app(app)
+    
     # JWT 초기화
     jwt.init_app(app)
     
+    # 검증된 토큰 캐시 초기화
+    from app.auth.token_cache import verified_token_cache
+    verified_token_cache.init_app(app)
+    
+    # 토큰 취소 저장소 초기화 (캐시된 토큰도 취소 여부 확인)
+    from app.auth.revocation import token_revocation_store
+    token_revocation_store.init_app(app)
+    verified_token_cache.add_revocation_check(token_revocation_store.is_revoked)
+    
+    # 구글 ID 토큰 검증기 초기화 (공개키는 처음 로그인할 때 조회)
+    from app.auth.google_id_token import google_id_token_verifier
+    google_id_token_verifier.init_app(app)
+    
+    # 회원 식별 정보 캐시 초기화
+    from app.auth.identity import member_identity_cache
+    member_identity_cache.init_app(app)
+    
+    # 좋아요 수 write-behind 버퍼 초기화
+    from app.utils.like_count_buffer import like_count_buffer
+    like_count_buffer.init_app(app)
+    
+    # S3 객체 삭제 큐 초기화 (워커별로 요청이 들어오면 처리 스레드 시작)
+    from app.utils.s3_delete_queue import s3_delete_queue
+    s3_delete_queue.init_app(app)
+    
+    # 제목 자동완성 색인 초기화 (워커별로 처음 사용할 때 구성)
+    from app.utils.suggest_index import title_suggest_index
+    title_suggest_index.init_app(app)
+    
+    # 내용 기반 유사 음악 색인 초기화 (워커별로 처음 사용할 때 구성)
+    from app.utils.related_index import related_music_index
+    related_music_index.init_app(app)
+    
+    # 비슷한 프롬프트 재사용용 MinHash 색인 초기화
+    from app.utils.prompt_index import prompt_minhash_index
+    prompt_minhash_index.init_app(app)
+    
     # JWT 에러 핸들러 설정
     from app.auth.jwt_callbacks import register_jwt_callbacks
     register_jwt_callbacks(jwt)
@@ -67,6 +120,10 @@ def create_app(config_class=None):
             }
         }), 200
     
+    # CLI 명령 등록
+    from app.commands import register_commands
+    register_commands(app)
+    
     # 에러 핸들러 등록
     from app.utils.error_handler import register_error_handlers
     register_error_handlers(app)
@@ -0,0 +1,151 @@
+import json
+import threading
+import time
+import jwt
+from jwt.algorithms import RSAAlgorithm
+from app.utils.exceptions import UnauthorizedException, ExternalAPIException
+import logging
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+
+# 만료 전 이 시간(초)부터는 요청을 막지 않고 백그라운드에서 공개키 갱신
+REFRESH_AHEAD_SECONDS = 300
+
+
+class GoogleIdTokenVerifier:
+    """구글 ID 토큰 로컬 검증
+    
+    구글 JWKS 공개키를 kid별로 캐시하여 ID 토큰의 RS256 서명과
+    aud/iss/exp를 로컬에서 검사합니다. 공개키는 응답의 Cache-Control max-age까지
+    사용하고 만료가 가까우면 백그라운드에서 갱신하며, 모르는 kid(키 교체)가 오면
+    GOOGLE_JWKS_MIN_REFRESH_SECONDS 간격 안에서 한 번 즉시 갱신합니다.
+    """
+    
+    def __init__(self, app=None):
+        self.app = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._keys = {}  # kid -> RSA 공개키
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._fetched_at = 0.0
+        self._refreshing = False
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.client_id = app.config.get('GOOGLE_CLIENT_ID')
+        self.min_refresh_seconds = app.config.get('GOOGLE_JWKS_MIN_REFRESH_SECONDS', 60)
+        self.default_max_age = app.config.get('GOOGLE_JWKS_DEFAULT_MAX_AGE', 3600)
+        app.extensions['google_id_token_verifier'] = self
+    
+    def verify(self, id_token):
+        """ID 토큰 검증
+        
+        Args:
+            id_token: 구글이 발급한 ID 토큰 (JWT)
+        
+        Returns:
+            검증된 클레임 딕셔너리 (sub, name, email 등)
+        
+        Raises:
+            UnauthorizedException: 토큰이 유효하지 않은 경우
+        """
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.PyJWTError as e:
+            logger.warning(f"ID 토큰 헤더 해석 실패: {str(e)}")
+            raise UnauthorizedException("유효하지 않은 ID 토큰입니다.")
+        
+        key = self._get_key(header.get('kid'))
+        if key is None:
+            logger.warning(f"ID 토큰 서명 키를 찾을 수 없음: kid {header.get('kid')}")
+            raise UnauthorizedException("유효하지 않은 ID 토큰입니다.")
+        
+        try:
+            claims = jwt.decode(id_token, key, algorithms=['RS256'], audience=self.client_id,
+                                options={'require': ['exp', 'iat', 'iss', 'aud', 'sub']})
+        except jwt.PyJWTError as e:
+            logger.warning(f"ID 토큰 검증 실패: {str(e)}")
+            raise UnauthorizedException("유효하지 않은 ID 토큰입니다.")
+        
+        if claims.get('iss') not in GOOGLE_ISSUERS:
+            logger.warning(f"ID 토큰 발급자 불일치: {claims.get('iss')}")
+            raise UnauthorizedException("유효하지 않은 ID 토큰입니다.")
+        
+        return claims
+    
+    def load_jwks(self, jwks, max_age=None):
+        """JWKS 공개키 등록 (테스트에서는 로컬 키로 직접 등록)
+        
+        Args:
+            jwks: {'keys': [...]} 형식의 JWKS
+            max_age: 캐시 유효 시간(초)
+        """
+        keys = {}
+        for jwk in jwks.get('keys', []):
+            if jwk.get('kty') == 'RSA' and jwk.get('kid'):
+                keys[jwk['kid']] = RSAAlgorithm.from_jwk(json.dumps(jwk))
+        
+        max_age = max_age or self.default_max_age
+        with self._lock:
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+            self._expires_at = self._fetched_at + max_age
+            self._refresh_at = self._expires_at - min(REFRESH_AHEAD_SECONDS, max_age / 2)
+    
+    def refresh(self):
+        """구글 JWKS 다시 조회"""
+        from app.clients.oauth_client import OAuthClient
+        
+        with self.app.app_context():
+            jwks, max_age = OAuthClient.get_google_jwks()
+        self.load_jwks(jwks, max_age)
+        logger.info(f"Google 공개키 갱신 완료: {len(self._keys)}개")
+    
+    def _get_key(self, kid):
+        now = time.monotonic()
+        
+        if now >= self._expires_at:
+            # 만료된 키 집합은 사용하지 않고 바로 갱신
+            self._refresh_once()
+        elif now >= self._refresh_at and not self._refreshing:
+            self._refreshing = True
+            threading.Thread(target=self._background_refresh, name='google-jwks-refresh',
+                             daemon=True).start()
+        
+        key = self._keys.get(kid)
+        if key is None and now - self._fetched_at >= self.min_refresh_seconds:
+            # 구글 키 교체 직후일 수 있으므로 한 번 더 조회
+            self._refresh_once()
+            key = self._keys.get(kid)
+        return key
+    
+    def _refresh_once(self):
+        # 여러 요청이 동시에 만료를 발견해도 한 번만 조회
+        with self._refresh_lock:
+            if time.monotonic() - self._fetched_at < self.min_refresh_seconds and self._keys:
+                return
+            try:
+                self.refresh()
+            except ExternalAPIException:
+                if not self._keys:
+                    raise
+                # 구글 장애 시에는 기존 공개키로 계속 검증
+                logger.warning("Google 공개키 갱신 실패, 기존 공개키 사용")
+                self._fetched_at = time.monotonic()
+    
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Google 공개키 갱신 실패: {str(e)}")
+        finally:
+            self._refreshing = False
+
+
+google_id_token_verifier = GoogleIdTokenVerifier()
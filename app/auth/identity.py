@@ -0,0 +1,123 @@
+from collections import namedtuple
+from flask import g, has_app_context
+from sqlalchemy import event
+from app import db
+from app.models.member import Member
+from app.utils.ttl_cache import TTLCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 서비스에서 쓰는 회원 정보만 담은 가벼운 값 (Member와 같은 속성 이름)
+MemberIdentity = namedtuple('MemberIdentity', ['id', 'google_id', 'name'])
+
+# /api/me 응답용 프로필 (updated_at은 ETag 버전으로 사용)
+MemberProfile = namedtuple('MemberProfile', ['id', 'google_id', 'name', 'created_at', 'updated_at'])
+
+
+class MemberIdentityCache:
+    """google_id -> 회원 식별 정보 캐시 (회원 ID -> 프로필 캐시 포함)
+    
+    요청 안에서는 flask.g의 identity map으로 한 번만 조회하고, 요청 사이에는
+    워커별 TTL/LRU 캐시를 사용합니다.
+    
+    무효화(invalidate, prime)는 이 프로세스의 캐시에만 적용됩니다. 다른 워커는
+    MEMBER_IDENTITY_CACHE_TTL_SECONDS(기본 60초)가 지날 때까지 이전 이름과 프로필
+    (/api/me의 ETag 포함)을 응답할 수 있고, 삭제된 회원도 그동안 찾아질 수 있습니다.
+    토큰의 google_id/name 클레임은 발급 시점 값이라 더 오래될 수 있으므로 회원 정보는
+    항상 이 캐시나 DB 기준으로 읽습니다. 더 빠른 반영이 필요하면 TTL을 줄이십시오.
+    """
+    
+    def __init__(self, app=None):
+        self._cache = TTLCache()
+        self._profiles = TTLCache()
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self._cache = TTLCache(
+            maxsize=app.config.get('MEMBER_IDENTITY_CACHE_SIZE', 10000),
+            ttl=app.config.get('MEMBER_IDENTITY_CACHE_TTL_SECONDS', 60)
+        )
+        self._profiles = TTLCache(
+            maxsize=app.config.get('MEMBER_IDENTITY_CACHE_SIZE', 10000),
+            ttl=app.config.get('MEMBER_IDENTITY_CACHE_TTL_SECONDS', 60)
+        )
+        app.extensions['member_identity_cache'] = self
+    
+    def resolve(self, google_id):
+        """구글 ID로 회원 식별 정보 조회 (캐시에 없을 때만 DB 조회)
+        
+        Returns:
+            MemberIdentity 또는 None
+        """
+        if not google_id:
+            return None
+        
+        identities = self._request_identities()
+        identity = identities.get(google_id)
+        if identity is not None:
+            return identity
+        
+        identity = self._cache.get(google_id)
+        if identity is None:
+            row = db.session.query(Member.id, Member.google_id, Member.name)\
+                            .filter(Member.google_id == google_id).first()
+            if row is None:
+                return None
+            identity = MemberIdentity(row.id, row.google_id, row.name)
+            self._cache.set(google_id, identity)
+        
+        identities[google_id] = identity
+        return identity
+    
+    def profile(self, member_id):
+        """회원 ID로 프로필 조회 (캐시에 없을 때만 DB 조회)
+        
+        Returns:
+            MemberProfile 또는 None
+        """
+        profile = self._profiles.get(member_id)
+        if profile is None:
+            row = db.session.query(Member.id, Member.google_id, Member.name,
+                                   Member.created_at, Member.updated_at)\
+                            .filter(Member.id == member_id).first()
+            if row is None:
+                return None
+            profile = MemberProfile(row.id, row.google_id, row.name, row.created_at, row.updated_at)
+            self._profiles.set(member_id, profile)
+        return profile
+    
+    def prime(self, member):
+        """방금 조회/생성한 회원을 캐시에 저장 (이름이 바뀌었을 수 있으므로 프로필은 제거)"""
+        identity = MemberIdentity(member.id, member.google_id, member.name)
+        self._cache.set(member.google_id, identity)
+        self._profiles.pop(member.id)
+        return identity
+    
+    def invalidate(self, google_id, member_id=None):
+        """회원 식별 정보와 프로필 무효화 (이 워커만, 다른 워커는 TTL 만료 후 반영)"""
+        self._cache.pop(google_id)
+        if member_id is not None:
+            self._profiles.pop(member_id)
+        if has_app_context():
+            self._request_identities().pop(google_id, None)
+    
+    @staticmethod
+    def _request_identities():
+        if not has_app_context():
+            return {}
+        if 'member_identities' not in g:
+            g.member_identities = {}
+        return g.member_identities
+
+
+member_identity_cache = MemberIdentityCache()
+
+
+@event.listens_for(Member, 'after_update')
+@event.listens_for(Member, 'after_delete')
+def invalidate_member_identity(mapper, connection, target):
+    """회원 수정/삭제 시 식별 정보와 프로필 캐시 무효화"""
+    member_identity_cache.invalidate(target.google_id, target.id)
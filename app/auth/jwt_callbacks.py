@@ -54,6 +54,12 @@ def register_jwt_callbacks(jwt):
             'error_code': 'FRESH_TOKEN_REQUIRED'
         }), 401
     
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload):
+        """취소된 토큰 확인 (대부분 Bloom 필터에서 I/O 없이 판단)"""
+        from app.auth.revocation import token_revocation_store
+        return token_revocation_store.is_revoked(jwt_payload['jti'])
+    
     @jwt.revoked_token_loader
     def revoked_token_callback(jwt_header, jwt_payload):
         """취소된 토큰 처리"""
@@ -0,0 +1,113 @@
+import time
+from datetime import datetime
+from app.utils.bloom_filter import BloomFilter
+from app.utils.per_worker_index import PerWorkerIndex
+from app.utils.ttl_cache import TTLCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bloom 필터 최소 용량과 거짓 양성 확률
+BLOOM_MIN_CAPACITY = 10000
+BLOOM_ERROR_RATE = 0.001
+
+
+class TokenRevocationStore(PerWorkerIndex):
+    """jti 기반 토큰 취소 저장소
+    
+    취소 기록은 revoked_token_tb에 두고, 워커별 Bloom 필터로 "확실히 취소되지 않음"을
+    I/O 없이 판단합니다. 필터가 양성일 때만 DB에서 확인하며, 필터가 처음 구성되기
+    전에는 모든 토큰을 DB에서 확인합니다.
+    
+    다른 워커에서 취소한 토큰은 REVOKED_TOKEN_REFRESH_SECONDS 주기의 필터 재구성으로
+    반영되며, 재구성 시 만료된 기록은 REVOKED_TOKEN_COMPACT_SECONDS마다 정리합니다.
+    """
+    
+    extension_name = 'token_revocation_store'
+    refresh_setting = 'REVOKED_TOKEN_REFRESH_SECONDS'
+    default_refresh_seconds = 30
+    label = '토큰 취소 필터'
+    
+    def __init__(self, app=None):
+        self._bloom = BloomFilter(BLOOM_MIN_CAPACITY, BLOOM_ERROR_RATE)
+        self._count = 0
+        self._confirmed = TTLCache()  # jti -> DB 확인 결과
+        self._compacted_at = 0.0
+        super().__init__(app)
+    
+    def init_app(self, app):
+        super().init_app(app)
+        self.compact_seconds = app.config.get('REVOKED_TOKEN_COMPACT_SECONDS', 3600)
+        self._confirmed = TTLCache(maxsize=10000, ttl=self.refresh_seconds)
+    
+    def is_revoked(self, jti):
+        """취소된 토큰인지 확인 (대부분 Bloom 필터에서 I/O 없이 False)"""
+        from app.models.revoked_token import RevokedToken
+        
+        self.start()
+        
+        if self.ready and jti not in self._bloom:
+            return False
+        
+        revoked = self._confirmed.get(jti)
+        if revoked is None:
+            revoked = RevokedToken.exists(jti)
+            self._confirmed.set(jti, revoked)
+        return revoked
+    
+    def revoke(self, jti, exp):
+        """토큰 취소
+        
+        Args:
+            jti: 토큰 고유 ID
+            exp: 토큰 만료 시각 (UNIX 타임스탬프)
+        """
+        from app import db
+        from app.models.revoked_token import RevokedToken
+        
+        try:
+            RevokedToken.revoke(jti, datetime.utcfromtimestamp(exp))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        # 재구성 중에 취소한 토큰은 새 필터에도 다시 추가됨
+        self.apply([jti])
+        self._confirmed.set(jti, True)
+        logger.info(f"토큰 취소: jti {jti}")
+    
+    def _load(self):
+        """만료되지 않은 취소 기록으로 새 Bloom 필터 구성 (주기적으로 만료 기록 정리)"""
+        from app import db
+        from app.models.revoked_token import RevokedToken
+        
+        if time.monotonic() - self._compacted_at > self.compact_seconds:
+            try:
+                deleted = RevokedToken.delete_expired()
+                db.session.commit()
+                if deleted:
+                    logger.info(f"만료된 토큰 취소 기록 정리: {deleted}건")
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"토큰 취소 기록 정리 실패: {str(e)}")
+            self._compacted_at = time.monotonic()
+        
+        jtis = list(RevokedToken.find_active_jtis())
+        bloom = BloomFilter(max(BLOOM_MIN_CAPACITY, len(jtis) * 2), BLOOM_ERROR_RATE)
+        for jti in jtis:
+            bloom.add(jti)
+        return bloom, len(jtis)
+    
+    def _install(self, state):
+        self._bloom, self._count = state
+        self._confirmed.clear()
+    
+    def _apply_change(self, jti):
+        self._bloom.add(jti)
+    
+    def _size(self):
+        return self._count
+
+
+token_revocation_store = TokenRevocationStore()
@@ -3,6 +3,9 @@ from functools import wraps
 from flask import jsonify, request, current_app
 import datetime
 from app.utils.exceptions import UnauthorizedException, ForbiddenException
+from app.auth.token_cache import verified_token_cache
+from app.auth.revocation import token_revocation_store
+from app.utils.request_timing import timed_phase
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,6 +37,67 @@ def generate_token(member):
     logger.info(f"토큰 생성 완료: 사용자 ID {member.id}")
     return access_token
 
+def _bearer_token():
+    """Authorization 헤더의 Bearer 토큰 (없으면 None)"""
+    auth_header = request.headers.get('Authorization', '')
+    if auth_header.startswith('Bearer '):
+        return auth_header[len('Bearer '):].strip() or None
+    return None
+
+def _build_current_user(member_id, claims):
+    """토큰 식별자와 추가 클레임으로 사용자 정보 구성"""
+    return {
+        'id': int(member_id),  # sub는 문자열
+        'google_id': claims.get('google_id'),
+        'name': claims.get('name')
+    }
+
+@timed_phase('auth')
+def _verify_current_user(optional=False):
+    """요청의 토큰을 검증하여 사용자 정보 반환
+    
+    같은 토큰을 이미 검증했다면 검증된 토큰 캐시에서 바로 반환하고,
+    처음 보는 토큰만 verify_jwt_in_request로 서명과 클레임을 검사합니다.
+    
+    Returns:
+        사용자 정보 딕셔너리 (optional이고 토큰이 없으면 None)
+    """
+    from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
+    
+    raw_token = _bearer_token()
+    if raw_token:
+        current_user = verified_token_cache.get(raw_token)
+        if current_user is not None:
+            return current_user
+    
+    # JWT 요청 검증
+    verify_jwt_in_request(optional=optional)
+    member_id = get_jwt_identity()
+    if member_id is None:
+        return None
+    
+    claims = get_jwt()  # 추가 클레임들
+    current_user = _build_current_user(member_id, claims)
+    if raw_token:
+        verified_token_cache.set(raw_token, current_user, jti=claims.get('jti'), exp=claims.get('exp'))
+    return current_user
+
+def revoke_current_token():
+    """현재 요청의 액세스 토큰 취소 (로그아웃)
+    
+    Raises:
+        UnauthorizedException: 토큰이 없거나 유효하지 않은 경우
+    """
+    from flask_jwt_extended import decode_token
+    
+    raw_token = _bearer_token()
+    if not raw_token:
+        raise UnauthorizedException()
+    
+    claims = decode_token(raw_token)
+    token_revocation_store.revoke(claims['jti'], claims['exp'])
+    verified_token_cache.revoke(raw_token)
+
 def get_current_user():
     """현재 인증된 사용자 정보 반환
     
@@ -44,19 +108,7 @@ def get_current_user():
         UnauthorizedException: 토큰이 유효하지 않은 경우
     """
     try:
-        from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
-        
-        verify_jwt_in_request()
-        member_id = get_jwt_identity()  # 이제 문자열
-        claims = get_jwt()  # 추가 클레임들
-        
-        # 사용자 정보 구성
-        current_user = {
-            'id': int(member_id),
-            'google_id': claims.get('google_id'),
-            'name': claims.get('name')
-        }
-        return current_user
+        return _verify_current_user()
     except Exception as e:
         logger.error(f"토큰 검증 실패: {str(e)}")
         raise UnauthorizedException()
@@ -73,26 +125,12 @@ def auth_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         try:
-            from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
-            
-            # JWT 요청 검증
-            verify_jwt_in_request()
-            
-            # 사용자 정보 추출
-            member_id = get_jwt_identity()  # 문자열
-            claims = get_jwt()  # 추가 클레임들
-            
-            # 사용자 정보 구성
-            current_user = {
-                'id': int(member_id),
-                'google_id': claims.get('google_id'),
-                'name': claims.get('name')
-            }
-            
-            return f(current_user, *args, **kwargs)
+            current_user = _verify_current_user()
         except Exception as e:
             logger.error(f"인증 실패: {str(e)}")
             raise UnauthorizedException()
+        
+        return f(current_user, *args, **kwargs)
     return decorated
 
 def optional_auth(f):
@@ -106,31 +144,14 @@ def optional_auth(f):
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        try:
-            auth_header = request.headers.get('Authorization')
-            if auth_header and auth_header.startswith('Bearer '):
-                from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
-                try:
-                    verify_jwt_in_request(optional=True)
-                    member_id = get_jwt_identity()  # 문자열
-                    claims = get_jwt()  # 추가 클레임들
-                    
-                    # 사용자 정보 구성 (딕셔너리로 변환)
-                    current_user = {
-                        'id': int(member_id),
-                        'google_id': claims.get('google_id'),
-                        'name': claims.get('name')
-                    }
-                    
-                    return f(current_user, *args, **kwargs)
-                except Exception as e:
-                    logger.warning(f"토큰 검증 실패 (선택적 인증): {str(e)}")
-                    # 인증 실패해도 계속 진행, 인증 정보 없이 함수 호출
-            
-            # 인증되지 않은 경우 None 전달
-            return f(None, *args, **kwargs)
-        except Exception as e:
-            logger.error(f"선택적 인증 처리 중 오류: {str(e)}")
-            return f(None, *args, **kwargs)
+        current_user = None
+        if _bearer_token():
+            try:
+                current_user = _verify_current_user(optional=True)
+            except Exception as e:
+                logger.warning(f"토큰 검증 실패 (선택적 인증): {str(e)}")
+                # 인증 실패해도 계속 진행, 인증 정보 없이 함수 호출
+        
+        return f(current_user, *args, **kwargs)
     
-    return decorated
\ No newline at end of file
+    return decorated
@@ -0,0 +1,71 @@
+import hashlib
+import time
+from app.utils.ttl_cache import TTLCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class VerifiedTokenCache:
+    """검증된 액세스 토큰 캐시
+    
+    원본 토큰의 SHA-256 해시를 키로 디코딩한 사용자 정보를 토큰 만료(exp)까지
+    보관하여, 같은 토큰의 반복 요청에서 서명 검증과 클레임 검사를 생략합니다.
+    캐시된 토큰도 매번 등록된 취소 확인 함수로 jti를 검사합니다.
+    """
+    
+    def __init__(self, app=None):
+        self._cache = TTLCache()
+        self._revocation_checks = []
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self._cache = TTLCache(maxsize=app.config.get('VERIFIED_TOKEN_CACHE_SIZE', 10000))
+        app.extensions['verified_token_cache'] = self
+    
+    def get(self, raw_token):
+        """캐시된 사용자 정보 조회 (없거나 만료/취소되었으면 None)"""
+        key = self._key(raw_token)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        current_user, jti = entry
+        if jti and any(check(jti) for check in self._revocation_checks):
+            self._cache.pop(key)
+            return None
+        return dict(current_user)
+    
+    def set(self, raw_token, current_user, jti=None, exp=None):
+        """검증된 토큰의 사용자 정보 저장 (exp가 지난 토큰은 저장하지 않음)"""
+        ttl = None
+        if exp is not None:
+            ttl = exp - time.time()
+            if ttl <= 0:
+                return
+        self._cache.set(self._key(raw_token), (dict(current_user), jti), ttl=ttl)
+    
+    def revoke(self, raw_token):
+        """토큰 캐시 항목 제거 (로그아웃 등)"""
+        self._cache.pop(self._key(raw_token))
+    
+    def clear(self):
+        self._cache.clear()
+    
+    def add_revocation_check(self, check):
+        """캐시 적중 시 호출할 취소 확인 함수 등록
+        
+        Args:
+            check: jti를 받아 취소된 토큰이면 True를 반환하는 함수 (I/O 없이 빨라야 함)
+        """
+        if check not in self._revocation_checks:
+            self._revocation_checks.append(check)
+    
+    @staticmethod
+    def _key(raw_token):
+        return hashlib.sha256(raw_token.encode('utf-8')).digest()
+
+
+verified_token_cache = VerifiedTokenCache()
@@ -2,6 +2,7 @@ import requests
 from flask import current_app
 import logging
 from app.utils.exceptions import AIServerException, ExternalAPIException
+from app.utils.request_timing import timed_phase
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,7 @@ class AIClient:
         if not self.base_url:
             logger.warning("AI_SERVER_URL이 설정되지 않았습니다. 테스트 모드로 작동합니다.")
     
+    @timed_phase('ai', operation='text')
     def generate_music_with_text(self, prompt, prompt2=""):
         """텍스트 기반 음악 생성 API 호출
         
@@ -65,6 +67,7 @@ class AIClient:
             logger.error(f"AI 서버 요청 오류: {str(e)}")
             raise ExternalAPIException(f"AI 서버 연결 오류: {str(e)}")
     
+    @timed_phase('ai', operation='image')
     def generate_music_with_image(self, image_file):
         """이미지 기반 음악 생성 API 호출
         
@@ -115,6 +118,7 @@ class AIClient:
             logger.error(f"AI 서버 요청 오류: {str(e)}")
             raise ExternalAPIException(f"AI 서버 연결 오류: {str(e)}")
         
+    @timed_phase('ai', operation='video')
     def generate_music_with_video(self, video_file):
         """동영상 기반 음악 생성 API 호출
         
@@ -161,6 +165,67 @@ class AIClient:
                 'title': title
             }
             
+        except requests.RequestException as e:
+            logger.error(f"AI 서버 요청 오류: {str(e)}")
+            raise ExternalAPIException(f"AI 서버 연결 오류: {str(e)}")
+    
+    @timed_phase('ai', operation=lambda self, media_type, *args, **kwargs: media_type)
+    def generate_music_with_media_url(self, media_type, media_url, object_key):
+        """S3에 직접 업로드된 이미지/동영상 기반 음악 생성 API 호출
+        
+        파일 본문 대신 presigned GET URL을 전달하여 AI 서버가 S3에서 직접 내려받게 합니다.
+        
+        Args:
+            media_type: 'image' 또는 'video'
+            media_url: 미디어 객체의 presigned GET URL
+            object_key: 미디어 객체의 S3 키
+        
+        Returns:
+            음악 URL 및 메타데이터를 포함한 딕셔너리
+        
+        Raises:
+            AIServerException: AI 서버 호출 중 오류 발생 시
+        """
+        # 테스트 모드 (AI 서버 URL이 없을 경우)
+        if not self.base_url:
+            # 가짜 URL 생성
+            filename = object_key.rsplit('/', 1)[-1]
+            label = '이미지' if media_type == 'image' else '동영상'
+            return {
+                'music_url': f"https://example.com/fake_{media_type}_music_{filename}.mp3",
+                'title': f'{label}에서 생성된 음악 - {filename}'
+            }
+        
+        try:
+            url = f"{self.base_url}/generate_audio_from_{media_type}_url"
+            headers = {'Content-Type': 'application/json'}
+            payload = {
+                'fileUrl': media_url,
+                'objectKey': object_key
+            }
+            
+            logger.info(f"AI 서버 호출: {url}, 객체 키: {object_key}")
+            # 동영상 처리는 시간이 더 걸릴 수 있음
+            response = requests.post(url, headers=headers, json=payload,
+                                     timeout=60 if media_type == 'video' else 30)
+            
+            if response.status_code != 200:
+                logger.error(f"AI 서버 오류: {response.status_code}, {response.text}")
+                raise AIServerException(f"AI 서버 오류: {response.status_code}")
+            
+            response_data = response.json()
+            music_url = response_data.get('musicUrl')
+            title = response_data.get('title')
+            
+            if not music_url or not title:
+                logger.error(f"AI 서버 응답에 필요한 데이터가 없습니다: {response_data}")
+                raise AIServerException("음악 생성에 실패했습니다.")
+            
+            return {
+                'music_url': music_url,
+                'title': title
+            }
+        
         except requests.RequestException as e:
             logger.error(f"AI 서버 요청 오류: {str(e)}")
             raise ExternalAPIException(f"AI 서버 연결 오류: {str(e)}")
\ No newline at end of file
@@ -72,4 +72,37 @@ class OAuthClient:
             
         except requests.RequestException as e:
             logger.error(f"Google API 요청 오류: {str(e)}")
-            raise ExternalAPIException(f"Google 서버 연결 오류: {str(e)}")
\ No newline at end of file
+            raise ExternalAPIException(f"Google 서버 연결 오류: {str(e)}")
+    
+    @staticmethod
+    def get_google_jwks():
+        """구글 ID 토큰 서명 공개키(JWKS) 조회
+        
+        Returns:
+            (JWKS 딕셔너리, 캐시 유효 시간(초) 또는 None) 튜플
+        
+        Raises:
+            ExternalAPIException: 공개키 조회 중 오류 발생 시
+        """
+        try:
+            url = current_app.config['GOOGLE_JWKS_URL']
+            
+            logger.info(f"Google 공개키 요청: {url}")
+            response = requests.get(url, timeout=10)
+            
+            if response.status_code != 200:
+                logger.error(f"Google 공개키 조회 실패: {response.status_code}, {response.text}")
+                raise ExternalAPIException(f"Google 공개키 조회 실패: {response.status_code}")
+            
+            # Cache-Control: public, max-age=19845, must-revalidate, no-transform
+            max_age = None
+            for directive in response.headers.get('Cache-Control', '').split(','):
+                name, _, value = directive.strip().partition('=')
+                if name == 'max-age' and value.isdigit():
+                    max_age = int(value)
+            
+            return response.json(), max_age
+        
+        except requests.RequestException as e:
+            logger.error(f"Google API 요청 오류: {str(e)}")
+            raise ExternalAPIException(f"Google 서버 연결 오류: {str(e)}")
@@ -0,0 +1,70 @@
+import click
+import logging
+
+logger = logging.getLogger(__name__)
+
+def register_commands(app):
+    """flask CLI 명령 등록"""
+    
+    @app.cli.command('rebuild-similar-music')
+    @click.option('--top-n', default=20, show_default=True, help='음악별로 저장할 유사 음악 수')
+    @click.option('--music-id', 'music_ids', multiple=True, type=int,
+                  help='다시 계산할 음악 ID (여러 번 지정 가능, 없으면 전체)')
+    def rebuild_similar_music(top_n, music_ids):
+        """좋아요 동시 출현으로 유사 음악 목록 재계산"""
+        from app.services.recommendation_service import RecommendationService
+        
+        count = RecommendationService.rebuild_similar_music(top_n=top_n, music_ids=list(music_ids) or None)
+        click.echo(f"유사 음악 목록 저장 완료: 음악 {count}건")
+    
+    @app.cli.command('s3-delete-queue')
+    @click.option('--retry-dead', is_flag=True, help='dead 상태 작업을 다시 처리 대기로 전환')
+    @click.option('--drain', is_flag=True, help='처리할 시각이 된 작업을 바로 처리')
+    def s3_delete_queue_command(retry_dead, drain):
+        """S3 객체 삭제 큐 상태 확인 및 처리"""
+        from app import db
+        from app.models.s3_delete_job import S3DeleteJob
+        from app.utils.s3_delete_queue import s3_delete_queue
+        
+        if retry_dead:
+            count = S3DeleteJob.retry_dead()
+            db.session.commit()
+            click.echo(f"dead 작업 재시도 예약: {count}건")
+        
+        if drain:
+            deleted, failed = s3_delete_queue.drain()
+            click.echo(f"삭제 큐 처리: 삭제 {deleted}건, 실패 {failed}건")
+        
+        counts = S3DeleteJob.count_by_status()
+        click.echo(f"삭제 큐 상태: pending {counts.get('pending', 0)}건, dead {counts.get('dead', 0)}건")
+    
+    @app.cli.command('s3-upload-lifecycle')
+    @click.option('--days', type=int, default=None, help='만료 일수 (없으면 S3_UPLOAD_EXPIRATION_DAYS)')
+    def s3_upload_lifecycle_command(days):
+        """직접 업로드 경로에 만료 수명 주기 규칙 설정"""
+        from flask import current_app
+        from app.utils.s3_uploader import S3Uploader
+        
+        config = current_app.config
+        prefix = f"{config.get('S3_UPLOAD_FOLDER', 'uploads')}/"
+        days = days or config.get('S3_UPLOAD_EXPIRATION_DAYS', 1)
+        S3Uploader.put_upload_lifecycle_rule(prefix, days)
+        click.echo(f"업로드 수명 주기 규칙 설정: {prefix} {days}일 후 만료")
+    
+    @app.cli.command('like-counts')
+    @click.option('--replay', is_flag=True, help='종료된 워커가 남긴 저널의 미반영 증감분 반영')
+    @click.option('--recount', is_flag=True, help='모든 음악의 좋아요 수를 like_tb 기준으로 다시 계산 (점검 시간에 실행)')
+    def like_counts_command(replay, recount):
+        """좋아요 수 버퍼 저널 복구 및 재계산"""
+        from app import db
+        from app.models.music import Music
+        from app.utils.like_count_buffer import like_count_buffer
+        
+        if replay:
+            click.echo(f"저널 복구: 배치 {like_count_buffer.replay()}건")
+        
+        if recount:
+            music_ids = [row.id for row in db.session.query(Music.id)]
+            Music.recount_like_counts(music_ids)
+            db.session.commit()
+            click.echo(f"좋아요 수 재계산: 음악 {len(music_ids)}건")
@@ -26,6 +26,11 @@ class Config:
     GOOGLE_REDIRECT_URI = os.environ.get('GOOGLE_REDIRECT_URI')
     GOOGLE_GRANT_TYPE = os.environ.get('GOOGLE_GRANT_TYPE', 'authorization_code')
     
+    # 구글 ID 토큰 서명 공개키 (응답 max-age 동안 캐시, 모르는 kid는 최소 간격 후 재조회)
+    GOOGLE_JWKS_URL = os.environ.get('GOOGLE_JWKS_URL', 'https://www.googleapis.com/oauth2/v3/certs')
+    GOOGLE_JWKS_MIN_REFRESH_SECONDS = 60
+    GOOGLE_JWKS_DEFAULT_MAX_AGE = 3600
+    
     # AI 서버 URL
     AI_SERVER_URL = os.environ.get('AI_SERVER_URL')
     
@@ -34,6 +39,25 @@ class Config:
     S3_BUCKET_NAME = os.environ.get('S3_BUCKET_NAME')
     AWS_ACCESS_KEY = os.environ.get('AWS_ACCESS_KEY')
     AWS_SECRET_KEY = os.environ.get('AWS_SECRET_KEY')
+    AWS_REGION = os.environ.get('AWS_REGION', 'ap-northeast-2')
+    S3_ENDPOINT_URL = os.environ.get('S3_ENDPOINT_URL')  # 로컬 S3 호환 서버 사용 시
+    
+    # S3 연결 풀과 멀티파트 업로드 설정
+    S3_MAX_POOL_CONNECTIONS = int(os.environ.get('S3_MAX_POOL_CONNECTIONS', 32))
+    S3_MULTIPART_THRESHOLD_MB = 8
+    S3_MULTIPART_CHUNKSIZE_MB = 8
+    S3_MAX_CONCURRENCY = int(os.environ.get('S3_MAX_CONCURRENCY', 8))
+    
+    # 클라이언트 직접 업로드용 presigned URL 설정
+    S3_UPLOAD_FOLDER = 'uploads'
+    S3_UPLOAD_URL_EXPIRES_SECONDS = int(os.environ.get('S3_UPLOAD_URL_EXPIRES_SECONDS', 600))
+    S3_MEDIA_URL_EXPIRES_SECONDS = int(os.environ.get('S3_MEDIA_URL_EXPIRES_SECONDS', 3600))  # AI 서버가 읽어 갈 GET URL
+    # 음악 생성에 쓰이지 않은 업로드 객체의 만료 일수 (flask s3-upload-lifecycle로 버킷에 적용)
+    S3_UPLOAD_EXPIRATION_DAYS = int(os.environ.get('S3_UPLOAD_EXPIRATION_DAYS', 1))
+    
+    # 내용 주소(SHA-256) 업로드 - 같은 내용의 파일은 다시 올리지 않고 기존 URL 반환
+    S3_CONTENT_ADDRESSED_UPLOADS = os.environ.get('S3_CONTENT_ADDRESSED_UPLOADS', 'False').lower() in ('true', '1', 't')
+    S3_DIGEST_INDEX_TTL_SECONDS = 3600  # 다른 워커에서 삭제된 객체가 반영되기까지의 최대 시간
     
     # 파일 업로드 설정
     MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB (동영상 때문에 증가)
@@ -51,6 +75,75 @@ class Config:
     IMAGE_UPLOAD_TIMEOUT = 30  # 30초
     VIDEO_UPLOAD_TIMEOUT = 120  # 2분
     
+    # 좋아요 수 write-behind 설정
+    LIKE_COUNT_WRITE_BEHIND = os.environ.get('LIKE_COUNT_WRITE_BEHIND', 'True').lower() in ('true', '1', 't')
+    LIKE_COUNT_FLUSH_INTERVAL_MS = int(os.environ.get('LIKE_COUNT_FLUSH_INTERVAL_MS', 500))
+    LIKE_COUNT_JOURNAL_DIR = os.environ.get('LIKE_COUNT_JOURNAL_DIR')  # 미설정 시 instance/like_count_journal
+    # 죽은 워커의 저널 복구와 최근 반영한 음악의 좋아요 수 재계산 주기 (0이면 끔, 한 호스트에서만 실행할 때 설정)
+    LIKE_COUNT_RECONCILE_SECONDS = int(os.environ.get('LIKE_COUNT_RECONCILE_SECONDS', 0))
+    
+    # 음악 일괄 조회 시 최대 ID 수
+    MUSIC_BATCH_MAX_IDS = 500
+    
+    # 워커별 메모리 색인(자동완성, 유사 음악, 프롬프트, 토큰 취소 필터)을 백그라운드 스레드에서 구성
+    # (끄면 처음 사용하는 요청에서 바로 구성)
+    PER_WORKER_INDEX_BACKGROUND = os.environ.get('PER_WORKER_INDEX_BACKGROUND', 'True').lower() in ('true', '1', 't')
+    
+    # 제목 자동완성 색인 재구성 주기 (좋아요 수 가중치 반영)
+    SUGGEST_INDEX_REFRESH_SECONDS = int(os.environ.get('SUGGEST_INDEX_REFRESH_SECONDS', 600))
+    
+    # 내용 기반 유사 음악 색인 재구성 주기 (IDF 갱신)
+    RELATED_INDEX_REFRESH_SECONDS = int(os.environ.get('RELATED_INDEX_REFRESH_SECONDS', 600))
+    
+    # 비슷한 프롬프트의 기존 음악 재사용 (Jaccard 유사도가 기준 이상이면 AI 서버 호출 생략)
+    PROMPT_REUSE_ENABLED = os.environ.get('PROMPT_REUSE_ENABLED', 'False').lower() in ('true', '1', 't')
+    PROMPT_REUSE_THRESHOLD = float(os.environ.get('PROMPT_REUSE_THRESHOLD', 0.8))
+    PROMPT_REUSE_REFRESH_SECONDS = int(os.environ.get('PROMPT_REUSE_REFRESH_SECONDS', 600))
+    
+    # 회원 식별 정보/프로필 캐시 (google_id -> 회원 ID, 워커별)
+    # 무효화는 변경한 워커에만 적용되므로 다른 워커는 이 시간 동안 이전 이름/프로필을 응답할 수 있음
+    MEMBER_IDENTITY_CACHE_SIZE = 10000
+    MEMBER_IDENTITY_CACHE_TTL_SECONDS = int(os.environ.get('MEMBER_IDENTITY_CACHE_TTL_SECONDS', 60))
+    
+    # 검증된 액세스 토큰 캐시 크기 (워커별, 토큰 만료 시각까지 보관)
+    VERIFIED_TOKEN_CACHE_SIZE = 10000
+    
+    # 토큰 취소 필터 재구성 주기 (다른 워커의 로그아웃 반영)와 만료 기록 정리 주기
+    REVOKED_TOKEN_REFRESH_SECONDS = int(os.environ.get('REVOKED_TOKEN_REFRESH_SECONDS', 30))
+    REVOKED_TOKEN_COMPACT_SECONDS = int(os.environ.get('REVOKED_TOKEN_COMPACT_SECONDS', 3600))
+    
+    # S3 객체 삭제 큐 (워커별 백그라운드 스레드가 DeleteObjects로 묶어 처리)
+    S3_DELETE_QUEUE_ENABLED = os.environ.get('S3_DELETE_QUEUE_ENABLED', 'True').lower() in ('true', '1', 't')
+    S3_DELETE_QUEUE_INTERVAL_SECONDS = int(os.environ.get('S3_DELETE_QUEUE_INTERVAL_SECONDS', 10))
+    S3_DELETE_MAX_ATTEMPTS = 8  # 이후 dead 상태로 남김
+    S3_DELETE_LEASE_SECONDS = 300  # 처리 중 작업을 다른 워커가 가져가지 않는 시간
+    
+    # 요청별 구간 소요 시간 (Server-Timing 응답 헤더, app.access 로거의 JSON 접근 로그)
+    # 헤더는 내부 구간 시간과 SQL 문장 수를 클라이언트에 노출하므로 개발/테스트 환경에서만 기본 사용
+    SERVER_TIMING_ENABLED = os.environ.get('SERVER_TIMING_ENABLED', 'False').lower() in ('true', '1', 't')
+    ACCESS_LOG_ENABLED = os.environ.get('ACCESS_LOG_ENABLED', 'True').lower() in ('true', '1', 't')
+    
+    # Prometheus 지표 (gunicorn 워커 간 합산은 PROMETHEUS_MULTIPROC_DIR 환경 변수 필요)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() in ('true', '1', 't')
+    METRICS_PATH = '/metrics'
+    # /metrics 접근 허용 주소/대역 (쉼표 구분)과 Bearer 토큰 (프록시 뒤에서는 토큰 사용)
+    METRICS_ALLOWED_IPS = [value.strip() for value in os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+                           if value.strip()]
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    
+    # 요청별 SQL 문장 수 집계 (같은 문장이 기준보다 많이 실행되면 N+1 의심 경고, X-Query-Count 헤더)
+    QUERY_COUNTER_ENABLED = os.environ.get('QUERY_COUNTER_ENABLED', 'False').lower() in ('true', '1', 't')
+    QUERY_REPEAT_THRESHOLD = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 3))
+    
+    # 요청별 프로파일링 (PROFILER_HEADER 헤더에 PROFILER_TOKEN을 담은 요청 또는 샘플링 비율만큼)
+    PROFILER_ENABLED = os.environ.get('PROFILER_ENABLED', 'False').lower() in ('true', '1', 't')
+    PROFILER_TOKEN = os.environ.get('PROFILER_TOKEN')  # 미설정 시 헤더로는 프로파일링하지 않음
+    PROFILER_HEADER = 'X-Profile'
+    PROFILER_SAMPLE_RATE = float(os.environ.get('PROFILER_SAMPLE_RATE', 0.0))
+    PROFILER_MODE = os.environ.get('PROFILER_MODE', 'sampling')  # sampling(.folded) 또는 cprofile(.prof)
+    PROFILER_INTERVAL_MS = int(os.environ.get('PROFILER_INTERVAL_MS', 5))  # 스택 샘플링 간격
+    PROFILER_DIR = os.environ.get('PROFILER_DIR')  # 미설정 시 instance/profiles
+    
     # 로깅 설정
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
@@ -58,6 +151,8 @@ class Config:
 class DevelopmentConfig(Config):
     DEBUG = True
     SQLALCHEMY_ECHO = True
+    QUERY_COUNTER_ENABLED = True
+    SERVER_TIMING_ENABLED = True
 
 
 class ProductionConfig(Config):
@@ -68,4 +163,9 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=3600)
\ No newline at end of file
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=3600)
+    LIKE_COUNT_WRITE_BEHIND = False
+    S3_DELETE_QUEUE_ENABLED = False
+    QUERY_COUNTER_ENABLED = True
+    SERVER_TIMING_ENABLED = True
+    PER_WORKER_INDEX_BACKGROUND = False
\ No newline at end of file
@@ -2,5 +2,9 @@ from app.models.member import Member
 from app.models.music import Music
 from app.models.mymusic import MyMusic
 from app.models.like import Like
+from app.models.similar_music import SimilarMusic
+from app.models.revoked_token import RevokedToken
+from app.models.s3_delete_job import S3DeleteJob
+from app.models.like_count_flush import LikeCountFlush
 
 # 이 파일은 모델 임포트를 한 곳에서 관리하기 위한 용도입니다.
\ No newline at end of file
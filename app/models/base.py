@@ -1,6 +1,114 @@
 from app import db
 from datetime import datetime
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, UniqueConstraint, event, select, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+import sqlite3
+
+# IN 절 하나에 넣는 최대 값 수 (긴 목록은 나누어 조회)
+IN_CLAUSE_CHUNK_SIZE = 200
+
+
+@event.listens_for(Engine, 'connect')
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite는 기본적으로 외래키를 검사하지 않으므로 연결마다 활성화"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+
+def chunked(values, size=IN_CLAUSE_CHUNK_SIZE):
+    """목록을 IN 절 크기 단위로 나누기"""
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def insert_ignore(model, rows):
+    """유니크 제약조건과 충돌하는 행은 건너뛰고 INSERT (DB 방언별, 커밋하지 않음)
+    
+    동시에 같은 행을 추가해도 한쪽만 추가된 것으로 집계됩니다 (IN 절 크기 단위로 나누어 실행).
+    - SQLite/PostgreSQL: INSERT ... ON CONFLICT DO NOTHING RETURNING (한 문장)
+    - MySQL: 유니크 키로 이미 있는 행을 SELECT ... FOR UPDATE로 잠금 조회한 뒤
+      여러 행 INSERT IGNORE 한 문장 (잠금 조회에 없던 행이 추가된 행)
+    - 그 외: 행마다 SAVEPOINT 안에서 INSERT, IntegrityError면 건너뜀
+    
+    MySQL의 INSERT IGNORE는 외래키 오류도 무시하므로
+    참조 대상의 존재 여부는 호출하는 쪽에서 확인해야 합니다.
+    
+    Args:
+        model: 대상 모델 클래스
+        rows: 추가할 행 딕셔너리 목록 (모든 행의 키가 같아야 함)
+    
+    Returns:
+        실제로 추가된 행 딕셔너리 목록
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+    
+    dialect = db.engine.dialect.name
+    table = model.__table__
+    
+    if dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        
+        keys = list(rows[0].keys())
+        inserted = []
+        for chunk in chunked(rows):
+            stmt = insert(table).values(chunk).on_conflict_do_nothing()\
+                                .returning(*[table.c[key] for key in keys])
+            returned = {tuple(row) for row in db.session.execute(stmt)}
+            inserted.extend(row for row in chunk if tuple(row[key] for key in keys) in returned)
+        return inserted
+    
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert
+        
+        key_columns = _unique_key_columns(table, rows[0].keys())
+        composite = len(key_columns) > 1
+        key_clause = tuple_(*key_columns) if composite else key_columns[0]
+        inserted = []
+        for chunk in chunked(rows):
+            keys = [tuple(row[column.name] for column in key_columns) for row in chunk]
+            # 이미 있는 행(과 없는 키의 간격)을 잠가 같은 키를 추가하려는 트랜잭션은 커밋까지 대기
+            existing = {tuple(row) for row in db.session.execute(
+                select(*key_columns)
+                .where(key_clause.in_(keys if composite else [key[0] for key in keys]))
+                .with_for_update()
+            )}
+            db.session.execute(insert(table).prefix_with('IGNORE').values(chunk))
+            for row, key in zip(chunk, keys):
+                if key not in existing:
+                    existing.add(key)
+                    inserted.append(row)
+        return inserted
+    
+    # ON CONFLICT 구문이 없는 DB는 행마다 SAVEPOINT로 충돌만 되돌림
+    inserted = []
+    for row in rows:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(table.insert(), row)
+        except IntegrityError:
+            continue
+        inserted.append(row)
+    return inserted
+
+
+def _unique_key_columns(table, keys):
+    # 행 딕셔너리의 키로 모두 채워지는 유니크 제약조건의 컬럼 (자동 증가 기본키 제외)
+    keys = set(keys)
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.columns.keys() and \
+                set(constraint.columns.keys()) <= keys:
+            return list(constraint.columns)
+    raise ValueError(f"{table.name}: 추가할 행의 컬럼으로 이루어진 유니크 제약조건이 없습니다.")
+
 
 class BaseModel:
     """모든 모델의 기본 클래스"""
@@ -1,4 +1,6 @@
 from app import db
+from sqlalchemy import func, select
+from app.models.base import insert_ignore, chunked
 from datetime import datetime
 
 class Like(db.Model):
@@ -11,8 +13,10 @@ class Like(db.Model):
     music_id = db.Column(db.Integer, db.ForeignKey('music_tb.id', ondelete='CASCADE'), nullable=False)
     
     # 유니크 제약조건 (한 사용자가 한 음악에 한 번만 좋아요 가능)
+    # music_id 단독 인덱스는 음악별 좋아요 수 집계용
     __table_args__ = (
         db.UniqueConstraint('member_id', 'music_id', name='unique_member_music'),
+        db.Index('ix_like_tb_music_id', 'music_id'),
     )
     
     def __init__(self, member_id, music_id):
@@ -32,6 +36,95 @@ class Like(db.Model):
         """회원 ID와 음악 ID로 좋아요 찾기"""
         return cls.query.filter_by(member_id=member_id, music_id=music_id).first()
     
+    @classmethod
+    def find_music_ids_by_member(cls, member_id, music_ids):
+        """회원이 좋아요한 음악 ID 집합 조회 (주어진 음악 ID 범위 내)"""
+        liked_ids = set()
+        for chunk in chunked(music_ids):
+            rows = db.session.query(cls.music_id).filter(
+                cls.member_id == member_id,
+                cls.music_id.in_(chunk)
+            ).all()
+            liked_ids.update(row.music_id for row in rows)
+        return liked_ids
+    
+    @classmethod
+    def count_by_music_ids(cls, music_ids):
+        """여러 음악의 좋아요 수를 한 번에 계산 (GROUP BY)
+        
+        Returns:
+            {음악 ID: 좋아요 수} 딕셔너리 (좋아요가 없으면 0)
+        """
+        counts = {music_id: 0 for music_id in music_ids}
+        for chunk in chunked(music_ids):
+            rows = db.session.query(cls.music_id, func.count(cls.id))\
+                             .filter(cls.music_id.in_(chunk))\
+                             .group_by(cls.music_id).all()
+            counts.update(dict(rows))
+        return counts
+    
+    @classmethod
+    def insert_if_absent(cls, member_id, music_id):
+        """좋아요를 단일 INSERT 문으로 추가 (유니크 제약조건 충돌 시 무시, 커밋하지 않음)
+        
+        Returns:
+            새로 추가되었으면 True, 이미 있었으면 False
+        """
+        return bool(insert_ignore(cls, [{'member_id': member_id, 'music_id': music_id}]))
+    
+    @classmethod
+    def delete_by_member_and_music(cls, member_id, music_id):
+        """좋아요를 단일 DELETE 문으로 삭제 (커밋하지 않음)
+        
+        Returns:
+            삭제되었으면 True, 좋아요가 없었으면 False
+        """
+        deleted = cls.query.filter_by(member_id=member_id, music_id=music_id)\
+                           .delete(synchronize_session=False)
+        return deleted == 1
+    
+    @classmethod
+    def bulk_insert_ignore(cls, member_id, music_ids):
+        """여러 음악에 대한 좋아요를 한 번에 추가 (이미 있는 좋아요는 무시, 커밋하지 않음)
+        
+        Returns:
+            이 문장으로 실제로 추가된 음악 ID 집합
+        """
+        rows = insert_ignore(cls, [{'member_id': member_id, 'music_id': music_id} for music_id in music_ids])
+        return {row['music_id'] for row in rows}
+    
+    @classmethod
+    def bulk_delete(cls, member_id, music_ids):
+        """여러 음악에 대한 좋아요를 한 번에 삭제 (커밋하지 않음)
+        
+        DELETE ... RETURNING을 지원하는 DB는 문장 결과로 판단하고, 그 외(MySQL)는 같은 조건의
+        SELECT ... FOR UPDATE로 삭제할 행을 잠금 조회한 뒤 DELETE 한 문장으로 삭제합니다
+        (IN 절 크기 단위로 나누어 실행).
+        
+        Returns:
+            이 문장으로 실제로 삭제된 음악 ID 집합
+        """
+        if not music_ids:
+            return set()
+        
+        table = cls.__table__
+        deleted = set()
+        for chunk in chunked(music_ids):
+            condition = (table.c.member_id == member_id, table.c.music_id.in_(chunk))
+            if db.engine.dialect.delete_returning:
+                rows = db.session.execute(table.delete().where(*condition).returning(table.c.music_id))
+                deleted.update(row.music_id for row in rows)
+                continue
+            
+            # 잠근 행은 다른 트랜잭션이 먼저 삭제할 수 없으므로 조회 결과가 삭제 결과
+            found = {row.music_id for row in db.session.execute(
+                select(table.c.music_id).where(*condition).with_for_update()
+            )}
+            if found:
+                db.session.execute(table.delete().where(*condition))
+            deleted.update(found)
+        return deleted
+    
     @classmethod
     def count_by_music(cls, music_id):
         """음악 ID별 좋아요 수 계산 (캐싱 개선)"""
@@ -0,0 +1,45 @@
+from app import db
+from app.models.base import insert_ignore
+from datetime import datetime
+
+class LikeCountFlush(db.Model):
+    """좋아요 수 버퍼의 반영 완료 표시 (저널 배치별 한 행)
+    
+    반영과 같은 트랜잭션에서 기록하므로, 같은 저널 배치를 워커의 반영과 저널 복구가
+    모두 처리하더라도 좋아요 수에는 한 번만 더해집니다.
+    """
+    __tablename__ = 'like_count_flush_tb'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    journal_id = db.Column(db.String(64), nullable=False)
+    seq = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        db.UniqueConstraint('journal_id', 'seq', name='unique_journal_seq'),
+    )
+    
+    def __init__(self, journal_id, seq):
+        self.journal_id = journal_id
+        self.seq = seq
+    
+    @classmethod
+    def claim(cls, journal_id, seq):
+        """배치 반영 표시 (커밋하지 않음)
+        
+        Returns:
+            처음 표시했으면 True (증감분을 반영해야 함), 이미 반영된 배치면 False
+        """
+        return bool(insert_ignore(cls, [{'journal_id': journal_id, 'seq': seq,
+                                         'created_at': datetime.utcnow()}]))
+    
+    @classmethod
+    def delete_before(cls, journal_id, seq):
+        """저널 파일까지 정리된 이전 배치의 표시 삭제 (커밋하지 않음)"""
+        return cls.query.filter(cls.journal_id == journal_id, cls.seq < seq)\
+                        .delete(synchronize_session=False)
+    
+    @classmethod
+    def delete_journal(cls, journal_id):
+        """복구를 마친 저널의 표시 삭제 (커밋하지 않음)"""
+        return cls.query.filter(cls.journal_id == journal_id).delete(synchronize_session=False)
@@ -1,5 +1,11 @@
 from app import db
 from app.models.base import BaseModel
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+
+# 구글 계정에 이름이 없을 때 새 회원에게 붙이는 이름
+DEFAULT_MEMBER_NAME = '사용자'
 
 class Member(db.Model, BaseModel):
     __tablename__ = 'member_tb'
@@ -34,4 +40,79 @@ class Member(db.Model, BaseModel):
     @classmethod
     def find_by_google_id(cls, google_id):
         """구글 ID로 멤버 찾기"""
-        return cls.query.filter_by(google_id=google_id).first()
\ No newline at end of file
+        return cls.query.filter_by(google_id=google_id).first()
+    
+    @classmethod
+    def upsert_by_google_id(cls, google_id, name, default_name=DEFAULT_MEMBER_NAME):
+        """구글 ID로 회원 생성 또는 이름 갱신 (한 문장, 커밋하지 않음)
+        
+        동시에 같은 구글 계정으로 로그인해도 유니크 제약조건 충돌 없이
+        한 번의 왕복으로 회원 ID를 얻습니다. 이름이 바뀐 경우에만 updated_at을 갱신합니다.
+        
+        Args:
+            google_id: 구글 계정 ID
+            name: 구글 계정 이름 (없으면 None - 기존 회원의 이름은 그대로 둠)
+            default_name: name이 없을 때 새 회원에게 붙이는 이름
+        
+        Returns:
+            (회원 ID, 구글 ID, 저장된 이름) 튜플
+        """
+        dialect = db.engine.dialect.name
+        table = cls.__table__
+        now = datetime.utcnow()
+        values = {'google_id': google_id, 'name': name or default_name, 'created_at': now, 'updated_at': now}
+        
+        # 기존 회원의 이름은 새 이름이 있을 때만 변경 (대체 이름으로 덮어쓰지 않음)
+        new_name = func.coalesce(literal(name, table.c.name.type), table.c.name)
+        updated_at = case((table.c.name != new_name, now), else_=table.c.updated_at)
+        
+        if dialect == 'mysql':
+            from sqlalchemy.dialects.mysql import insert
+            stmt = insert(table).values(**values)
+            # LAST_INSERT_ID(id)로 기존 행의 ID도 lastrowid로 받음 (MySQL은 SET 순서대로 적용)
+            stmt = stmt.on_duplicate_key_update([
+                ('id', func.last_insert_id(table.c.id)),
+                ('updated_at', updated_at),
+                ('name', new_name)
+            ])
+            member_id = db.session.execute(stmt).lastrowid
+            stored_name = db.session.execute(select(table.c.name).where(table.c.id == member_id)).scalar() \
+                if name is None else name
+            return member_id, google_id, stored_name
+        
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        elif dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            return cls._upsert_with_savepoint(google_id, name, values)
+        
+        stmt = insert(table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.google_id],
+            set_={'name': new_name, 'updated_at': updated_at}
+        ).returning(table.c.id, table.c.google_id, table.c.name)
+        row = db.session.execute(stmt).one()
+        return row.id, row.google_id, row.name
+    
+    @classmethod
+    def _upsert_with_savepoint(cls, google_id, name, values):
+        # 그 외 DB: 세이브포인트 안에서 INSERT하고, 이미 있으면 기존 행을 갱신
+        table = cls.__table__
+        try:
+            with db.session.begin_nested():
+                result = db.session.execute(table.insert().values(**values))
+            return result.inserted_primary_key[0], google_id, values['name']
+        except IntegrityError:
+            pass
+        
+        if name is not None:
+            db.session.execute(
+                table.update()
+                .where(table.c.google_id == google_id, table.c.name != name)
+                .values(name=name, updated_at=values['updated_at'])
+            )
+        row = db.session.execute(
+            select(table.c.id, table.c.google_id, table.c.name).where(table.c.google_id == google_id)
+        ).one()
+        return row.id, row.google_id, row.name
@@ -1,6 +1,36 @@
+import re
 from app import db
-from app.models.base import BaseModel
-from sqlalchemy import func, event
+from app.models.base import BaseModel, chunked
+from sqlalchemy import func, event, bindparam, text, select, DDL, inspect as sa_inspect
+
+# 검색 랭킹 - 관련도 점수에 더하는 최신성 가중치와 기준 기간(일)
+SEARCH_RECENCY_WEIGHT = 1.0
+SEARCH_RECENCY_DAYS = 30
+
+# SQLite FTS5 trigram 토크나이저는 3글자 미만 검색어를 색인으로 찾지 못함
+FTS_MIN_TOKEN_LENGTH = 3
+
+# 2글자 검색어는 제목 단어의 2글자 조각(bigram) 색인으로 검색
+BIGRAM_LENGTH = 2
+_BIGRAM_WORD = re.compile(r'[^\W_]+')
+
+# MySQL FULLTEXT ngram 파서의 토큰 길이 (ngram_token_size), 이보다 짧은 검색어는 색인으로 찾지 못함
+MYSQL_NGRAM_TOKEN_SIZE = 2
+
+# 색인을 쓸 수 없는 검색(1글자 검색어, 색인 미지원 DB)은 최근 음악 일부만 LIKE로 검색
+SEARCH_LIKE_SCAN_LIMIT = 5000
+
+
+def title_bigrams(title):
+    """제목을 단어별 2글자 조각으로 나눈 색인 문자열 (music_bigram_fts용)"""
+    bigrams = []
+    for word in _BIGRAM_WORD.findall((title or '').lower()):
+        for index in range(len(word) - BIGRAM_LENGTH + 1):
+            bigram = word[index:index + BIGRAM_LENGTH]
+            if bigram not in bigrams:
+                bigrams.append(bigram)
+    return ' '.join(bigrams)
+
 
 class Music(db.Model, BaseModel):
     __tablename__ = 'music_tb'
@@ -8,14 +38,27 @@ class Music(db.Model, BaseModel):
     id = db.Column(db.Integer, primary_key=True)
     music_url = db.Column(db.String(512), nullable=False)
     title = db.Column(db.String(255), nullable=False)
+    
+    # 텍스트 기반 생성 시 입력한 프롬프트 (내용 기반 유사 음악 색인용)
+    prompt = db.Column(db.String(1024), nullable=True)
+    
+    # 좋아요 수 (LikeCountBuffer가 일정 주기로 모아서 반영하는 비정규화 컬럼)
+    like_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    # 인덱스 (find_recent, find_popular 정렬용)
+    __table_args__ = (
+        db.Index('ix_music_tb_created_at', 'created_at'),
+        db.Index('ix_music_tb_like_count', 'like_count'),
+    )
 
     # Relationships
     likes = db.relationship('Like', backref='music', lazy=True, cascade="all, delete-orphan")
     # my_musics는 MyMusic 모델에서 backref로 설정됨
     
-    def __init__(self, music_url, title):
+    def __init__(self, music_url, title, prompt=None):
         self.music_url = music_url
         self.title = title
+        self.prompt = prompt
     
     def to_dict(self, include_like_count=False):
         """음악 객체를 딕셔너리로 변환"""
@@ -38,30 +81,188 @@ class Music(db.Model, BaseModel):
         """ID로 음악 찾기"""
         return cls.query.filter_by(id=music_id).first()
     
+    @classmethod
+    def find_by_ids(cls, music_ids):
+        """여러 ID로 음악 조회 (IN 절, 긴 목록은 나누어 조회)
+        
+        Returns:
+            {음악 ID: Music 객체} 딕셔너리
+        """
+        musics = {}
+        for chunk in chunked(music_ids):
+            for music in cls.query.filter(cls.id.in_(chunk)).all():
+                musics[music.id] = music
+        return musics
+    
+    @classmethod
+    def find_existing_ids(cls, music_ids):
+        """주어진 음악 ID 중 실제로 존재하는 ID 집합 조회"""
+        if not music_ids:
+            return set()
+        rows = db.session.query(cls.id).filter(cls.id.in_(music_ids)).all()
+        return {row.id for row in rows}
+    
+    @classmethod
+    def is_url_referenced(cls, music_url, exclude_music_id=None):
+        """음원 URL을 참조하는 음악이 있는지 확인 (내용 주소 객체 공유 확인용)
+        
+        Args:
+            music_url: 음원 URL
+            exclude_music_id: 확인에서 제외할 음악 ID (삭제 중인 음악)
+        """
+        query = db.session.query(cls.id).filter(cls.music_url == music_url)
+        if exclude_music_id is not None:
+            query = query.filter(cls.id != exclude_music_id)
+        return query.first() is not None
+    
     @classmethod
     def find_recent(cls, limit=10):
         """최근 음악 목록 조회"""
         return cls.query.order_by(cls.created_at.desc()).limit(limit).all()
     
+    @classmethod
+    def search(cls, query, limit=20):
+        """제목 전문 검색 (관련도 + 최신성 순)
+        
+        SQLite는 FTS5(3글자 이상은 trigram, 2글자는 bigram), MySQL은 FULLTEXT(ngram)
+        색인을 사용하고, 색인으로 찾지 못하는 1글자 검색어는 색인 결과를 LIKE로 거릅니다.
+        1글자 검색어만 있거나 그 외 DB는 최근 SEARCH_LIKE_SCAN_LIMIT개 음악만 LIKE로 검색합니다.
+        
+        Args:
+            query: 검색어
+            limit: 조회할 최대 항목 수
+        
+        Returns:
+            Music 객체 목록
+        """
+        tokens = query.split()
+        if not tokens:
+            return []
+        
+        dialect = db.engine.dialect.name
+        ngram_tokens = [token for token in tokens if len(token) >= MYSQL_NGRAM_TOKEN_SIZE]
+        
+        if dialect == 'mysql' and ngram_tokens:
+            params = {
+                'query': ' '.join(ngram_tokens),
+                'recency_weight': SEARCH_RECENCY_WEIGHT,
+                'recency_days': SEARCH_RECENCY_DAYS,
+                'limit': limit
+            }
+            conditions = ['MATCH(title) AGAINST (:query IN NATURAL LANGUAGE MODE)']
+            for index, token in enumerate(token for token in tokens if len(token) < MYSQL_NGRAM_TOKEN_SIZE):
+                # MySQL LIKE의 기본 이스케이프 문자가 백슬래시
+                conditions.append(f'title LIKE :like_{index}')
+                params[f'like_{index}'] = f'%{cls._escape_like(token)}%'
+            
+            statement = text(
+                'SELECT music_tb.* FROM music_tb '
+                f"WHERE {' AND '.join(conditions)} "
+                'ORDER BY MATCH(title) AGAINST (:query IN NATURAL LANGUAGE MODE) '
+                '+ :recency_weight / (1 + DATEDIFF(NOW(), created_at) / :recency_days) DESC '
+                'LIMIT :limit'
+            )
+            return db.session.query(cls).from_statement(statement).params(**params).all()
+        
+        long_tokens = [token for token in tokens if len(token) >= FTS_MIN_TOKEN_LENGTH]
+        bigram_tokens = [token.lower() for token in tokens
+                         if len(token) == BIGRAM_LENGTH and _BIGRAM_WORD.fullmatch(token)]
+        short_tokens = [token for token in tokens
+                        if len(token) < FTS_MIN_TOKEN_LENGTH and token.lower() not in bigram_tokens]
+        
+        if dialect == 'sqlite' and (long_tokens or bigram_tokens):
+            params = {
+                'recency_weight': SEARCH_RECENCY_WEIGHT,
+                'recency_days': SEARCH_RECENCY_DAYS,
+                'limit': limit
+            }
+            # 3글자 이상 검색어가 있으면 trigram 색인, 없으면 bigram 색인을 기준 테이블로 사용
+            fts_table = 'music_fts' if long_tokens else 'music_bigram_fts'
+            conditions = []
+            if long_tokens:
+                # 각 토큰을 구문(phrase)으로 감싸 FTS 문법 문자를 무력화
+                params['match'] = ' '.join('"' + token.replace('"', '""') + '"' for token in long_tokens)
+                conditions.append('music_fts MATCH :match')
+            if bigram_tokens:
+                # bigram 토큰은 문자/숫자로만 이루어져 있어 따옴표 이스케이프가 필요 없음
+                params['bigram_match'] = ' '.join(f'"{token}"' for token in bigram_tokens)
+                if long_tokens:
+                    conditions.append('music_tb.id IN (SELECT rowid FROM music_bigram_fts '
+                                      'WHERE music_bigram_fts MATCH :bigram_match)')
+                else:
+                    conditions.append('music_bigram_fts MATCH :bigram_match')
+            for index, token in enumerate(short_tokens):
+                conditions.append(f"music_tb.title LIKE :like_{index} ESCAPE '\\'")
+                params[f'like_{index}'] = f'%{cls._escape_like(token)}%'
+            
+            statement = text(
+                f'SELECT music_tb.* FROM {fts_table} '
+                f'JOIN music_tb ON music_tb.id = {fts_table}.rowid '
+                f"WHERE {' AND '.join(conditions)} "
+                f'ORDER BY -bm25({fts_table}) '
+                "+ :recency_weight / (1 + (julianday('now') - julianday(music_tb.created_at)) / :recency_days) DESC "
+                'LIMIT :limit'
+            )
+            return db.session.query(cls).from_statement(statement).params(**params).all()
+        
+        # 색인을 쓸 수 없는 검색어는 최근 SEARCH_LIKE_SCAN_LIMIT개 음악만 LIKE 검색 (최신순)
+        recent_ids = select(cls.id).order_by(cls.created_at.desc())\
+                                   .limit(SEARCH_LIKE_SCAN_LIMIT).subquery()
+        filters = [cls.title.like(f'%{cls._escape_like(token)}%', escape='\\') for token in tokens]
+        return cls.query.filter(cls.id.in_(select(recent_ids.c.id)), *filters)\
+                        .order_by(cls.created_at.desc()).limit(limit).all()
+    
+    @staticmethod
+    def _escape_like(value):
+        """LIKE 패턴의 와일드카드 문자 이스케이프"""
+        return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    
     @classmethod
     def find_popular(cls, limit=10):
-        """인기 음악 목록 조회 (좋아요 많은 순)"""
-        from app.models.like import Like
+        """인기 음악 목록 조회 (좋아요 많은 순, 비정규화된 like_count 기준)"""
+        return cls.query.filter(cls.like_count > 0)\
+                        .order_by(cls.like_count.desc()).limit(limit).all()
+    
+    @classmethod
+    def increment_like_counts(cls, deltas):
+        """음악별 좋아요 수 증감분을 한 번에 반영 (커밋하지 않음)
         
-        subquery = db.session.query(
-            Like.music_id, 
-            func.count(Like.id).label('like_count')
-        ).group_by(Like.music_id).subquery()
+        Args:
+            deltas: {음악 ID: 증감분} 딕셔너리
+        """
+        # updated_at은 좋아요 수 변경으로 갱신하지 않음
+        params = [{'music_id': music_id, 'delta': delta}
+                  for music_id, delta in deltas.items() if delta]
+        if not params:
+            return
+        db.session.execute(
+            cls.__table__.update()
+            .where(cls.__table__.c.id == bindparam('music_id'))
+            .values(like_count=cls.__table__.c.like_count + bindparam('delta'),
+                    updated_at=cls.__table__.c.updated_at),
+            params
+        )
+    
+    @classmethod
+    def recount_like_counts(cls, music_ids):
+        """like_tb 기준으로 좋아요 수를 다시 계산 (커밋하지 않음)"""
+        from app.models.like import Like
         
-        return db.session.query(cls).join(
-            subquery, 
-            cls.id == subquery.c.music_id
-        ).order_by(
-            subquery.c.like_count.desc()
-        ).limit(limit).all()
+        if not music_ids:
+            return
+        like_count = db.session.query(func.count(Like.id))\
+                               .filter(Like.music_id == cls.id)\
+                               .scalar_subquery()
+        for chunk in chunked(music_ids):
+            cls.query.filter(cls.id.in_(chunk))\
+                     .update({cls.like_count: like_count, cls.updated_at: cls.updated_at},
+                             synchronize_session=False)
 
     def delete_cascade(self):
-        """Music 삭제 시 관련된 MyMusic도 삭제"""
+        """Music 삭제 시 관련된 MyMusic도 삭제
+        
+        세션에 함께 쌓인 변경(S3 삭제 큐 기록 등)과 한 번에 커밋합니다.
+        """
         from app.models.mymusic import MyMusic
         
         # MyMusic 레코드들을 먼저 삭제
@@ -81,4 +282,70 @@ def delete_related_mymusics(mapper, connection, target):
     # 직접 SQL을 실행하여 관련 MyMusic 레코드들 삭제
     connection.execute(
         MyMusic.__table__.delete().where(MyMusic.music_id == target.id)
-    )
\ No newline at end of file
+    )
+
+
+# 제목 전문 검색 색인 - SQLite는 외부 콘텐츠 FTS5 테이블을 트리거로 동기화,
+# MySQL은 ngram 파서를 사용하는 FULLTEXT 색인 (한국어는 공백 단위 토큰화가 맞지 않음)
+for statement in (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS music_fts USING fts5("
+    "title, content='music_tb', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS music_fts_ai AFTER INSERT ON music_tb BEGIN "
+    "INSERT INTO music_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER IF NOT EXISTS music_fts_ad AFTER DELETE ON music_tb BEGIN "
+    "INSERT INTO music_fts(music_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER IF NOT EXISTS music_fts_au AFTER UPDATE OF title ON music_tb BEGIN "
+    "INSERT INTO music_fts(music_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO music_fts(rowid, title) VALUES (new.id, new.title); END",
+):
+    event.listen(Music.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+
+event.listen(
+    Music.__table__, 'after_drop',
+    DDL('DROP TABLE IF EXISTS music_fts').execute_if(dialect='sqlite')
+)
+
+# 2글자 검색어 색인 - SQLite trigram 색인은 3글자 미만을 찾지 못하므로
+# 제목의 2글자 조각을 별도 FTS5 테이블에 저장 (ORM 이벤트로 동기화)
+event.listen(
+    Music.__table__, 'after_create',
+    DDL("CREATE VIRTUAL TABLE IF NOT EXISTS music_bigram_fts USING fts5("
+        "bigrams, tokenize='unicode61')").execute_if(dialect='sqlite')
+)
+event.listen(
+    Music.__table__, 'after_drop',
+    DDL('DROP TABLE IF EXISTS music_bigram_fts').execute_if(dialect='sqlite')
+)
+
+
+def _index_title_bigrams(connection, target):
+    connection.execute(text('DELETE FROM music_bigram_fts WHERE rowid = :id'), {'id': target.id})
+    connection.execute(
+        text('INSERT INTO music_bigram_fts(rowid, bigrams) VALUES (:id, :bigrams)'),
+        {'id': target.id, 'bigrams': title_bigrams(target.title)}
+    )
+
+
+@event.listens_for(Music, 'after_insert')
+def index_inserted_title(mapper, connection, target):
+    if connection.dialect.name == 'sqlite':
+        _index_title_bigrams(connection, target)
+
+
+@event.listens_for(Music, 'after_update')
+def index_updated_title(mapper, connection, target):
+    if connection.dialect.name == 'sqlite' and sa_inspect(target).attrs.title.history.has_changes():
+        _index_title_bigrams(connection, target)
+
+
+@event.listens_for(Music, 'after_delete')
+def unindex_deleted_title(mapper, connection, target):
+    if connection.dialect.name == 'sqlite':
+        connection.execute(text('DELETE FROM music_bigram_fts WHERE rowid = :id'), {'id': target.id})
+
+
+event.listen(
+    Music.__table__, 'after_create',
+    DDL('CREATE FULLTEXT INDEX ft_music_tb_title ON music_tb (title) WITH PARSER ngram')
+    .execute_if(dialect='mysql')
+)
\ No newline at end of file
@@ -10,6 +10,12 @@ class MyMusic(db.Model, BaseModel):
     music_id = db.Column(db.Integer, db.ForeignKey('music_tb.id', ondelete='CASCADE'), nullable=False)
     member_id = db.Column(db.Integer, db.ForeignKey('member_tb.id', ondelete='CASCADE'), nullable=False)
     
+    # 인덱스 (find_by_member_id 정렬, 음악/회원 조합 조회용)
+    __table_args__ = (
+        db.Index('ix_mymusic_tb_member_id_created_at', 'member_id', 'created_at'),
+        db.Index('ix_mymusic_tb_music_id_member_id', 'music_id', 'member_id'),
+    )
+    
     # Music 테이블과의 관계 설정
     music = db.relationship('Music', backref='my_musics', lazy=True)
     
@@ -33,7 +39,22 @@ class MyMusic(db.Model, BaseModel):
     def find_by_member_id(cls, member_id, limit=10):
         """회원 ID로 내 음악 목록 조회 (Music과 조인)"""
         return cls.query.join(cls.music).filter(cls.member_id == member_id)\
-                      .order_by(cls.created_at.desc()).limit(limit).all()
+                      .order_by(cls.created_at.desc(), cls.id.desc()).limit(limit).all()
+    
+    @classmethod
+    def stream_with_music_by_member_id(cls, member_id, batch_size=500):
+        """회원의 전체 내 음악을 Music과 함께 스트리밍 조회 (서버 측 커서 사용)
+        
+        Returns:
+            (music_id, music_url, title, created_at) 행 이터레이터
+        """
+        from app.models.music import Music
+        
+        return db.session.query(Music.id.label('music_id'), Music.music_url, Music.title, cls.created_at)\
+                         .join(Music, cls.music_id == Music.id)\
+                         .filter(cls.member_id == member_id)\
+                         .order_by(cls.created_at.desc(), cls.id.desc())\
+                         .execution_options(yield_per=batch_size)
     
     @classmethod
     def find_by_id_and_member_id(cls, id, member_id):
@@ -47,6 +68,5 @@ class MyMusic(db.Model, BaseModel):
     
     @classmethod
     def delete_by_music_id(cls, music_id):
-        """특정 음악 ID의 모든 MyMusic 레코드 삭제"""
-        cls.query.filter_by(music_id=music_id).delete()
-        db.session.commit()
\ No newline at end of file
+        """특정 음악 ID의 모든 MyMusic 레코드 삭제 (커밋하지 않음)"""
+        cls.query.filter_by(music_id=music_id).delete()
\ No newline at end of file
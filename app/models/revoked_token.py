@@ -0,0 +1,49 @@
+from app import db
+from app.models.base import insert_ignore
+from datetime import datetime
+
+class RevokedToken(db.Model):
+    __tablename__ = 'revoked_token_tb'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(64), unique=True, nullable=False)
+    
+    # 토큰 원래 만료 시각 (이후에는 검증 단계에서 거부되므로 삭제 가능)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # 인덱스 (만료된 항목 정리용)
+    __table_args__ = (
+        db.Index('ix_revoked_token_tb_expires_at', 'expires_at'),
+    )
+    
+    def __init__(self, jti, expires_at):
+        self.jti = jti
+        self.expires_at = expires_at
+    
+    @classmethod
+    def exists(cls, jti):
+        """취소된 토큰인지 확인"""
+        return db.session.query(cls.id).filter(cls.jti == jti).first() is not None
+    
+    @classmethod
+    def find_active_jtis(cls, now=None):
+        """만료되지 않은 취소 토큰 jti 목록 (스트리밍)"""
+        now = now or datetime.utcnow()
+        return (row.jti for row in db.session.query(cls.jti).filter(cls.expires_at > now)
+                                              .execution_options(yield_per=1000))
+    
+    @classmethod
+    def revoke(cls, jti, expires_at):
+        """토큰 취소 기록 (이미 있으면 무시, 커밋하지 않음)"""
+        insert_ignore(cls, [{'jti': jti, 'expires_at': expires_at, 'created_at': datetime.utcnow()}])
+    
+    @classmethod
+    def delete_expired(cls, now=None):
+        """만료된 취소 기록 삭제 (커밋하지 않음)
+        
+        Returns:
+            삭제된 행 수
+        """
+        now = now or datetime.utcnow()
+        return cls.query.filter(cls.expires_at <= now).delete(synchronize_session=False)
@@ -0,0 +1,115 @@
+from app import db
+from datetime import datetime, timedelta
+from sqlalchemy import update
+
+# 작업 상태 (dead: 재시도 횟수를 모두 소진하여 수동 확인이 필요한 작업)
+STATUS_PENDING = 'pending'
+STATUS_DEAD = 'dead'
+
+class S3DeleteJob(db.Model):
+    __tablename__ = 's3_delete_queue_tb'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    object_key = db.Column(db.String(1024), nullable=False)
+    status = db.Column(db.String(16), nullable=False, default=STATUS_PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.String(1024), nullable=True)
+    
+    # 다음 처리 가능 시각 (재시도 대기 및 처리 중 임대 만료 시각)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # 인덱스 (처리할 작업 조회용)
+    __table_args__ = (
+        db.Index('ix_s3_delete_queue_tb_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
+    
+    def __init__(self, object_key):
+        self.object_key = object_key
+    
+    @classmethod
+    def enqueue(cls, object_keys):
+        """삭제할 객체 키 추가 (커밋하지 않으므로 호출한 쪽의 트랜잭션과 함께 반영)"""
+        now = datetime.utcnow()
+        rows = [
+            {'object_key': key, 'status': STATUS_PENDING, 'attempts': 0,
+             'next_attempt_at': now, 'created_at': now, 'updated_at': now}
+            for key in object_keys
+        ]
+        if rows:
+            db.session.execute(cls.__table__.insert(), rows)
+        return len(rows)
+    
+    @classmethod
+    def claim_due(cls, limit, lease_seconds, now=None):
+        """처리할 시각이 된 작업을 임대하여 조회 (커밋함)
+        
+        임대 시간 동안은 다른 워커가 같은 작업을 가져가지 않으며, 처리 중 프로세스가
+        죽으면 임대가 끝난 뒤 다시 처리됩니다. S3 삭제는 멱등이므로 드물게 두 워커가
+        같은 작업을 처리해도 안전합니다.
+        
+        Returns:
+            (작업 ID, 객체 키, 시도 횟수) 튜플 목록
+        """
+        now = now or datetime.utcnow()
+        rows = db.session.query(cls.id, cls.object_key, cls.attempts)\
+                         .filter(cls.status == STATUS_PENDING, cls.next_attempt_at <= now)\
+                         .order_by(cls.next_attempt_at, cls.id)\
+                         .limit(limit)\
+                         .all()
+        if rows:
+            db.session.execute(
+                update(cls)
+                .where(cls.id.in_([row.id for row in rows]))
+                .values(next_attempt_at=now + timedelta(seconds=lease_seconds))
+            )
+        db.session.commit()
+        return [(row.id, row.object_key, row.attempts) for row in rows]
+    
+    @classmethod
+    def complete(cls, job_ids):
+        """처리 완료된 작업 삭제 (커밋하지 않음)"""
+        if not job_ids:
+            return 0
+        return cls.query.filter(cls.id.in_(job_ids)).delete(synchronize_session=False)
+    
+    @classmethod
+    def fail(cls, job_id, attempts, error, retry_at, max_attempts):
+        """실패한 작업을 재시도 예약하거나 dead 처리 (커밋하지 않음)
+        
+        Args:
+            job_id: 작업 ID
+            attempts: 이번 시도를 포함한 시도 횟수
+            error: 오류 메시지
+            retry_at: 다음 재시도 시각
+            max_attempts: 최대 시도 횟수 (도달하면 dead)
+        """
+        db.session.execute(
+            update(cls)
+            .where(cls.id == job_id)
+            .values(
+                attempts=attempts,
+                last_error=str(error)[:1024],
+                next_attempt_at=retry_at,
+                status=STATUS_DEAD if attempts >= max_attempts else STATUS_PENDING,
+                updated_at=datetime.utcnow()
+            )
+        )
+    
+    @classmethod
+    def count_by_status(cls):
+        """상태별 작업 수"""
+        return dict(db.session.query(cls.status, db.func.count(cls.id)).group_by(cls.status).all())
+    
+    @classmethod
+    def retry_dead(cls):
+        """dead 작업을 다시 처리 대기 상태로 전환 (커밋하지 않음)
+        
+        Returns:
+            전환된 작업 수
+        """
+        return cls.query.filter(cls.status == STATUS_DEAD)\
+                        .update({'status': STATUS_PENDING, 'attempts': 0,
+                                 'next_attempt_at': datetime.utcnow()},
+                                synchronize_session=False)
@@ -0,0 +1,69 @@
+from app import db
+
+class SimilarMusic(db.Model):
+    __tablename__ = 'similar_music_tb'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # 외래키
+    music_id = db.Column(db.Integer, db.ForeignKey('music_tb.id', ondelete='CASCADE'), nullable=False)
+    similar_music_id = db.Column(db.Integer, db.ForeignKey('music_tb.id', ondelete='CASCADE'), nullable=False)
+    
+    # 유사도 (함께 좋아요한 회원 수 기반 코사인 유사도)와 순위
+    score = db.Column(db.Float, nullable=False)
+    rank = db.Column(db.Integer, nullable=False)
+    
+    # 음악별 유사 음악을 순위대로 한 번에 조회하기 위한 인덱스
+    __table_args__ = (
+        db.UniqueConstraint('music_id', 'rank', name='unique_music_rank'),
+    )
+    
+    def __init__(self, music_id, similar_music_id, score, rank):
+        self.music_id = music_id
+        self.similar_music_id = similar_music_id
+        self.score = score
+        self.rank = rank
+    
+    def to_dict(self):
+        """유사 음악 객체를 딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'music_id': self.music_id,
+            'similar_music_id': self.similar_music_id,
+            'score': self.score,
+            'rank': self.rank,
+        }
+    
+    @classmethod
+    def find_similar_musics(cls, music_id, limit=10):
+        """유사 음악 목록 조회 (Music과 조인, 순위순)
+        
+        Returns:
+            (Music 객체, 유사도) 튜플 목록
+        """
+        from app.models.music import Music
+        
+        return db.session.query(Music, cls.score)\
+                         .join(cls, cls.similar_music_id == Music.id)\
+                         .filter(cls.music_id == music_id)\
+                         .order_by(cls.rank).limit(limit).all()
+    
+    @classmethod
+    def replace_for_musics(cls, music_ids, rows):
+        """음악별 유사 음악 목록 교체 (커밋하지 않음)
+        
+        Args:
+            music_ids: 기존 목록을 지울 음악 ID 목록
+            rows: 새로 저장할 {'music_id', 'similar_music_id', 'score', 'rank'} 목록
+        """
+        from app.models.base import chunked
+        
+        for chunk in chunked(music_ids):
+            cls.query.filter(cls.music_id.in_(chunk)).delete(synchronize_session=False)
+        if rows:
+            db.session.execute(cls.__table__.insert(), rows)
+    
+    @classmethod
+    def delete_all(cls):
+        """전체 유사 음악 목록 삭제 (커밋하지 않음)"""
+        cls.query.delete(synchronize_session=False)
@@ -1,10 +1,10 @@
-from flask import Blueprint, request
+from flask import Blueprint, request, current_app
 from app.services.oauth_service import OAuthService
 from app.services.member_service import MemberService
 from app.utils.api_response import ApiResponse
 from app.schemas.member_schemas import OAuthTokenRequestSchema, TokenResponseSchema, MemberResponseSchema
 from app.utils.exceptions import ValidationException, UnauthorizedException, MemberNotFoundException
-from app.auth.token_auth import auth_required
+from app.auth.token_auth import auth_required, revoke_current_token
 import logging
 
 member_bp = Blueprint('member', __name__)
@@ -37,15 +37,20 @@ def oauth_login():
         elif request.method == 'POST':
             # 새로운 방식: 프론트엔드에서 사용자 정보 직접 전송
             data = request.get_json()
+            id_token = data.get('id_token')
             user_info = data.get('user_info')
             
-            if not user_info:
-                raise ValidationException("사용자 정보가 필요합니다.")
-            
-            logger.info(f"프론트엔드에서 사용자 정보 전송: {user_info.get('email')}")
-            
-            # 사용자 정보 직접 처리
-            response = OAuthService.process_google_login_direct(user_info)
+            if id_token:
+                # 구글 ID 토큰 전송 시 서명을 로컬에서 검증
+                response = OAuthService.process_google_id_token_login(id_token)
+            else:
+                if not user_info:
+                    raise ValidationException("사용자 정보가 필요합니다.")
+                
+                logger.info(f"프론트엔드에서 사용자 정보 전송: {user_info.get('email')}")
+                
+                # 사용자 정보 직접 처리
+                response = OAuthService.process_google_login_direct(user_info)
         
         # 응답 스키마 적용
         result = TokenResponseSchema().dump(response)
@@ -63,6 +68,27 @@ def oauth_login():
         logger.error(f"OAuth 로그인 오류: {str(e)}")
         return ApiResponse.error("로그인 처리 중 오류가 발생했습니다.", 500)
 
+@member_bp.route('/auth/logout', methods=['POST'])
+@auth_required
+def logout(user_info):
+    """로그아웃 (현재 액세스 토큰 취소)
+    
+    Returns:
+        성공 메시지
+    """
+    try:
+        revoke_current_token()
+        logger.info(f"로그아웃: 회원 ID {user_info.get('id')}")
+        
+        return ApiResponse.success(message="로그아웃되었습니다.")
+    
+    except UnauthorizedException as e:
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except Exception as e:
+        logger.error(f"로그아웃 오류: {str(e)}")
+        return ApiResponse.error("로그아웃 처리 중 오류가 발생했습니다.", 500)
+
 @member_bp.route('/me', methods=['GET'])
 @auth_required
 def get_member_profile(user_info):
@@ -74,13 +100,21 @@ def get_member_profile(user_info):
     try:
         logger.info(f"회원 프로필 조회: {user_info.get('id')}")
         
-        # ID로 회원 조회
+        # 토큰의 회원 ID로 캐시된 프로필 조회
         member_id = user_info.get('id')
-        member_data = MemberService.get_member_profile(member_id)
+        member_data, etag = MemberService.get_member_profile(member_id)
         
-        # 응답 스키마 적용
-        result = MemberResponseSchema().dump(member_data)
-        return ApiResponse.success(result)
+        # 프로필이 바뀌지 않았으면 본문 없이 응답
+        if request.if_none_match.contains(etag):
+            response = current_app.response_class(status=304)
+        else:
+            # 응답 스키마 적용
+            result = MemberResponseSchema().dump(member_data)
+            response, _ = ApiResponse.success(result)
+        
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
     
     except MemberNotFoundException as e:
         logger.warning(f"회원 프로필 조회 실패: {e.message}")
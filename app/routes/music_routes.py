@@ -1,12 +1,16 @@
-from flask import Blueprint, request
+from flask import Blueprint, request, current_app, Response, stream_with_context
 from app.services.music_service import MusicService
+from app.services.recommendation_service import RecommendationService
 from app.utils.api_response import ApiResponse
 from app.auth.token_auth import auth_required, optional_auth
+from app.utils.suggest_index import title_suggest_index
 from app.schemas.music_schemas import (
     MusicGenWithTextRequestSchema, MusicGenWithTextResponseSchema,
     MusicGenWithImageResponseSchema, MusicGenWithVideoResponseSchema,
     ImageUploadRequestSchema, VideoUploadRequestSchema, FileValidationUtils,
-    MusicResponseSchema, PlaylistResponseSchema, MyPlaylistResponseSchema
+    MusicResponseSchema, PlaylistResponseSchema, MyPlaylistResponseSchema,
+    LikeBatchRequestSchema, MusicSearchRequestSchema, MusicSuggestRequestSchema,
+    SimilarMusicRequestSchema, MediaUploadUrlRequestSchema, MusicGenWithObjectKeyRequestSchema
 )
 from app.utils.exceptions import (
     ValidationException, AIServerException, MemberNotFoundException,
@@ -152,6 +156,93 @@ def generate_music_with_video(user_info):
         logger.error(f"동영상 음악 생성 오류: {str(e)}")
         return ApiResponse.error("음악 생성 중 오류가 발생했습니다.", 500)
 
+@music_bp.route('/uploads/presigned', methods=['POST'])
+@auth_required
+def create_media_upload(user_info):
+    """이미지/동영상을 S3에 직접 업로드할 presigned URL 발급
+    
+    업로드 후 받은 objectKey로 /generate-music/upload를 호출하면
+    파일 본문이 API 서버를 거치지 않습니다. 객체 키는 회원별 경로로 발급합니다.
+    
+    Returns:
+        업로드 URL, 폼 필드/헤더, 객체 키
+    """
+    try:
+        # 입력 유효성 검사
+        schema = MediaUploadUrlRequestSchema()
+        data = request.get_json(silent=True) or {}
+        errors = schema.validate(data)
+        if errors:
+            raise ValidationException("입력 형식이 잘못되었습니다.", errors=errors)
+        
+        media_type = data.get('mediaType')
+        logger.info(f"미디어 업로드 URL 요청: {media_type}, {data.get('filename')}")
+        
+        # 서비스 호출
+        response = MusicService.create_media_upload(
+            media_type, data.get('filename'), data.get('contentType'), user_info, data.get('method', 'POST')
+        )
+        
+        return ApiResponse.success(response)
+    
+    except ValidationException as e:
+        logger.warning(f"미디어 업로드 URL 검증 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code, e.errors)
+    
+    except MemberNotFoundException as e:
+        logger.warning(f"회원 찾기 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except Exception as e:
+        logger.error(f"미디어 업로드 URL 발급 오류: {str(e)}")
+        return ApiResponse.error("업로드 URL 발급 중 오류가 발생했습니다.", 500)
+
+@music_bp.route('/generate-music/upload', methods=['POST'])
+@auth_required
+def generate_music_with_uploaded_media(user_info):
+    """S3에 직접 업로드한 이미지/동영상 기반 음악 생성 (본인이 업로드한 객체만 사용)
+    
+    Returns:
+        생성된 음악 정보
+    """
+    try:
+        # 입력 유효성 검사
+        schema = MusicGenWithObjectKeyRequestSchema()
+        data = request.get_json(silent=True) or {}
+        errors = schema.validate(data)
+        if errors:
+            raise ValidationException("입력 형식이 잘못되었습니다.", errors=errors)
+        
+        media_type = data.get('mediaType')
+        object_key = data.get('objectKey')
+        logger.info(f"업로드된 미디어 기반 음악 생성 요청: {media_type}, {object_key}")
+        
+        # 서비스 호출
+        response = MusicService.generate_music_with_uploaded_media(media_type, object_key, user_info)
+        
+        # 응답 스키마 적용
+        if media_type == 'video':
+            result = MusicGenWithVideoResponseSchema().dump(response)
+        else:
+            result = MusicGenWithImageResponseSchema().dump(response)
+        return ApiResponse.success(result)
+    
+    except ValidationException as e:
+        logger.warning(f"업로드 미디어 음악 생성 검증 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code, e.errors)
+    
+    except AIServerException as e:
+        logger.error(f"AI 서버 오류: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except MemberNotFoundException as e:
+        logger.warning(f"회원 찾기 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except Exception as e:
+        logger.error(f"업로드 미디어 음악 생성 오류: {str(e)}")
+        return ApiResponse.error("음악 생성 중 오류가 발생했습니다.", 500)
+
 @music_bp.route('/myplaylist', methods=['GET'])
 @auth_required
 def get_my_playlist(user_info):
@@ -177,6 +268,47 @@ def get_my_playlist(user_info):
         logger.error(f"내 플레이리스트 조회 오류: {str(e)}")
         return ApiResponse.error("플레이리스트 조회 중 오류가 발생했습니다.", 500)
 
+@music_bp.route('/myplaylist/export', methods=['GET'])
+@auth_required
+def export_my_playlist(user_info):
+    """내 플레이리스트 전체 내보내기 (?format=ndjson|csv)
+    
+    Returns:
+        스트리밍 NDJSON 또는 CSV 응답
+    """
+    try:
+        export_format = request.args.get('format', 'ndjson').lower()
+        if export_format not in ('ndjson', 'csv'):
+            raise ValidationException("지원하지 않는 형식입니다. 지원 형식: ndjson, csv")
+        
+        logger.info(f"내 플레이리스트 내보내기 요청: 사용자 ID {user_info.get('id')}")
+        
+        # 서비스 호출 (회원 확인 후 행 단위 제너레이터 반환)
+        lines = MusicService.export_my_playlist(user_info, export_format)
+        
+        if export_format == 'csv':
+            mimetype = 'text/csv'
+        else:
+            mimetype = 'application/x-ndjson'
+        
+        return Response(
+            stream_with_context(lines),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename=myplaylist.{export_format}'}
+        )
+    
+    except ValidationException as e:
+        logger.warning(f"내 플레이리스트 내보내기 검증 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except MemberNotFoundException as e:
+        logger.warning(f"회원 찾기 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except Exception as e:
+        logger.error(f"내 플레이리스트 내보내기 오류: {str(e)}")
+        return ApiResponse.error("플레이리스트 내보내기 중 오류가 발생했습니다.", 500)
+
 @music_bp.route('/myplaylist/<int:music_id>', methods=['DELETE'])
 @auth_required
 def delete_my_music(user_info, music_id):
@@ -281,6 +413,165 @@ def get_popular_playlist(user_info):
         logger.error(f"인기 플레이리스트 조회 오류: {str(e)}")
         return ApiResponse.error("인기 플레이리스트 조회 중 오류가 발생했습니다.", 500)
 
+@music_bp.route('/music', methods=['GET'])
+@optional_auth
+def get_musics_by_ids(user_info):
+    """여러 음악 일괄 조회 (?ids=1,2,3&includeLikes=true)
+    
+    Returns:
+        요청 순서대로 정렬된 음악 목록
+    """
+    try:
+        raw_ids = request.args.get('ids', '')
+        try:
+            music_ids = [int(value) for value in raw_ids.split(',') if value.strip()]
+        except ValueError:
+            raise ValidationException("음악 ID는 쉼표로 구분된 숫자여야 합니다.")
+        
+        if not music_ids:
+            raise ValidationException("음악 ID가 필요합니다.")
+        
+        max_ids = current_app.config.get('MUSIC_BATCH_MAX_IDS', 500)
+        if len(music_ids) > max_ids:
+            raise ValidationException(f"한 번에 최대 {max_ids}개까지 조회할 수 있습니다.")
+        
+        include_likes = request.args.get('includeLikes', 'false').lower() in ('true', '1')
+        logger.info(f"음악 일괄 조회 요청: {len(music_ids)}건")
+        
+        # 서비스 호출
+        response = MusicService.get_musics_by_ids(music_ids, user_info, include_likes)
+        
+        return ApiResponse.success(response)
+    
+    except ValidationException as e:
+        logger.warning(f"음악 일괄 조회 검증 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except Exception as e:
+        logger.error(f"음악 일괄 조회 오류: {str(e)}")
+        return ApiResponse.error("음악 조회 중 오류가 발생했습니다.", 500)
+
+@music_bp.route('/music/search', methods=['GET'])
+@optional_auth
+def search_music(user_info):
+    """음악 제목 검색
+    
+    Returns:
+        검색 결과 목록
+    """
+    try:
+        schema = MusicSearchRequestSchema()
+        errors = schema.validate(request.args)
+        if errors:
+            raise ValidationException("입력 형식이 잘못되었습니다.", errors=errors)
+        
+        query = request.args.get('q')
+        limit = request.args.get('limit', 20, type=int)
+        logger.info(f"음악 검색 요청: q='{query}'")
+        
+        # 서비스 호출
+        response = MusicService.search_music(query, user_info, limit)
+        
+        return ApiResponse.success(response)
+    
+    except ValidationException as e:
+        logger.warning(f"음악 검색 검증 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code, e.errors)
+    
+    except Exception as e:
+        logger.error(f"음악 검색 오류: {str(e)}")
+        return ApiResponse.error("음악 검색 중 오류가 발생했습니다.", 500)
+
+@music_bp.route('/music/suggest', methods=['GET'])
+def suggest_music_titles():
+    """음악 제목 자동완성
+    
+    Returns:
+        추천 제목 목록
+    """
+    try:
+        schema = MusicSuggestRequestSchema()
+        errors = schema.validate(request.args)
+        if errors:
+            raise ValidationException("입력 형식이 잘못되었습니다.", errors=errors)
+        
+        prefix = request.args.get('prefix')
+        limit = request.args.get('limit', 10, type=int)
+        
+        # 키 입력마다 호출되므로 DB 대신 메모리 색인에서 조회
+        suggestions = title_suggest_index.suggest(prefix, limit)
+        
+        return ApiResponse.success({
+            'suggestions': suggestions
+        })
+    
+    except ValidationException as e:
+        return ApiResponse.error(e.message, e.status_code, e.error_code, e.errors)
+    
+    except Exception as e:
+        logger.error(f"제목 자동완성 오류: {str(e)}")
+        return ApiResponse.error("자동완성 조회 중 오류가 발생했습니다.", 500)
+
+@music_bp.route('/music/<int:music_id>/similar', methods=['GET'])
+@optional_auth
+def get_similar_music(user_info, music_id):
+    """이 음악을 좋아한 사람들이 함께 좋아한 음악 조회
+    
+    Returns:
+        유사 음악 목록 (유사도 순)
+    """
+    try:
+        schema = SimilarMusicRequestSchema()
+        errors = schema.validate(request.args)
+        if errors:
+            raise ValidationException("입력 형식이 잘못되었습니다.", errors=errors)
+        
+        limit = request.args.get('limit', 10, type=int)
+        
+        # 서비스 호출 (미리 계산된 similar_music_tb에서 조회)
+        response = RecommendationService.get_similar_music(music_id, limit)
+        
+        return ApiResponse.success(response)
+    
+    except ValidationException as e:
+        return ApiResponse.error(e.message, e.status_code, e.error_code, e.errors)
+    
+    except Exception as e:
+        logger.error(f"유사 음악 조회 오류: {str(e)}")
+        return ApiResponse.error("유사 음악 조회 중 오류가 발생했습니다.", 500)
+
+@music_bp.route('/music/<int:music_id>/related', methods=['GET'])
+@optional_auth
+def get_related_music(user_info, music_id):
+    """제목/프롬프트 내용이 비슷한 음악 조회
+    
+    Returns:
+        유사 음악 목록 (유사도 순)
+    """
+    try:
+        schema = SimilarMusicRequestSchema()
+        errors = schema.validate(request.args)
+        if errors:
+            raise ValidationException("입력 형식이 잘못되었습니다.", errors=errors)
+        
+        limit = request.args.get('limit', 10, type=int)
+        
+        # 서비스 호출 (메모리 LSH 색인에서 조회)
+        response = RecommendationService.get_related_music(music_id, limit)
+        
+        return ApiResponse.success(response)
+    
+    except ValidationException as e:
+        return ApiResponse.error(e.message, e.status_code, e.error_code, e.errors)
+    
+    except MusicNotFoundException as e:
+        logger.warning(f"음악 찾기 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except Exception as e:
+        logger.error(f"유사 음악 조회 오류: {str(e)}")
+        return ApiResponse.error("유사 음악 조회 중 오류가 발생했습니다.", 500)
+
 @music_bp.route('/music/<int:music_id>/like', methods=['POST'])
 @auth_required
 def like_music(user_info, music_id):
@@ -345,4 +636,39 @@ def unlike_music(user_info, music_id):
     
     except Exception as e:
         logger.error(f"좋아요 취소 오류: {str(e)}")
-        return ApiResponse.error("좋아요 취소 중 오류가 발생했습니다.", 500)
\ No newline at end of file
+        return ApiResponse.error("좋아요 취소 중 오류가 발생했습니다.", 500)
+
+@music_bp.route('/music/likes/batch', methods=['POST'])
+@auth_required
+def batch_like_music(user_info):
+    """좋아요/좋아요 취소 일괄 처리
+    
+    Returns:
+        작업별 처리 결과
+    """
+    try:
+        schema = LikeBatchRequestSchema()
+        data = request.get_json(silent=True) or {}
+        errors = schema.validate(data)
+        if errors:
+            raise ValidationException("입력 형식이 잘못되었습니다.", errors=errors)
+        
+        operations = schema.load(data)['operations']
+        logger.info(f"좋아요 일괄 처리 요청: 사용자 ID {user_info.get('id')}, 작업 {len(operations)}건")
+        
+        # 서비스 호출
+        response = MusicService.batch_like_music(operations, user_info)
+        
+        return ApiResponse.success(response)
+    
+    except ValidationException as e:
+        logger.warning(f"좋아요 일괄 처리 검증 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code, e.errors)
+    
+    except MemberNotFoundException as e:
+        logger.warning(f"회원 찾기 실패: {e.message}")
+        return ApiResponse.error(e.message, e.status_code, e.error_code)
+    
+    except Exception as e:
+        logger.error(f"좋아요 일괄 처리 오류: {str(e)}")
+        return ApiResponse.error("좋아요 일괄 처리 중 오류가 발생했습니다.", 500)
\ No newline at end of file
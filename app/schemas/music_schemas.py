@@ -26,6 +26,25 @@ class MusicGenWithVideoResponseSchema(Schema):
     title = fields.String(required=True)
 
 
+class MediaUploadUrlRequestSchema(Schema):
+    """S3 직접 업로드 URL 발급 요청 스키마"""
+    mediaType = fields.String(required=True, validate=validate.OneOf(['image', 'video']),
+                              error_messages={'required': '미디어 종류가 필요합니다.'})
+    filename = fields.String(required=True, validate=validate.Length(min=1, max=255),
+                             error_messages={'required': '파일명이 필요합니다.'})
+    contentType = fields.String(required=True, validate=validate.Length(min=1, max=100),
+                                error_messages={'required': 'Content-Type이 필요합니다.'})
+    method = fields.String(required=False, validate=validate.OneOf(['POST', 'PUT']))
+
+
+class MusicGenWithObjectKeyRequestSchema(Schema):
+    """S3에 직접 업로드한 미디어 기반 음악 생성 요청 스키마"""
+    mediaType = fields.String(required=True, validate=validate.OneOf(['image', 'video']),
+                              error_messages={'required': '미디어 종류가 필요합니다.'})
+    objectKey = fields.String(required=True, validate=validate.Length(min=1, max=1024),
+                              error_messages={'required': '객체 키가 필요합니다.'})
+
+
 class ImageUploadRequestSchema(Schema):
     """이미지 업로드 요청 검증 스키마"""
     
@@ -105,6 +124,39 @@ class MyPlaylistResponseSchema(Schema):
     musicList = fields.List(fields.Nested(MusicResponseSchema), required=True)
 
 
+class MusicSearchRequestSchema(Schema):
+    """음악 검색 요청 스키마"""
+    q = fields.String(required=True, validate=validate.Length(min=1, max=100),
+                      error_messages={'required': '검색어가 필요합니다.'})
+    limit = fields.Integer(required=False, validate=validate.Range(min=1, max=50))
+
+
+class MusicSuggestRequestSchema(Schema):
+    """제목 자동완성 요청 스키마"""
+    prefix = fields.String(required=True, validate=validate.Length(min=1, max=100),
+                           error_messages={'required': '검색어가 필요합니다.'})
+    limit = fields.Integer(required=False, validate=validate.Range(min=1, max=20))
+
+
+class SimilarMusicRequestSchema(Schema):
+    """유사 음악 조회 요청 스키마"""
+    limit = fields.Integer(required=False, validate=validate.Range(min=1, max=20))
+
+
+class LikeOperationSchema(Schema):
+    """좋아요 일괄 처리 - 개별 작업 스키마"""
+    musicId = fields.Integer(required=True, error_messages={'required': '음악 ID가 필요합니다.'})
+    action = fields.String(required=True, validate=validate.OneOf(['like', 'unlike']),
+                           error_messages={'required': '작업 종류가 필요합니다.'})
+
+
+class LikeBatchRequestSchema(Schema):
+    """좋아요 일괄 처리 요청 스키마"""
+    operations = fields.List(fields.Nested(LikeOperationSchema), required=True,
+                             validate=validate.Length(min=1, max=500),
+                             error_messages={'required': '작업 목록이 필요합니다.'})
+
+
 # 파일 검증 유틸리티 함수들
 class FileValidationUtils:
     """파일 검증 유틸리티"""
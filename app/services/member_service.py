@@ -1,6 +1,7 @@
 from app import db
-from app.models.member import Member
+from app.models.member import Member, DEFAULT_MEMBER_NAME
 from app.auth.token_auth import generate_token
+from app.auth.identity import member_identity_cache, MemberIdentity
 from app.utils.exceptions import MemberNotFoundException
 import logging
 
@@ -59,18 +60,24 @@ class MemberService:
         google_id = user_info.get('id')
         name = user_info.get('name')
         
-        if not google_id or not name:
+        if not google_id:
             logger.error(f"회원 정보 부족: {user_info}")
             raise ValueError("유효하지 않은 사용자 정보입니다.")
         
-        member = MemberService.find_member_by_google_id(google_id)
-        
-        if not member:
-            # 새 회원 생성
-            member = MemberService.create_member(
-                google_id=google_id, 
-                name=name
+        try:
+            # 조회 후 생성 대신 한 문장으로 생성 또는 갱신 (동시 로그인에도 충돌 없음)
+            # 이름이 없으면 기존 회원은 저장된 이름을 유지하고, 새 회원만 이메일 등 대체 이름 사용
+            member_id, google_id, name = Member.upsert_by_google_id(
+                google_id, name, user_info.get('email') or DEFAULT_MEMBER_NAME
             )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"회원 조회/생성 실패: {str(e)}")
+            raise
+        
+        # 이후 요청에서 회원 조회 없이 사용하도록 식별 정보 캐시에 저장
+        member = member_identity_cache.prime(MemberIdentity(member_id, google_id, name))
         
         # 액세스 토큰 생성
         access_token = generate_token(member)
@@ -97,16 +104,25 @@ class MemberService:
     
     @staticmethod
     def get_member_profile(member_id):
-        """회원 프로필 조회
+        """회원 프로필 조회 (캐시된 프로필 사용, 없을 때만 DB 조회)
+        
+        다른 워커에서 바뀐 프로필은 MEMBER_IDENTITY_CACHE_TTL_SECONDS 안에 반영됩니다.
         
         Args:
             member_id: 회원 ID
             
         Returns:
-            회원 프로필 정보
+            (회원 프로필 정보, ETag) 튜플
             
         Raises:
             MemberNotFoundException: 회원을 찾을 수 없는 경우
         """
-        member = MemberService.get_member_by_id(member_id)
-        return member.to_dict()
\ No newline at end of file
+        profile = member_identity_cache.profile(member_id)
+        if not profile:
+            raise MemberNotFoundException(f"ID가 {member_id}인 회원을 찾을 수 없습니다.")
+        
+        # 프로필이 바뀌면 updated_at이 바뀌므로 버전으로 사용
+        version = profile.updated_at or profile.created_at
+        etag = f"{profile.id}-{version.strftime('%Y%m%d%H%M%S%f') if version else 0}"
+        
+        return profile._asdict(), etag
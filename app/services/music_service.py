@@ -2,11 +2,19 @@ from app import db
 from app.models.music import Music
 from app.models.mymusic import MyMusic
 from app.models.like import Like
-from app.models.member import Member
-from app.utils.exceptions import MusicNotFoundException, MemberNotFoundException, DuplicateDataException, AIServerException
+from app.utils.exceptions import MusicNotFoundException, MemberNotFoundException, DuplicateDataException, AIServerException, ValidationException
 from app.clients.ai_client import AIClient
+from app.auth.identity import member_identity_cache
+from app.utils.like_count_buffer import like_count_buffer
+from app.utils.prompt_index import prompt_minhash_index
+from app.utils.s3_uploader import S3Uploader
+from app.utils.s3_delete_queue import s3_delete_queue
 from sqlalchemy import func, desc
+from sqlalchemy.exc import IntegrityError
 from flask import current_app
+import csv
+import io
+import json
 import os
 import logging
 
@@ -32,30 +40,42 @@ class MusicService:
             MemberNotFoundException: 회원을 찾을 수 없는 경우
         """
         try:
-            # AI 서버 호출
-            ai_client = AIClient()
-            response = ai_client.generate_music_with_text(prompt1, prompt2)
-            
-            s3_url = response.get('music_url')
-            
-            if not s3_url:
-                raise AIServerException("음악 생성에 실패했습니다.")
-            
-            title = prompt1
-            if prompt2:
-                title = f"{prompt2}"
-            
-            # Music 테이블에 저장
-            music = Music(
-                music_url=s3_url, 
-                title=title
-            )
-            db.session.add(music)
-            db.session.flush()  # music.id를 얻기 위해 flush
+            prompt = ' '.join(p for p in (prompt1, prompt2) if p)
+            
+            # 비슷한 프롬프트로 생성된 음악이 있으면 AI 서버 호출 없이 재사용
+            music = MusicService._find_reusable_music(prompt)
+            reused = music is not None
+            
+            if reused:
+                s3_url = music.music_url
+                title = music.title
+            else:
+                # AI 서버 호출
+                ai_client = AIClient()
+                response = ai_client.generate_music_with_text(prompt1, prompt2)
+                
+                s3_url = response.get('music_url')
+                
+                if not s3_url:
+                    raise AIServerException("음악 생성에 실패했습니다.")
+                
+                title = prompt1
+                if prompt2:
+                    title = f"{prompt2}"
+                
+                # Music 테이블에 저장
+                music = Music(
+                    music_url=s3_url, 
+                    title=title,
+                    prompt=prompt
+                )
+                db.session.add(music)
+                db.session.flush()  # music.id를 얻기 위해 flush
+            music_id = music.id
             
             # 인증된 사용자라면 MyMusic에도 저장
             if user_info:
-                member = Member.find_by_google_id(user_info.get('google_id'))
+                member = member_identity_cache.resolve(user_info.get('google_id'))
                 if not member:
                     raise MemberNotFoundException()
                 
@@ -69,7 +89,10 @@ class MusicService:
                     db.session.add(my_music)
             
             db.session.commit()
-            logger.info(f"음악 생성 완료: {title}")
+            if reused:
+                logger.info(f"기존 음악 재사용: 음악 ID {music_id}")
+            else:
+                logger.info(f"음악 생성 완료: {title}")
             
             return {
                 'musicUrl': s3_url,
@@ -83,6 +106,34 @@ class MusicService:
                 raise
             raise AIServerException("음악 생성 중 오류가 발생했습니다.")
     
+    @staticmethod
+    def _find_reusable_music(prompt):
+        """비슷한 프롬프트로 이미 생성된 음악 조회
+        
+        PROMPT_REUSE_ENABLED일 때 프롬프트 MinHash 색인에서 가장 비슷한 프롬프트를 찾아
+        Jaccard 유사도가 PROMPT_REUSE_THRESHOLD 이상이면 해당 음악을 반환합니다.
+        기준값 조정을 위해 판단 결과와 유사도를 항상 로그로 남깁니다.
+        
+        Returns:
+            재사용할 Music 객체 (없으면 None)
+        """
+        if not current_app.config.get('PROMPT_REUSE_ENABLED'):
+            return None
+        
+        threshold = current_app.config.get('PROMPT_REUSE_THRESHOLD', 0.8)
+        music_id, similarity = prompt_minhash_index.find_similar(prompt)
+        reuse = music_id is not None and similarity >= threshold
+        logger.info(f"프롬프트 재사용 판단: reuse={reuse} similarity={similarity:.3f} "
+                    f"threshold={threshold} candidate={music_id} prompt='{prompt}'")
+        if not reuse:
+            return None
+        
+        music = Music.find_by_id(music_id)
+        if not music:
+            # 색인 재구성 전에 삭제된 음악
+            prompt_minhash_index.remove(music_id)
+        return music
+    
     @staticmethod
     def generate_music_with_image(image_file, user_info=None):
         """이미지 기반 음악 생성
@@ -119,7 +170,7 @@ class MusicService:
             
             # 인증된 사용자라면 MyMusic에도 저장
             if user_info:
-                member = Member.find_by_google_id(user_info.get('google_id'))
+                member = member_identity_cache.resolve(user_info.get('google_id'))
                 if not member:
                     raise MemberNotFoundException()
                 
@@ -183,7 +234,7 @@ class MusicService:
             
             # 인증된 사용자라면 MyMusic에도 저장
             if user_info:
-                member = Member.find_by_google_id(user_info.get('google_id'))
+                member = member_identity_cache.resolve(user_info.get('google_id'))
                 if not member:
                     raise MemberNotFoundException()
                 
@@ -211,6 +262,143 @@ class MusicService:
                 raise
             raise AIServerException("음악 생성 중 오류가 발생했습니다.")
     
+    @staticmethod
+    def create_media_upload(media_type, filename, content_type, user_info, method='POST'):
+        """이미지/동영상을 S3에 직접 업로드할 presigned URL 발급
+        
+        객체 키는 회원별 경로(uploads/{media_type}/{회원 ID}/)로 발급하며, 음악 생성에 쓰이지
+        않은 객체는 업로드 경로의 S3 수명 주기 규칙으로 정리됩니다 (flask s3-upload-lifecycle).
+        
+        Args:
+            media_type: 'image' 또는 'video'
+            filename: 업로드할 파일명
+            content_type: 업로드할 파일의 Content-Type
+            user_info: 사용자 정보
+            method: 'POST' 또는 'PUT'
+        
+        Returns:
+            업로드 정보 (url, fields/headers, objectKey, maxSize, expiresIn)
+        
+        Raises:
+            ValidationException: 지원하지 않는 파일 형식인 경우
+            MemberNotFoundException: 회원을 찾을 수 없는 경우
+        """
+        member = member_identity_cache.resolve(user_info.get('google_id'))
+        if not member:
+            raise MemberNotFoundException()
+        
+        extensions, max_size = MusicService._media_rules(media_type)
+        
+        extension = filename.rsplit('.', 1)[1].lower() if '.' in filename else None
+        if extension not in extensions:
+            raise ValidationException(f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(sorted(extensions))}")
+        if not content_type.lower().startswith(f"{media_type}/"):
+            raise ValidationException("파일 형식과 Content-Type이 일치하지 않습니다.")
+        
+        upload = S3Uploader.create_presigned_upload(
+            MusicService._media_folder(media_type, member.id), filename, content_type, max_size, method
+        )
+        upload['maxSize'] = max_size
+        return upload
+    
+    @staticmethod
+    def generate_music_with_uploaded_media(media_type, object_key, user_info):
+        """S3에 직접 업로드된 이미지/동영상 기반 음악 생성
+        
+        미디어 본문은 API 서버를 거치지 않고 AI 서버가 presigned GET URL로 직접 내려받습니다.
+        사용한 업로드 객체는 음악 저장과 같은 트랜잭션으로 S3 삭제 큐에 넣습니다.
+        
+        Args:
+            media_type: 'image' 또는 'video'
+            object_key: presigned 업로드로 올린 객체 키
+            user_info: 사용자 정보
+        
+        Returns:
+            생성된 음악 정보
+        
+        Raises:
+            ValidationException: 업로드된 객체가 없거나 조건에 맞지 않는 경우
+            AIServerException: AI 서버 처리 중 오류 발생 시
+            MemberNotFoundException: 회원을 찾을 수 없는 경우
+        """
+        member = member_identity_cache.resolve(user_info.get('google_id'))
+        if not member:
+            raise MemberNotFoundException()
+        
+        _, max_size = MusicService._media_rules(media_type)
+        
+        # 이 회원에게 presigned 업로드로 발급한 경로의 객체만 허용
+        if not object_key.startswith(f"{MusicService._media_folder(media_type, member.id)}/"):
+            raise ValidationException("유효하지 않은 객체 키입니다.")
+        
+        # PUT 업로드는 크기 조건이 서명되지 않으므로 사용 시점에 확인
+        metadata = S3Uploader.head_object(object_key)
+        if not metadata:
+            raise ValidationException("업로드된 파일을 찾을 수 없습니다.")
+        if metadata['size'] > max_size:
+            raise ValidationException(f"파일이 너무 큽니다. 최대 {max_size // (1024 * 1024)}MB까지 지원합니다.")
+        if not (metadata['content_type'] or '').lower().startswith(f"{media_type}/"):
+            raise ValidationException("파일 형식이 올바르지 않습니다.")
+        
+        try:
+            # AI 서버 호출 (파일 대신 presigned GET URL 전달)
+            ai_client = AIClient()
+            media_url = S3Uploader.create_presigned_download_url(object_key)
+            response = ai_client.generate_music_with_media_url(media_type, media_url, object_key)
+            
+            s3_url = response.get('music_url')
+            title = response.get('title')
+            
+            if not s3_url or not title:
+                raise AIServerException("음악 생성에 실패했습니다.")
+            
+            # Music 테이블에 저장
+            music = Music(
+                music_url=s3_url,
+                title=title
+            )
+            db.session.add(music)
+            db.session.flush()  # music.id를 얻기 위해 flush
+            
+            # MyMusic에도 저장
+            my_music = MyMusic(
+                music_id=music.id,
+                member_id=member.id
+            )
+            db.session.add(my_music)
+            
+            # AI 서버가 이미 내려받은 업로드 객체는 음악과 함께 커밋되도록 삭제 큐에 추가
+            s3_delete_queue.enqueue([object_key])
+            
+            db.session.commit()
+            s3_delete_queue.wakeup()
+            logger.info(f"업로드된 {media_type} 기반 음악 생성 완료: {title}")
+            
+            return {
+                'musicUrl': s3_url,
+                'title': title
+            }
+        
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"업로드된 {media_type} 기반 음악 생성 오류: {str(e)}")
+            if isinstance(e, (AIServerException, MemberNotFoundException)):
+                raise
+            raise AIServerException("음악 생성 중 오류가 발생했습니다.")
+    
+    @staticmethod
+    def _media_rules(media_type):
+        # 미디어 종류별 (허용 확장자, 최대 크기)
+        config = current_app.config
+        if media_type == 'video':
+            return config['ALLOWED_VIDEO_EXTENSIONS'], config['MAX_VIDEO_SIZE']
+        return config['ALLOWED_IMAGE_EXTENSIONS'], config['MAX_IMAGE_SIZE']
+    
+    @staticmethod
+    def _media_folder(media_type, member_id):
+        # 회원별 업로드 경로 (수명 주기 규칙은 S3_UPLOAD_FOLDER 전체에 적용)
+        return f"{current_app.config.get('S3_UPLOAD_FOLDER', 'uploads')}/{media_type}/{member_id}"
+    
     @staticmethod
     def get_my_playlist(user_info, limit=10):
         """내 플레이리스트 조회
@@ -228,7 +416,7 @@ class MusicService:
         if not user_info:
             raise MemberNotFoundException("인증되지 않은 사용자입니다.")
         
-        member = Member.find_by_google_id(user_info.get('google_id'))
+        member = member_identity_cache.resolve(user_info.get('google_id'))
         if not member:
             raise MemberNotFoundException("회원 정보를 찾을 수 없습니다.")
         
@@ -251,6 +439,60 @@ class MusicService:
             'musicList': music_list
         }
     
+    @staticmethod
+    def export_my_playlist(user_info, export_format='ndjson'):
+        """내 플레이리스트 전체 내보내기 (한 줄씩 생성하여 메모리 사용량 일정)
+        
+        Args:
+            user_info: 사용자 정보
+            export_format: 'ndjson' 또는 'csv'
+        
+        Returns:
+            응답 본문 문자열을 한 줄씩 생성하는 제너레이터
+        
+        Raises:
+            MemberNotFoundException: 회원을 찾을 수 없는 경우
+        """
+        if not user_info:
+            raise MemberNotFoundException("인증되지 않은 사용자입니다.")
+        
+        member = member_identity_cache.resolve(user_info.get('google_id'))
+        if not member:
+            raise MemberNotFoundException("회원 정보를 찾을 수 없습니다.")
+        
+        rows = MyMusic.stream_with_music_by_member_id(member.id)
+        
+        def generate_ndjson():
+            for row in rows:
+                yield json.dumps({
+                    'id': row.music_id,
+                    'musicUrl': row.music_url,
+                    'title': row.title,
+                    'createdAt': row.created_at.isoformat() if row.created_at else None
+                }, ensure_ascii=False) + '\n'
+        
+        def generate_csv():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(['id', 'musicUrl', 'title', 'createdAt'])
+            for row in rows:
+                writer.writerow([
+                    row.music_id,
+                    row.music_url,
+                    row.title,
+                    row.created_at.isoformat() if row.created_at else ''
+                ])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+            yield buffer.getvalue()
+        
+        logger.info(f"내 플레이리스트 내보내기: 회원 ID {member.id}, 형식 {export_format}")
+        
+        if export_format == 'csv':
+            return generate_csv()
+        return generate_ndjson()
+    
     @staticmethod
     def get_playlist(user_info=None, limit=5):
         """전체 플레이리스트 조회
@@ -272,24 +514,24 @@ class MusicService:
             
             # 인증된 사용자인 경우 회원 ID 조회
             if user_info:
-                member = Member.find_by_google_id(user_info.get('google_id'))
+                member = member_identity_cache.resolve(user_info.get('google_id'))
                 if member:
                     member_id = member.id
             
+            # 좋아요 수와 좋아요 여부는 음악별로 조회하지 않고 한 번에 조회
+            music_ids = [music.id for music in musics]
+            like_counts = Like.count_by_music_ids(music_ids) if music_ids else {}
+            liked_ids = set()
+            if member_id and music_ids:
+                liked_ids = Like.find_music_ids_by_member(member_id, music_ids)
+            
             for music in musics:
-                like_count = Like.count_by_music(music.id)
-                pressed = False
-                
-                # 인증된 사용자면 좋아요 여부 확인
-                if member_id:
-                    pressed = Like.find_by_member_and_music(member_id, music.id) is not None
-                
                 music_list.append({
                     'id': music.id,
                     'musicUrl': music.music_url,
                     'title': music.title,
-                    'likeCount': like_count,
-                    'pressed': pressed,
+                    'likeCount': like_counts.get(music.id, 0),
+                    'pressed': music.id in liked_ids,
                     'createdAt': music.created_at
                 })
             
@@ -322,24 +564,24 @@ class MusicService:
             
             # 인증된 사용자인 경우 회원 ID 조회
             if user_info:
-                member = Member.find_by_google_id(user_info.get('google_id'))
+                member = member_identity_cache.resolve(user_info.get('google_id'))
                 if member:
                     member_id = member.id
             
+            # 좋아요 수와 좋아요 여부는 음악별로 조회하지 않고 한 번에 조회
+            music_ids = [music.id for music in musics]
+            like_counts = Like.count_by_music_ids(music_ids) if music_ids else {}
+            liked_ids = set()
+            if member_id and music_ids:
+                liked_ids = Like.find_music_ids_by_member(member_id, music_ids)
+            
             for music in musics:
-                like_count = Like.count_by_music(music.id)
-                pressed = False
-                
-                # 인증된 사용자면 좋아요 여부 확인
-                if member_id:
-                    pressed = Like.find_by_member_and_music(member_id, music.id) is not None
-                
                 music_list.append({
                     'id': music.id,
                     'musicUrl': music.music_url,
                     'title': music.title,
-                    'likeCount': like_count,
-                    'pressed': pressed,
+                    'likeCount': like_counts.get(music.id, 0),
+                    'pressed': music.id in liked_ids,
                     'createdAt': music.created_at
                 })
             
@@ -351,6 +593,94 @@ class MusicService:
             logger.error(f"인기 플레이리스트 조회 오류: {str(e)}")
             raise
     
+    @staticmethod
+    def get_musics_by_ids(music_ids, user_info=None, include_likes=False):
+        """여러 음악 일괄 조회 (요청 순서 유지)
+        
+        Args:
+            music_ids: 음악 ID 목록
+            user_info: 사용자 정보 (선택)
+            include_likes: 좋아요 수와 좋아요 여부 포함 여부
+            
+        Returns:
+            음악 목록과 찾지 못한 ID 목록
+        """
+        # 중복 제거 (처음 나온 순서 유지)
+        music_ids = list(dict.fromkeys(music_ids))
+        musics = Music.find_by_ids(music_ids)
+        found_ids = [music_id for music_id in music_ids if music_id in musics]
+        
+        like_counts = {}
+        liked_ids = set()
+        if include_likes and found_ids:
+            like_counts = Like.count_by_music_ids(found_ids)
+            
+            # 인증된 사용자면 좋아요 여부 확인
+            if user_info:
+                member = member_identity_cache.resolve(user_info.get('google_id'))
+                if member:
+                    liked_ids = Like.find_music_ids_by_member(member.id, found_ids)
+        
+        music_list = []
+        for music_id in found_ids:
+            music = musics[music_id]
+            item = {
+                'id': music.id,
+                'musicUrl': music.music_url,
+                'title': music.title,
+                'createdAt': music.created_at
+            }
+            if include_likes:
+                item['likeCount'] = like_counts.get(music.id, 0)
+                item['pressed'] = music.id in liked_ids
+            music_list.append(item)
+        
+        return {
+            'musicList': music_list,
+            'missingIds': [music_id for music_id in music_ids if music_id not in musics]
+        }
+    
+    @staticmethod
+    def search_music(query, user_info=None, limit=20):
+        """음악 제목 검색
+        
+        Args:
+            query: 검색어
+            user_info: 사용자 정보 (선택)
+            limit: 조회할 최대 항목 수
+        
+        Returns:
+            검색 결과 (관련도 + 최신성 순)
+        """
+        try:
+            musics = Music.search(query, limit)
+            
+            # 인증된 사용자면 좋아요 여부를 한 번에 조회
+            liked_ids = set()
+            if user_info and musics:
+                member = member_identity_cache.resolve(user_info.get('google_id'))
+                if member:
+                    liked_ids = Like.find_music_ids_by_member(member.id, [music.id for music in musics])
+            
+            music_list = []
+            for music in musics:
+                music_list.append({
+                    'id': music.id,
+                    'musicUrl': music.music_url,
+                    'title': music.title,
+                    'likeCount': music.like_count,
+                    'pressed': music.id in liked_ids,
+                    'createdAt': music.created_at
+                })
+            
+            return {
+                'musicList': music_list
+            }
+        
+        except Exception as e:
+            logger.error(f"음악 검색 오류: {str(e)}")
+            raise
+    
     @staticmethod
     def like_music(music_id, user_info):
         """음악 좋아요
@@ -370,31 +700,36 @@ class MusicService:
         if not user_info:
             raise MemberNotFoundException("인증되지 않은 사용자입니다.")
         
-        member = Member.find_by_google_id(user_info.get('google_id'))
+        member = member_identity_cache.resolve(user_info.get('google_id'))
         if not member:
             raise MemberNotFoundException("회원 정보를 찾을 수 없습니다.")
         
-        music = Music.find_by_id(music_id)
-        if not music:
-            raise MusicNotFoundException(f"ID가 {music_id}인 음악을 찾을 수 없습니다.")
-        
-        # 이미 좋아요를 눌렀는지 확인
-        existing_like = Like.find_by_member_and_music(member.id, music_id)
-        if existing_like:
-            raise DuplicateDataException("이미 좋아요를 누른 노래입니다.")
-        
         try:
-            # 좋아요 추가
-            like = Like(member_id=member.id, music_id=music_id)
-            db.session.add(like)
+            # 유니크 제약조건에 기대는 단일 INSERT (중복 시 무시)
+            created = Like.insert_if_absent(member.id, music_id)
             db.session.commit()
-            logger.info(f"좋아요 추가: 회원 ID {member.id}, 음악 ID {music_id}")
-            
-            return True
+        except IntegrityError as e:
+            # 외래키 위반 (존재하지 않는 음악)
+            db.session.rollback()
+            logger.warning(f"좋아요 추가 실패 (외래키): {str(e)}")
+            raise MusicNotFoundException(f"ID가 {music_id}인 음악을 찾을 수 없습니다.")
         except Exception as e:
             db.session.rollback()
             logger.error(f"좋아요 추가 실패: {str(e)}")
             raise
+        
+        if not created:
+            # 이미 좋아요를 눌렀거나 음악이 없는 경우 (MySQL INSERT IGNORE는 외래키 오류도 무시)
+            if not Music.find_by_id(music_id):
+                raise MusicNotFoundException(f"ID가 {music_id}인 음악을 찾을 수 없습니다.")
+            raise DuplicateDataException("이미 좋아요를 누른 노래입니다.")
+        
+        logger.info(f"좋아요 추가: 회원 ID {member.id}, 음악 ID {music_id}")
+        
+        # 좋아요 수는 버퍼에 모아서 주기적으로 반영
+        like_count_buffer.add(music_id, 1)
+        
+        return True
     
     @staticmethod
     def unlike_music(music_id, user_info):
@@ -414,27 +749,106 @@ class MusicService:
         if not user_info:
             raise MemberNotFoundException("인증되지 않은 사용자입니다.")
         
-        member = Member.find_by_google_id(user_info.get('google_id'))
+        member = member_identity_cache.resolve(user_info.get('google_id'))
         if not member:
             raise MemberNotFoundException("회원 정보를 찾을 수 없습니다.")
         
-        # 이미 좋아요를 눌렀는지 확인
-        existing_like = Like.find_by_member_and_music(member.id, music_id)
-        if not existing_like:
-            # 좋아요가 없으면 성공으로 간주 (멱등성 보장)
-            return True
-        
         try:
-            # 좋아요 삭제
-            db.session.delete(existing_like)
+            # 단일 DELETE (좋아요가 없으면 0건 삭제)
+            deleted = Like.delete_by_member_and_music(member.id, music_id)
             db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"좋아요 취소 실패: {str(e)}")
+            raise
+        
+        # 좋아요가 없었으면 성공으로 간주 (멱등성 보장)
+        if deleted:
             logger.info(f"좋아요 취소: 회원 ID {member.id}, 음악 ID {music_id}")
+            like_count_buffer.add(music_id, -1)
+        
+        return True
+    
+    @staticmethod
+    def batch_like_music(operations, user_info):
+        """좋아요/좋아요 취소 일괄 처리 (하나의 트랜잭션)
+        
+        같은 음악에 대한 작업이 여러 번 있으면 마지막 작업만 적용됩니다.
+        
+        Args:
+            operations: [{'musicId': 음악 ID, 'action': 'like' | 'unlike'}, ...]
+            user_info: 사용자 정보
+        
+        Returns:
+            작업별 처리 결과 목록
+        
+        Raises:
+            MemberNotFoundException: 회원을 찾을 수 없는 경우
+        """
+        if not user_info:
+            raise MemberNotFoundException("인증되지 않은 사용자입니다.")
+        
+        member = member_identity_cache.resolve(user_info.get('google_id'))
+        if not member:
+            raise MemberNotFoundException("회원 정보를 찾을 수 없습니다.")
+        
+        # 음악별 마지막 작업의 인덱스
+        last_index = {}
+        for index, operation in enumerate(operations):
+            last_index[operation['musicId']] = index
+        
+        like_ids = [music_id for music_id, index in last_index.items()
+                    if operations[index]['action'] == 'like']
+        unlike_ids = [music_id for music_id, index in last_index.items()
+                      if operations[index]['action'] == 'unlike']
+        
+        try:
+            existing_music_ids = Music.find_existing_ids(like_ids)
             
-            return True
+            # 결과는 미리 조회한 상태가 아니라 문장이 실제로 추가/삭제한 행으로 판단
+            # (동시에 같은 좋아요를 처리해도 한 요청만 LIKED/UNLIKED로 집계)
+            inserted_ids = Like.bulk_insert_ignore(member.id, [music_id for music_id in like_ids
+                                                               if music_id in existing_music_ids])
+            deleted_ids = Like.bulk_delete(member.id, unlike_ids)
+            db.session.commit()
         except Exception as e:
             db.session.rollback()
-            logger.error(f"좋아요 취소 실패: {str(e)}")
+            logger.error(f"좋아요 일괄 처리 실패: {str(e)}")
             raise
+        
+        results = []
+        for index, operation in enumerate(operations):
+            music_id = operation['musicId']
+            action = operation['action']
+            
+            if last_index[music_id] != index:
+                result = 'SUPERSEDED'
+            elif action == 'like':
+                if music_id not in existing_music_ids:
+                    result = 'MUSIC_NOT_FOUND'
+                elif music_id in inserted_ids:
+                    result = 'LIKED'
+                else:
+                    result = 'ALREADY_LIKED'
+            else:
+                result = 'UNLIKED' if music_id in deleted_ids else 'NOT_LIKED'
+            
+            if result == 'LIKED':
+                like_count_buffer.add(music_id, 1)
+            elif result == 'UNLIKED':
+                like_count_buffer.add(music_id, -1)
+            
+            results.append({
+                'musicId': music_id,
+                'action': action,
+                'result': result
+            })
+        
+        logger.info(f"좋아요 일괄 처리: 회원 ID {member.id}, 작업 {len(operations)}건")
+        
+        return {
+            'results': results
+        }
     
     @staticmethod
     def delete_my_music(music_id, user_info):
@@ -454,7 +868,7 @@ class MusicService:
         if not user_info:
             raise MemberNotFoundException("인증되지 않은 사용자입니다.")
         
-        member = Member.find_by_google_id(user_info.get('google_id'))
+        member = member_identity_cache.resolve(user_info.get('google_id'))
         if not member:
             raise MemberNotFoundException("회원 정보를 찾을 수 없습니다.")
         
@@ -498,8 +912,17 @@ class MusicService:
             raise MusicNotFoundException(f"ID가 {music_id}인 음악을 찾을 수 없습니다.")
         
         try:
+            # 음원 객체는 삭제 큐에 기록하여 Music 삭제와 함께 커밋 (S3 삭제는 백그라운드에서 처리)
+            # 내용 주소 객체를 다른 음악이 함께 참조하면 객체는 남겨 둠
+            object_key = S3Uploader.object_key_from_url(music.music_url)
+            shared = S3Uploader.is_content_addressed_key(object_key) and \
+                Music.is_url_referenced(music.music_url, exclude_music_id=music.id)
+            if object_key and not shared:
+                s3_delete_queue.enqueue([object_key])
+            
             # Music 삭제 (이벤트 리스너가 MyMusic과 Like를 자동으로 삭제함)
             music.delete_cascade()
+            s3_delete_queue.wakeup()
             logger.info(f"음악 완전 삭제: 음악 ID {music_id}")
             
             return True
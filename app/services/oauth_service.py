@@ -1,4 +1,5 @@
 from app.clients.oauth_client import OAuthClient
+from app.auth.google_id_token import google_id_token_verifier
 from app.services.member_service import MemberService
 from app.utils.exceptions import ExternalAPIException, UnauthorizedException
 import logging
@@ -8,6 +9,53 @@ logger = logging.getLogger(__name__)
 class OAuthService:
     """OAuth 인증 서비스"""
     
+    @staticmethod
+    def get_google_tokens(code):
+        """구글 토큰 응답 획득 (액세스 토큰, 요청한 scope에 openid가 있으면 ID 토큰 포함)
+        
+        Args:
+            code: 인증 코드
+        
+        Returns:
+            토큰 응답 딕셔너리
+        
+        Raises:
+            ExternalAPIException: 토큰 획득 중 오류 발생 시
+        """
+        try:
+            token_response = OAuthClient.get_google_token(code)
+            
+            if not token_response.get('access_token') and not token_response.get('id_token'):
+                logger.error("Google OAuth 응답에 토큰이 없습니다.")
+                raise UnauthorizedException("인증에 실패했습니다.")
+            
+            return token_response
+        except ExternalAPIException as e:
+            logger.error(f"Google 토큰 획득 실패: {str(e)}")
+            raise
+    
+    @staticmethod
+    def get_google_user_info_from_id_token(id_token):
+        """구글 ID 토큰을 로컬에서 검증하여 사용자 정보 추출 (userinfo 호출 없음)
+        
+        Args:
+            id_token: 구글 ID 토큰
+        
+        Returns:
+            사용자 정보 (userinfo 응답과 같은 id/name/email 키, 클레임이 없으면 None)
+        
+        Raises:
+            UnauthorizedException: ID 토큰이 유효하지 않은 경우
+        """
+        claims = google_id_token_verifier.verify(id_token)
+        
+        # name 클레임은 profile scope가 없으면 빠지므로 대체값을 넣지 않음 (저장된 이름 유지)
+        return {
+            'id': claims['sub'],  # userinfo의 id와 같은 값
+            'name': claims.get('name'),
+            'email': claims.get('email')
+        }
+    
     @staticmethod
     def get_google_access_token(code):
         """구글 액세스 토큰 획득
@@ -78,11 +126,16 @@ class OAuthService:
             UnauthorizedException: 인증 실패 시
         """
         try:
-            # 액세스 토큰 획득
-            access_token = OAuthService.get_google_access_token(code)
+            # 토큰 획득
+            token_response = OAuthService.get_google_tokens(code)
             
-            # 사용자 정보 획득
-            user_info = OAuthService.get_google_user_info(access_token)
+            id_token = token_response.get('id_token')
+            if id_token:
+                # ID 토큰 서명을 로컬에서 검증 (userinfo 왕복 생략)
+                user_info = OAuthService.get_google_user_info_from_id_token(id_token)
+            else:
+                # 사용자 정보 획득
+                user_info = OAuthService.get_google_user_info(token_response.get('access_token'))
             
             # 회원 찾기 또는 생성 및 JWT 토큰 생성
             jwt_token = MemberService.find_or_create_member_by_google_id(user_info)
@@ -134,4 +187,32 @@ class OAuthService:
             logger.error(f"프론트엔드 구글 로그인 처리 실패: {str(e)}")
             if isinstance(e, UnauthorizedException):
                 raise
-            raise UnauthorizedException("로그인 처리 중 오류가 발생했습니다.")
\ No newline at end of file
+            raise UnauthorizedException("로그인 처리 중 오류가 발생했습니다.")
+    
+    @staticmethod
+    def process_google_id_token_login(id_token):
+        """구글 로그인 처리 (프론트엔드에서 받은 ID 토큰 전송)
+        
+        Args:
+            id_token: 구글 ID 토큰
+        
+        Returns:
+            JWT 토큰이 포함된 응답
+        
+        Raises:
+            UnauthorizedException: 인증 실패 시
+        """
+        try:
+            user_info = OAuthService.get_google_user_info_from_id_token(id_token)
+            
+            # 회원 찾기 또는 생성 및 JWT 토큰 생성
+            jwt_token = MemberService.find_or_create_member_by_google_id(user_info)
+            
+            return {
+                'accessToken': jwt_token
+            }
+        except Exception as e:
+            logger.error(f"구글 ID 토큰 로그인 처리 실패: {str(e)}")
+            if isinstance(e, (UnauthorizedException, ExternalAPIException)):
+                raise
+            raise UnauthorizedException("로그인 처리 중 오류가 발생했습니다.")
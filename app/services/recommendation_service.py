@@ -0,0 +1,182 @@
+from app import db
+from app.models.like import Like
+from app.models.music import Music
+from app.models.similar_music import SimilarMusic
+from app.utils.exceptions import MusicNotFoundException
+from app.utils.related_index import related_music_index
+from collections import Counter, defaultdict
+import heapq
+import math
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 좋아요가 너무 많은 회원은 쌍의 수가 제곱으로 늘어나므로 최근 좋아요만 반영
+MAX_LIKES_PER_MEMBER = 500
+
+class RecommendationService:
+    """음악 추천 서비스"""
+    
+    @staticmethod
+    def rebuild_similar_music(top_n=20, music_ids=None):
+        """함께 좋아요한 회원 수로 음악 간 유사도를 계산하여 상위 N개를 저장
+        
+        like_tb를 회원 ID 순으로 스트리밍하면서 회원별 좋아요 목록의 쌍을 세어
+        희소 동시 출현 행렬을 만들고, 코사인 유사도
+        (co(a, b) / sqrt(n(a) * n(b)))가 높은 순으로 similar_music_tb에 저장합니다.
+        music_ids를 지정하면 대상 음악을 좋아한 회원의 좋아요만 읽고,
+        다른 음악의 좋아요 수는 따로 집계합니다.
+        
+        Args:
+            top_n: 음악별로 저장할 유사 음악 수
+            music_ids: 다시 계산할 음악 ID 목록 (없으면 전체)
+        
+        Returns:
+            유사 음악 목록을 저장한 음악 수
+        """
+        started = time.monotonic()
+        targets = set(music_ids) if music_ids is not None else None
+        
+        like_counts = Counter()
+        co_counts = defaultdict(Counter)
+        
+        def accumulate(liked):
+            like_counts.update(liked)
+            if len(liked) < 2:
+                return
+            liked = liked[-MAX_LIKES_PER_MEMBER:]
+            for music_id in liked:
+                if targets is not None and music_id not in targets:
+                    continue
+                row = co_counts[music_id]
+                for other_id in liked:
+                    if other_id != music_id:
+                        row[other_id] += 1
+        
+        rows = db.session.query(Like.member_id, Like.music_id)
+        if targets is not None:
+            # 대상 음악을 좋아하지 않은 회원의 좋아요는 대상 음악과 함께 나타나지 않음
+            likers = db.session.query(Like.member_id).filter(Like.music_id.in_(targets))
+            rows = rows.filter(Like.member_id.in_(likers.scalar_subquery()))
+        rows = rows.order_by(Like.member_id, Like.id)\
+                   .execution_options(yield_per=5000)
+        
+        current_member_id = None
+        liked = []
+        for row in rows:
+            if row.member_id != current_member_id:
+                if liked:
+                    accumulate(liked)
+                current_member_id = row.member_id
+                liked = []
+            liked.append(row.music_id)
+        if liked:
+            accumulate(liked)
+        
+        if targets is not None:
+            # 읽은 회원만으로는 다른 음악의 좋아요 수를 알 수 없으므로 따로 집계
+            involved_ids = set(co_counts)
+            for row in co_counts.values():
+                involved_ids.update(row)
+            like_counts = Like.count_by_music_ids(list(involved_ids))
+        
+        new_rows = []
+        for music_id, row in co_counts.items():
+            scored = (
+                (count / math.sqrt(like_counts[music_id] * like_counts[other_id]), other_id)
+                for other_id, count in row.items()
+            )
+            for rank, (score, other_id) in enumerate(heapq.nlargest(top_n, scored), start=1):
+                new_rows.append({
+                    'music_id': music_id,
+                    'similar_music_id': other_id,
+                    'score': score,
+                    'rank': rank
+                })
+        
+        try:
+            if targets is None:
+                SimilarMusic.delete_all()
+                SimilarMusic.replace_for_musics([], new_rows)
+            else:
+                SimilarMusic.replace_for_musics(list(targets), new_rows)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"유사 음악 계산 결과 저장 실패: {str(e)}")
+            raise
+        
+        logger.info(f"유사 음악 계산 완료: 음악 {len(co_counts)}건, "
+                    f"{(time.monotonic() - started) * 1000:.0f}ms")
+        return len(co_counts)
+    
+    @staticmethod
+    def get_similar_music(music_id, limit=10):
+        """유사 음악 조회 (미리 계산된 목록에서 한 번의 인덱스 조회)
+        
+        Args:
+            music_id: 기준 음악 ID
+            limit: 조회할 최대 항목 수
+        
+        Returns:
+            유사 음악 목록
+        """
+        results = SimilarMusic.find_similar_musics(music_id, limit)
+        
+        music_list = []
+        for music, score in results:
+            music_list.append({
+                'id': music.id,
+                'musicUrl': music.music_url,
+                'title': music.title,
+                'score': round(score, 4),
+                'createdAt': music.created_at
+            })
+        
+        return {
+            'musicList': music_list
+        }
+    
+    @staticmethod
+    def get_related_music(music_id, limit=10):
+        """제목/프롬프트 내용이 비슷한 음악 조회 (좋아요가 없는 새 음악도 대상)
+        
+        Args:
+            music_id: 기준 음악 ID
+            limit: 조회할 최대 항목 수
+        
+        Returns:
+            유사 음악 목록
+        
+        Raises:
+            MusicNotFoundException: 음악을 찾을 수 없는 경우
+        """
+        results = related_music_index.related(music_id, limit)
+        if results is None:
+            # 다른 워커에서 방금 생성되어 이 워커의 색인에 아직 없는 음악
+            music = Music.find_by_id(music_id)
+            if not music:
+                raise MusicNotFoundException(f"ID가 {music_id}인 음악을 찾을 수 없습니다.")
+            text = f"{music.title} {music.prompt}" if music.prompt else music.title
+            results = related_music_index.related(music_id, limit, text=text)
+        
+        # 색인 재구성 전에 삭제된 음악은 제외
+        musics = Music.find_by_ids([related_id for related_id, _ in results])
+        
+        music_list = []
+        for related_id, score in results:
+            music = musics.get(related_id)
+            if not music:
+                continue
+            music_list.append({
+                'id': music.id,
+                'musicUrl': music.music_url,
+                'title': music.title,
+                'score': round(score, 4),
+                'createdAt': music.created_at
+            })
+        
+        return {
+            'musicList': music_list
+        }
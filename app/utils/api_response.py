@@ -1,8 +1,10 @@
 from flask import jsonify
+from app.utils.request_timing import timed_phase
 from typing import Optional, Dict, Any, Union, Tuple, List
 
 class ApiResponse:
     @staticmethod
+    @timed_phase('serialize')
     def success(
         data: Optional[Union[Dict[str, Any], List[Any]]] = None, 
         status_code: int = 200, 
@@ -32,6 +34,7 @@ class ApiResponse:
         return jsonify(response), status_code
     
     @staticmethod
+    @timed_phase('serialize')
     def error(
         message: str, 
         status_code: int = 400, 
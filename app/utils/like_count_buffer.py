@@ -0,0 +1,394 @@
+import atexit
+import glob
+import os
+import re
+import secrets
+import threading
+import time
+from collections import defaultdict
+from flask import current_app
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 저널 파일 이름: like_count_<pid>-<기동 nonce>_<배치 번호>.journal
+_JOURNAL_NAME = re.compile(r'^like_count_(?P<journal_id>\d+-[0-9a-f]+)_(?P<seq>\d+)\.journal$')
+_LOCK_NAME = re.compile(r'^like_count_(?P<journal_id>\d+-[0-9a-f]+)\.lock$')
+
+class LikeCountBuffer:
+    """좋아요 수 write-behind 버퍼
+    
+    좋아요/좋아요 취소 시 Music.like_count를 요청마다 갱신하지 않고
+    프로세스 메모리에 증감분을 모아 두었다가 일정 주기로 한 번에 반영합니다.
+    
+    증감분은 반영 배치 단위의 저널 파일에도 기록하며, 배치를 반영할 때
+    (저널 ID, 배치 번호)를 like_count_flush_tb에 같은 트랜잭션으로 표시합니다.
+    반영 전 프로세스가 죽으면 다른 워커가 남은 저널의 증감분을 표시되지 않은 배치만
+    다시 반영하므로, 살아 있는 워커의 미반영 증감분과 겹쳐 두 번 더해지지 않습니다.
+    저널 ID는 pid와 기동 시 nonce로 만들어 재사용된 pid와 구분하고, 소유 워커가
+    살아 있는지는 워커가 잡고 있는 잠금 파일로 확인합니다.
+    
+    LIKE_COUNT_RECONCILE_SECONDS를 설정하면 (한 호스트에서만 실행할 때, 기본은 꺼짐) 그 주기마다
+    죽은 워커의 저널을 복구하고, 최근 반영한 음악 중 아직 반영되지 않은 증감분이 없는 음악의
+    좋아요 수를 like_tb 기준으로 다시 계산합니다.
+    """
+    
+    def __init__(self, app=None):
+        self.app = None
+        # init_app 전에는 즉시 반영 (저널 디렉터리와 반영 스레드 없음)
+        self.enabled = False
+        self.reconcile_interval = 0
+        self._lock = threading.Lock()
+        self._deltas = defaultdict(int)
+        self._oldest_pending = None
+        self._failed_batches = []
+        self._touched = set()
+        self._thread = None
+        self._pid = None
+        self._journal_id = None
+        self._seq = 0
+        self._journal = None
+        self._owner_lock = None
+        self.last_flush_lag = 0.0
+        self.flush_count = 0
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        """앱 설정 로드 및 종료된 프로세스의 미반영 저널 복구"""
+        self.app = app
+        self.enabled = app.config.get('LIKE_COUNT_WRITE_BEHIND', True)
+        self.interval = app.config.get('LIKE_COUNT_FLUSH_INTERVAL_MS', 500) / 1000
+        self.reconcile_interval = app.config.get('LIKE_COUNT_RECONCILE_SECONDS', 0)
+        self.journal_dir = app.config.get('LIKE_COUNT_JOURNAL_DIR') or \
+            os.path.join(app.instance_path, 'like_count_journal')
+        app.extensions['like_count_buffer'] = self
+        
+        if self.enabled:
+            os.makedirs(self.journal_dir, exist_ok=True)
+            self.replay()
+    
+    def add(self, music_id, delta):
+        """좋아요 수 증감분 추가
+        
+        Args:
+            music_id: 음악 ID
+            delta: 증감분 (+1 / -1)
+        """
+        if not self.enabled:
+            # write-behind 비활성화 시 즉시 반영
+            self._apply({music_id: delta})
+            return
+        
+        self._ensure_worker()
+        with self._lock:
+            self._write_journal(music_id, delta)
+            self._deltas[music_id] += delta
+            if self._oldest_pending is None:
+                self._oldest_pending = time.monotonic()
+    
+    def flush(self):
+        """모아 둔 증감분을 DB에 반영
+        
+        실패한 배치는 같은 배치 번호로 다음 주기에 다시 반영합니다 (새 증감분과 합치지 않음).
+        
+        Returns:
+            반영한 음악 수
+        """
+        with self._lock:
+            batches = self._failed_batches
+            self._failed_batches = []
+            if self._deltas:
+                batches.append((self._seq, self._deltas, self._seal_journal(), self._oldest_pending))
+                self._deltas = defaultdict(int)
+                self._oldest_pending = None
+        
+        applied = 0
+        for index, (seq, deltas, path, oldest_pending) in enumerate(batches):
+            try:
+                self._apply(deltas, self._journal_id, seq)
+            except Exception as e:
+                logger.error(f"좋아요 수 반영 실패 (다음 주기에 재시도): {str(e)}")
+                with self._lock:
+                    self._failed_batches = batches[index:] + self._failed_batches
+                return applied
+            
+            if path:
+                self._remove(path)
+            with self._lock:
+                self._touched.update(deltas)
+            applied += len(deltas)
+            self.last_flush_lag = time.monotonic() - oldest_pending
+            self.flush_count += 1
+            logger.debug(f"좋아요 수 반영: 음악 {len(deltas)}건, 지연 {self.last_flush_lag * 1000:.0f}ms")
+        return applied
+    
+    def stats(self):
+        """버퍼 상태 (반영 지연 지표 포함)"""
+        with self._lock:
+            pending = len(self._deltas) + sum(len(batch[1]) for batch in self._failed_batches)
+            oldest = [batch[3] for batch in self._failed_batches]
+            if self._oldest_pending:
+                oldest.append(self._oldest_pending)
+            oldest_pending = min(oldest, default=None)
+        
+        return {
+            'pending': pending,
+            'flush_lag': time.monotonic() - oldest_pending if oldest_pending else 0.0,
+            'last_flush_lag': self.last_flush_lag,
+            'flush_count': self.flush_count
+        }
+    
+    def replay(self):
+        """종료된 프로세스가 남긴 저널 중 반영되지 않은 배치의 증감분 반영
+        
+        Returns:
+            반영한 배치 수
+        """
+        from app import db
+        from app.models.music import Music
+        from app.models.like_count_flush import LikeCountFlush
+        
+        journals = defaultdict(list)
+        for path in glob.glob(os.path.join(self.journal_dir, 'like_count_*.journal')):
+            match = _JOURNAL_NAME.match(os.path.basename(path))
+            if match and match.group('journal_id') != self._journal_id:
+                journals[match.group('journal_id')].append((int(match.group('seq')), path))
+        # 미반영 증감분 없이 죽은 워커도 반영 표시와 잠금 파일은 정리
+        for path in glob.glob(os.path.join(self.journal_dir, 'like_count_*.lock')):
+            match = _LOCK_NAME.match(os.path.basename(path))
+            if match and match.group('journal_id') != self._journal_id:
+                journals.setdefault(match.group('journal_id'), [])
+        
+        replayed = 0
+        for journal_id, batches in journals.items():
+            if self._owner_alive(journal_id):
+                continue
+            
+            applied = 0
+            with self.app.app_context():
+                try:
+                    for seq, path in sorted(batches):
+                        # 반영 후 저널을 지우기 전에 죽은 배치는 이미 표시되어 있으므로 건너뜀
+                        if LikeCountFlush.claim(journal_id, seq):
+                            Music.increment_like_counts(self._read_journal(path))
+                            applied += 1
+                    LikeCountFlush.delete_journal(journal_id)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"좋아요 수 저널 복구 실패 ({journal_id}): {str(e)}")
+                    continue
+            
+            for _, path in batches:
+                self._remove(path)
+            self._remove(self._owner_lock_path(journal_id))
+            replayed += applied
+            if batches:
+                logger.info(f"좋아요 수 저널 복구 완료: {journal_id}, 반영 배치 {applied}/{len(batches)}건")
+        return replayed
+    
+    def reconcile(self):
+        """최근 반영한 음악의 좋아요 수를 like_tb 기준으로 다시 계산
+        
+        이 호스트의 어느 저널에든 반영되지 않은 증감분이 남아 있는 음악은 건너뛰고
+        다음 주기로 미룹니다 (재계산 후 그 증감분이 다시 더해지지 않도록).
+        다시 계산한 뒤에도 증감분이 새로 생긴 음악이 있으면 되돌리고 다음 주기로 미룹니다.
+        요청이 좋아요 행을 커밋한 뒤 저널에 기록하기 전의 짧은 구간과 다른 호스트의 워커가
+        가진 증감분은 확인할 수 없으므로, 여러 호스트에서 실행할 때는
+        LIKE_COUNT_RECONCILE_SECONDS=0으로 끄고 점검 시간에 재계산합니다.
+        
+        Returns:
+            다시 계산한 음악 수
+        """
+        from app import db
+        from app.models.music import Music
+        
+        with self._lock:
+            touched = self._touched
+            self._touched = set()
+        music_ids = touched - self._pending_music_ids()
+        if not music_ids:
+            self._defer_reconcile(touched)
+            return 0
+        
+        with self.app.app_context():
+            try:
+                Music.recount_like_counts(list(music_ids))
+                if music_ids & self._pending_music_ids():
+                    db.session.rollback()
+                    self._defer_reconcile(touched)
+                    return 0
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"좋아요 수 재계산 실패: {str(e)}")
+                self._defer_reconcile(touched)
+                return 0
+        
+        self._defer_reconcile(touched - music_ids)
+        logger.debug(f"좋아요 수 재계산: 음악 {len(music_ids)}건")
+        return len(music_ids)
+    
+    def _apply(self, deltas, journal_id=None, seq=None):
+        from app import db
+        from app.models.music import Music
+        from app.models.like_count_flush import LikeCountFlush
+        
+        # init_app 전에는 현재 앱 컨텍스트의 앱 사용
+        app = self.app or current_app._get_current_object()
+        with app.app_context():
+            try:
+                # 저널 복구가 먼저 반영한 배치면 건너뜀
+                if journal_id is None or LikeCountFlush.claim(journal_id, seq):
+                    Music.increment_like_counts(deltas)
+                if journal_id is not None:
+                    LikeCountFlush.delete_before(journal_id, seq)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+    
+    def _defer_reconcile(self, music_ids):
+        if music_ids:
+            with self._lock:
+                self._touched.update(music_ids)
+    
+    def _pending_music_ids(self):
+        # 이 호스트의 모든 저널(다른 워커 포함)과 메모리에 남은 미반영 증감분의 음악 ID
+        with self._lock:
+            music_ids = set(self._deltas)
+            for _, deltas, _, _ in self._failed_batches:
+                music_ids.update(deltas)
+        for path in glob.glob(os.path.join(self.journal_dir, 'like_count_*.journal')):
+            music_ids.update(self._read_journal(path))
+        return music_ids
+    
+    def _ensure_worker(self):
+        # fork 이후에는 부모 프로세스의 스레드가 없으므로 프로세스마다 새로 시작
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._journal_id = f'{self._pid}-{secrets.token_hex(4)}'
+            self._seq = 1
+            self._deltas = defaultdict(int)
+            self._oldest_pending = None
+            self._failed_batches = []
+            self._touched = set()
+            self._journal = None
+            self._owner_lock = self._acquire_owner_lock(self._journal_id)
+            self._thread = threading.Thread(target=self._run, name='like-count-flusher', daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+    
+    def _run(self):
+        last_reconcile = time.monotonic()
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+                if self.reconcile_interval and time.monotonic() - last_reconcile >= self.reconcile_interval:
+                    last_reconcile = time.monotonic()
+                    self.replay()
+                    self.reconcile()
+            except Exception as e:
+                logger.error(f"좋아요 수 반영 스레드 오류: {str(e)}")
+    
+    def _journal_path(self, journal_id, seq):
+        return os.path.join(self.journal_dir, f'like_count_{journal_id}_{seq}.journal')
+    
+    def _owner_lock_path(self, journal_id):
+        return os.path.join(self.journal_dir, f'like_count_{journal_id}.lock')
+    
+    def _write_journal(self, music_id, delta):
+        if self._journal is None:
+            self._journal = open(self._journal_path(self._journal_id, self._seq), 'a')
+        self._journal.write(f'{music_id} {delta}\n')
+        self._journal.flush()
+    
+    def _seal_journal(self):
+        # 현재 배치의 저널을 닫고 이후 증감분은 다음 배치 번호의 저널에 기록
+        path = None
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+            path = self._journal_path(self._journal_id, self._seq)
+        self._seq += 1
+        return path
+    
+    @staticmethod
+    def _read_journal(path):
+        deltas = defaultdict(int)
+        try:
+            with open(path) as journal:
+                for line in journal:
+                    parts = line.split()
+                    # 쓰는 도중 끊긴 마지막 줄은 무시 (요청은 저널 기록 전에 이미 커밋됨)
+                    if len(parts) == 2 and parts[0].isdigit() and parts[1].lstrip('-').isdigit():
+                        deltas[int(parts[0])] += int(parts[1])
+        except FileNotFoundError:
+            # 반영을 마쳐 방금 지워진 저널
+            pass
+        return deltas
+    
+    def _acquire_owner_lock(self, journal_id):
+        # 프로세스가 살아 있는 동안 잠금 파일을 잡고 있어 다른 워커가 소유자 생존 여부를 확인
+        if fcntl is None:
+            return None
+        path = self._owner_lock_path(journal_id)
+        while True:
+            lock_file = open(path, 'a')
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # 잠그기 직전에 다른 워커가 죽은 잠금 파일로 보고 지웠으면 새로 만들어 다시 잠금
+            try:
+                if os.stat(path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                    return lock_file
+            except FileNotFoundError:
+                pass
+            lock_file.close()
+    
+    def _owner_alive(self, journal_id):
+        if fcntl is None:
+            return self._is_alive(int(journal_id.split('-')[0]))
+        try:
+            lock_file = open(self._owner_lock_path(journal_id), 'a')
+        except OSError:
+            return False
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        finally:
+            lock_file.close()
+        return False
+    
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    
+    @staticmethod
+    def _is_alive(pid):
+        if pid == os.getpid():
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+
+like_count_buffer = LikeCountBuffer()
@@ -0,0 +1,212 @@
+import hmac
+import ipaddress
+import os
+import time
+from flask import g, request
+
+# 멀티프로세스 모드에서는 지표를 만들 때 파일을 쓰므로 prometheus_client를 불러오기 전에 디렉터리 준비
+# (gunicorn 밖에서 실행되는 flask 명령 등)
+if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+    os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils.exceptions import ForbiddenException
+from app.utils.request_timing import add_phase_observer
+
+# 외부 호출용 히스토그램 구간 (AI 서버는 수십 초까지 걸림)
+EXTERNAL_BUCKETS = (.01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60, 120)
+DB_BUCKETS = (.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1)
+
+# 버퍼 상태 지표 갱신 최소 간격 (초)
+BUFFER_STATS_INTERVAL = 1.0
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'HTTP 요청 처리 시간', ['method', 'route']
+)
+REQUEST_COUNT = Counter(
+    'http_requests_total', 'HTTP 요청 수', ['method', 'route', 'status']
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight', '처리 중인 HTTP 요청 수', multiprocess_mode='livesum'
+)
+DB_QUERY_LATENCY = Histogram(
+    'db_query_duration_seconds', 'SQL 실행 시간', ['statement'], buckets=DB_BUCKETS
+)
+AI_LATENCY = Histogram(
+    'ai_request_duration_seconds', 'AI 서버 호출 시간', ['modality'], buckets=EXTERNAL_BUCKETS
+)
+AI_ERRORS = Counter(
+    'ai_request_errors_total', 'AI 서버 호출 실패 수', ['modality']
+)
+S3_LATENCY = Histogram(
+    's3_operation_duration_seconds', 'S3 작업 시간', ['operation'], buckets=EXTERNAL_BUCKETS
+)
+S3_ERRORS = Counter(
+    's3_operation_errors_total', 'S3 작업 실패 수', ['operation']
+)
+LIKE_BUFFER_PENDING = Gauge(
+    'like_count_buffer_pending', '반영 대기 중인 좋아요 수 증감 음악 수', multiprocess_mode='livesum'
+)
+LIKE_BUFFER_FLUSH_LAG = Gauge(
+    'like_count_buffer_flush_lag_seconds', '가장 오래 대기 중인 증감분의 대기 시간', multiprocess_mode='livemax'
+)
+LIKE_BUFFER_LAST_FLUSH_LAG = Gauge(
+    'like_count_buffer_last_flush_lag_seconds', '마지막 반영 시 지연 시간', multiprocess_mode='livemax'
+)
+LIKE_BUFFER_FLUSHES = Counter(
+    'like_count_buffer_flushes', '좋아요 수 버퍼 반영 횟수'
+)
+
+
+def _observe_phase(phase, operation, seconds, failed):
+    # request_timing의 구간 측정 결과를 외부 호출 지표로 기록
+    if phase == 'ai':
+        AI_LATENCY.labels(operation).observe(seconds)
+        if failed:
+            AI_ERRORS.labels(operation).inc()
+    elif phase == 's3':
+        S3_LATENCY.labels(operation).observe(seconds)
+        if failed:
+            S3_ERRORS.labels(operation).inc()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_metrics_started', None)
+    if started is not None:
+        # 문장 종류(select/insert/update/delete 등)만 레이블로 사용
+        statement_type = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else 'other'
+        DB_QUERY_LATENCY.labels(statement_type).observe(time.perf_counter() - started)
+
+
+class Metrics:
+    """Prometheus 형식 지표 (/metrics)
+    
+    라우트별 요청 처리 시간, 처리 중 요청 수, SQL 실행 시간, AI 서버/S3 호출 시간과 실패 수,
+    좋아요 수 버퍼 상태를 수집합니다.
+    
+    PROMETHEUS_MULTIPROC_DIR 환경 변수를 설정하면 (gunicorn.conf.py에서 기본 설정)
+    워커 프로세스별 값을 공유 파일에 기록하고, /metrics 조회 시 모든 워커의 값을 합산합니다.
+    
+    /metrics는 METRICS_ALLOWED_IPS의 주소/대역에서 오거나 METRICS_TOKEN Bearer 토큰을 담은
+    요청만 허용합니다. 지표를 끄면 SQL 실행 시간 이벤트 리스너도 등록하지 않습니다.
+    """
+    
+    def __init__(self, app=None):
+        self.app = None
+        self._buffer_stats_at = 0.0
+        self._flushes_reported = 0
+        self.token = None
+        self.allowed_networks = []
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('METRICS_ENABLED', True)
+        app.extensions['metrics'] = self
+        
+        if not self.enabled:
+            return
+        
+        self.token = app.config.get('METRICS_TOKEN')
+        self.allowed_networks = [
+            ipaddress.ip_network(value, strict=False) for value in app.config.get('METRICS_ALLOWED_IPS', [])
+        ]
+        
+        # Engine 클래스 이벤트는 모든 앱에 적용되므로 한 번만 등록
+        for name, listener in (('before_cursor_execute', _before_cursor_execute),
+                               ('after_cursor_execute', _after_cursor_execute)):
+            if not event.contains(Engine, name, listener):
+                event.listen(Engine, name, listener)
+        
+        add_phase_observer(_observe_phase)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+        app.add_url_rule(app.config.get('METRICS_PATH', '/metrics'), 'metrics', self.metrics_view)
+    
+    def metrics_view(self):
+        """Prometheus 텍스트 형식 지표 (허용된 주소 또는 토큰만)"""
+        if not self._allowed():
+            raise ForbiddenException("지표 조회 권한이 없습니다.")
+        
+        self._update_buffer_stats(force=True)
+        
+        if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        
+        return self.app.response_class(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+    
+    def _allowed(self):
+        header = request.headers.get('Authorization', '')
+        if self.token and header.startswith('Bearer ') and \
+                hmac.compare_digest(header[7:].encode(), self.token.encode()):
+            return True
+        
+        # 프록시 뒤에서는 프록시 주소가 보이므로 토큰을 사용
+        try:
+            address = ipaddress.ip_address(request.remote_addr or '')
+        except ValueError:
+            return False
+        return any(address in network for network in self.allowed_networks)
+    
+    @staticmethod
+    def _start():
+        if request.endpoint == 'metrics':
+            return
+        g._metrics_started = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+    
+    def _finish(self, response):
+        started = g.get('_metrics_started')
+        if started is None:
+            return response
+        
+        # URL 규칙을 레이블로 사용 (음악 ID 등 경로 값별로 나뉘지 않도록)
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_LATENCY.labels(request.method, route).observe(time.perf_counter() - started)
+        REQUEST_COUNT.labels(request.method, route, str(response.status_code)).inc()
+        self._update_buffer_stats()
+        return response
+    
+    @staticmethod
+    def _teardown(exc):
+        # 처리되지 않은 예외로 after_request가 호출되지 않아도 처리 중 요청 수는 되돌림
+        if g.pop('_metrics_started', None) is not None:
+            REQUESTS_IN_FLIGHT.dec()
+    
+    def _update_buffer_stats(self, force=False):
+        # 버퍼 상태는 워커별이므로 각 워커가 요청을 처리할 때 주기적으로 기록
+        now = time.monotonic()
+        if not force and now - self._buffer_stats_at < BUFFER_STATS_INTERVAL:
+            return
+        self._buffer_stats_at = now
+        
+        from app.utils.like_count_buffer import like_count_buffer
+        
+        stats = like_count_buffer.stats()
+        LIKE_BUFFER_PENDING.set(stats['pending'])
+        LIKE_BUFFER_FLUSH_LAG.set(stats['flush_lag'])
+        LIKE_BUFFER_LAST_FLUSH_LAG.set(stats['last_flush_lag'])
+        # 반영 횟수는 지난 기록 이후 늘어난 만큼만 카운터에 더함
+        flushes = stats['flush_count'] - self._flushes_reported
+        if flushes > 0:
+            LIKE_BUFFER_FLUSHES.inc(flushes)
+            self._flushes_reported = stats['flush_count']
+
+
+metrics = Metrics()
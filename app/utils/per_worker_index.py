@@ -0,0 +1,232 @@
+import os
+import threading
+import time
+from collections import namedtuple
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 색인 구성에 실패했을 때 다시 시도하기까지의 최소 간격(초)
+REBUILD_RETRY_SECONDS = 30
+
+# 커밋된 Music 변경 ('add' 또는 'remove')
+MusicChange = namedtuple('MusicChange', ['action', 'music_id', 'title', 'prompt', 'like_count'])
+
+
+class PerWorkerIndex:
+    """워커 프로세스별 메모리 색인 기반 클래스
+    
+    전체 구성은 백그라운드 스레드에서 실행하며 요청을 기다리게 하지 않습니다
+    (PER_WORKER_INDEX_BACKGROUND를 끄면 호출한 스레드에서 바로 구성).
+    gunicorn 워커는 앱을 불러온 직후(post_worker_init) start_all()로 구성을 시작하고,
+    그 밖의 실행 환경은 처음 사용할 때 시작합니다. 구성이 끝나기 전에는 빈 색인
+    (또는 fork 이전 색인)으로 응답하며, 이후 refresh_seconds 주기로 다시 구성합니다.
+    구성에 실패하면 REBUILD_RETRY_SECONDS 뒤에 다시 시도합니다.
+    
+    이 워커에서 커밋된 변경은 apply()로 바로 반영하고, 재구성 중에 들어온 변경은
+    새 색인으로 교체한 뒤 다시 적용합니다.
+    
+    하위 클래스 구현:
+        _load(): DB를 읽어 새 색인 상태 생성 (앱 컨텍스트 안, 잠금 없이 실행)
+        _install(state): 새 색인 상태로 교체 (잠금 안에서 호출)
+        _apply_change(change): 변경 하나 반영 (잠금 안에서 호출, 여러 번 적용해도 같아야 함)
+        _size(): 로그용 항목 수
+    """
+    
+    extension_name = None
+    refresh_setting = None
+    default_refresh_seconds = 600
+    label = '색인'
+    
+    _instances = []
+    
+    def __init__(self, app=None):
+        self.app = None
+        self.refresh_seconds = self.default_refresh_seconds
+        self.background = True
+        self._lock = threading.RLock()
+        self._built_at = None
+        self._failed_at = None
+        self._rebuilding = False
+        self._pending = None
+        
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.refresh_seconds = app.config.get(self.refresh_setting, self.default_refresh_seconds)
+        self.background = app.config.get('PER_WORKER_INDEX_BACKGROUND', True)
+        app.extensions[self.extension_name] = self
+        if self not in PerWorkerIndex._instances:
+            PerWorkerIndex._instances.append(self)
+    
+    @classmethod
+    def start_all(cls):
+        """등록된 모든 색인의 구성 시작 (워커 시작 직후 호출)"""
+        for index in PerWorkerIndex._instances:
+            index.start()
+    
+    @property
+    def ready(self):
+        """한 번 이상 구성이 끝났는지 여부"""
+        return self._built_at is not None
+    
+    def start(self):
+        """색인이 없거나 오래되었으면 재구성 시작 (백그라운드 구성이면 기다리지 않음)"""
+        if self.app is None:
+            return
+        
+        now = time.monotonic()
+        built_at = self._built_at
+        if built_at is not None and now - built_at <= self.refresh_seconds:
+            return
+        
+        with self._lock:
+            if self._rebuilding:
+                return
+            if self._failed_at is not None and \
+                    now - self._failed_at < min(self.refresh_seconds, REBUILD_RETRY_SECONDS):
+                return
+            self._rebuilding = True
+        
+        if not self.background:
+            self._try_rebuild()
+            return
+        threading.Thread(target=self._try_rebuild, name=f'{self.extension_name}-rebuild',
+                         daemon=True).start()
+    
+    def rebuild(self):
+        """DB를 읽어 색인 재구성 (호출한 스레드에서 실행)"""
+        from app import db
+        
+        started = time.monotonic()
+        with self._lock:
+            if self._pending is None:
+                self._pending = []
+        
+        try:
+            with self.app.app_context():
+                try:
+                    state = self._load()
+                finally:
+                    db.session.remove()
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        
+        with self._lock:
+            self._install(state)
+            self._built_at = time.monotonic()
+            self._failed_at = None
+            # 읽는 동안 커밋된 변경은 새 색인에 다시 적용
+            for change in self._pending:
+                self._apply_change(change)
+            self._pending = None
+            size = self._size()
+        
+        logger.info(f"{self.label} 구성 완료: {size}건, {(time.monotonic() - started) * 1000:.0f}ms")
+    
+    def apply(self, changes):
+        """이 워커에서 커밋된 변경 반영 (아직 구성 전이면 구성 시 DB에서 읽음)"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(changes)
+            if self._built_at is None:
+                return
+            for change in changes:
+                self._apply_change(change)
+    
+    def _try_rebuild(self):
+        try:
+            self.rebuild()
+        except Exception as e:
+            with self._lock:
+                self._failed_at = time.monotonic()
+            logger.error(f"{self.label} 구성 실패: {str(e)}")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+    
+    def _after_fork(self):
+        # 부모 프로세스의 재구성 스레드는 자식에 없으므로 잠금과 진행 상태를 새로 만듦
+        # (fork 이전에 구성된 색인은 다음 재구성 전까지 그대로 사용)
+        self._lock = threading.RLock()
+        self._rebuilding = False
+        self._pending = None
+        self._failed_at = None
+    
+    def _load(self):
+        raise NotImplementedError
+    
+    def _install(self, state):
+        raise NotImplementedError
+    
+    def _apply_change(self, change):
+        raise NotImplementedError
+    
+    def _size(self):
+        raise NotImplementedError
+
+
+class MusicIndex(PerWorkerIndex):
+    """music_tb 기반 워커별 색인
+    
+    이 워커에서 커밋된 Music 추가/삭제/제목·프롬프트 변경을 세션 이벤트로 모아
+    커밋 직후 MusicChange로 반영합니다. 다른 워커의 변경은 주기적 재구성으로 반영합니다.
+    """
+    
+    _music_indexes = []
+    
+    def init_app(self, app):
+        super().init_app(app)
+        if self not in MusicIndex._music_indexes:
+            MusicIndex._music_indexes.append(self)
+
+
+def _music_change(action, music):
+    return MusicChange(action, music.id, music.title, music.prompt, music.like_count or 0)
+
+
+@event.listens_for(Session, 'after_flush')
+def collect_music_changes(session, flush_context):
+    """플러시된 Music 변경을 커밋 시점까지 보관"""
+    from app.models.music import Music
+    
+    changes = session.info.setdefault('music_index_changes', [])
+    for obj in session.new:
+        if isinstance(obj, Music):
+            changes.append(_music_change('add', obj))
+    for obj in session.dirty:
+        if isinstance(obj, Music):
+            attrs = sa_inspect(obj).attrs
+            if attrs.title.history.has_changes() or attrs.prompt.history.has_changes():
+                changes.append(_music_change('add', obj))
+    for obj in session.deleted:
+        if isinstance(obj, Music):
+            changes.append(MusicChange('remove', obj.id, None, None, 0))
+
+
+@event.listens_for(Session, 'after_commit')
+def apply_music_changes(session):
+    """커밋된 Music 변경을 워커별 색인에 반영"""
+    changes = session.info.pop('music_index_changes', None)
+    if not changes:
+        return
+    
+    for index in MusicIndex._music_indexes:
+        try:
+            index.apply(changes)
+        except Exception as e:
+            logger.error(f"{index.label} 변경 반영 실패: {str(e)}")
+
+
+@event.listens_for(Session, 'after_rollback')
+def discard_music_changes(session):
+    session.info.pop('music_index_changes', None)
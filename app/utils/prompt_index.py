@@ -0,0 +1,171 @@
+import random
+import unicodedata
+import zlib
+from collections import defaultdict
+from app.utils.per_worker_index import MusicIndex
+
+# MinHash 해시 함수 수와 LSH 밴드 구성 (밴드 수 * 밴드당 행 수 = 해시 함수 수)
+# 후보가 되는 Jaccard 유사도 경계는 대략 (1 / 밴드 수) ^ (1 / 행 수) = 0.5
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = 4
+
+_PRIME = (1 << 61) - 1
+
+
+def prompt_shingles(prompt):
+    """프롬프트를 단어별 문자 2-gram 집합으로 변환
+    
+    어순이 바뀌거나 어미/활용형이 달라도 ("studying" / "study",
+    "잔잔한" / "잔잔하게") 겹치는 부분이 남도록 단어 안에서만 자릅니다.
+    """
+    shingles = set()
+    for word in unicodedata.normalize('NFKC', prompt).lower().split():
+        if len(word) < 2:
+            shingles.add(word)
+            continue
+        for index in range(len(word) - 1):
+            shingles.add(word[index:index + 2])
+    return shingles
+
+
+def jaccard(left, right):
+    """두 집합의 Jaccard 유사도"""
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+class PromptMinHashIndex(MusicIndex):
+    """텍스트 생성 프롬프트의 근사 중복 탐색용 MinHash LSH 색인
+    
+    프롬프트 shingle 집합의 MinHash 서명을 밴드로 나누어 버킷에 넣고,
+    같은 버킷에 모인 후보만 정확한 Jaccard 유사도로 비교합니다.
+    
+    워커 프로세스별로 music_tb의 프롬프트를 스트리밍으로 읽어 백그라운드에서
+    만들고, 이 워커에서 커밋된 음악 추가/삭제는 바로 반영합니다. 다른 워커에서 생성된
+    음악은 PROMPT_REUSE_REFRESH_SECONDS 주기의 백그라운드 재구성으로 반영합니다.
+    """
+    
+    extension_name = 'prompt_minhash_index'
+    refresh_setting = 'PROMPT_REUSE_REFRESH_SECONDS'
+    label = '프롬프트 MinHash 색인'
+    
+    def __init__(self, app=None):
+        self._bands = [defaultdict(set) for _ in range(LSH_BANDS)]
+        self._prompts = {}  # 음악 ID -> 프롬프트
+        self._band_keys = {}  # 음악 ID -> 밴드별 버킷 키
+        
+        # 워커 간에 같도록 고정 시드로 (a * x + b) mod p 해시 함수 생성
+        rng = random.Random(0)
+        self._permutations = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(MINHASH_PERMUTATIONS)
+        ]
+        super().__init__(app)
+    
+    def find_similar(self, prompt):
+        """가장 비슷한 기존 프롬프트의 음악 조회
+        
+        Args:
+            prompt: 새 프롬프트
+        
+        Returns:
+            (음악 ID, Jaccard 유사도) 튜플, 후보가 없으면 (None, 0.0)
+        """
+        shingles = prompt_shingles(prompt)
+        if not shingles:
+            return None, 0.0
+        
+        self.start()
+        
+        band_keys = self._signature_bands(shingles)
+        with self._lock:
+            candidates = set()
+            for band, key in zip(self._bands, band_keys):
+                candidates.update(band.get(key, ()))
+            prompts = {music_id: self._prompts[music_id] for music_id in candidates}
+        
+        # 유사도가 같으면 최근에 생성된 음악 우선
+        best_id, best_score = None, 0.0
+        for music_id, candidate in prompts.items():
+            score = jaccard(shingles, prompt_shingles(candidate))
+            if (score, music_id) > (best_score, best_id or 0):
+                best_id, best_score = music_id, score
+        return best_id, best_score
+    
+    def add(self, music_id, prompt):
+        """음악 프롬프트 추가 반영 (구성 전이면 무시하고 구성 시 DB에서 읽음)"""
+        if not self.ready or not prompt:
+            return
+        
+        shingles = prompt_shingles(prompt)
+        if not shingles:
+            return
+        band_keys = self._signature_bands(shingles)
+        with self._lock:
+            self.remove(music_id)
+            self._prompts[music_id] = prompt
+            self._band_keys[music_id] = band_keys
+            for band, key in zip(self._bands, band_keys):
+                band[key].add(music_id)
+    
+    def remove(self, music_id):
+        """음악 삭제 반영"""
+        with self._lock:
+            band_keys = self._band_keys.pop(music_id, None)
+            if band_keys is None:
+                return
+            del self._prompts[music_id]
+            for band, key in zip(self._bands, band_keys):
+                bucket = band.get(key)
+                if bucket is not None:
+                    bucket.discard(music_id)
+                    if not bucket:
+                        del band[key]
+    
+    def _load(self):
+        """music_tb의 프롬프트를 스트리밍으로 읽어 새 색인 구성"""
+        from app import db
+        from app.models.music import Music
+        
+        bands = [defaultdict(set) for _ in range(LSH_BANDS)]
+        prompts = {}
+        band_keys_by_id = {}
+        
+        rows = db.session.query(Music.id, Music.prompt)\
+                         .filter(Music.prompt.isnot(None))\
+                         .execution_options(yield_per=1000)
+        for row in rows:
+            shingles = prompt_shingles(row.prompt)
+            if not shingles:
+                continue
+            band_keys = self._signature_bands(shingles)
+            prompts[row.id] = row.prompt
+            band_keys_by_id[row.id] = band_keys
+            for band, key in zip(bands, band_keys):
+                band[key].add(row.id)
+        return bands, prompts, band_keys_by_id
+    
+    def _install(self, state):
+        self._bands, self._prompts, self._band_keys = state
+    
+    def _apply_change(self, change):
+        if change.action == 'add':
+            # 프롬프트가 지워진 경우에도 이전 항목은 제거
+            self.remove(change.music_id)
+            self.add(change.music_id, change.prompt)
+        else:
+            self.remove(change.music_id)
+    
+    def _size(self):
+        return len(self._prompts)
+    
+    def _signature_bands(self, shingles):
+        # MinHash 서명을 LSH_ROWS개씩 묶어 해시한 밴드 키 튜플 (음악별로 보관하므로 정수로 압축)
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+        signature = [min((a * x + b) % _PRIME for x in hashes) for a, b in self._permutations]
+        return tuple(hash(tuple(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])) for band in range(LSH_BANDS))
+
+
+prompt_minhash_index = PromptMinHashIndex()
@@ -0,0 +1,124 @@
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import logging
+
+logger = logging.getLogger(__name__)
+
+# IN 절 자리표시자 목록 (?, ?, ...) / (%s, %s, ...) / (:p1, :p2, ...)
+_IN_LIST = re.compile(r'\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))*\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+_local = threading.local()
+
+
+def fingerprint(statement):
+    """SQL 문장 지문 (공백 정리, IN 절 자리표시자 수 무시)"""
+    return _IN_LIST.sub('(?)', _WHITESPACE.sub(' ', statement).strip())
+
+
+class QueryLog:
+    """실행된 SQL 문장 수와 지문별 횟수"""
+    
+    def __init__(self):
+        self.total = 0
+        self.fingerprints = Counter()
+    
+    def record(self, statement):
+        self.total += 1
+        self.fingerprints[fingerprint(statement)] += 1
+    
+    def repeated(self, threshold):
+        """threshold번보다 많이 실행된 같은 문장 [(지문, 횟수)] (N+1 의심)"""
+        return [(statement, count) for statement, count in self.fingerprints.most_common()
+                if count > threshold]
+
+
+def _active_logs():
+    logs = getattr(_local, 'logs', None)
+    if logs is None:
+        logs = _local.logs = []
+    return logs
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 현재 스레드가 실행한 SQL 문장 수 집계
+    
+    테스트에서 요청별 쿼리 수를 검증할 때 사용합니다.
+        
+        with count_queries() as queries:
+            client.get('/api/playlist')
+        assert queries.total <= 3
+    """
+    log = QueryLog()
+    logs = _active_logs()
+    logs.append(log)
+    try:
+        yield log
+    finally:
+        logs.remove(log)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    logs = getattr(_local, 'logs', None)
+    if logs:
+        for log in logs:
+            log.record(statement)
+
+
+class QueryCounter:
+    """요청별 SQL 문장 수 집계와 N+1 의심 패턴 경고
+    
+    요청마다 실행된 문장을 지문별로 세어, 같은 문장이 QUERY_REPEAT_THRESHOLD번보다
+    많이 실행되면 경고 로그를 남기고 X-Query-Count 응답 헤더로 총 문장 수를 알려줍니다.
+    개발/테스트 설정에서만 켭니다 (QUERY_COUNTER_ENABLED).
+    """
+    
+    def __init__(self, app=None):
+        self.app = None
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('QUERY_COUNTER_ENABLED', False)
+        self.repeat_threshold = app.config.get('QUERY_REPEAT_THRESHOLD', 3)
+        app.extensions['query_counter'] = self
+        
+        if self.enabled:
+            app.before_request(self._start)
+            app.after_request(self._finish)
+            app.teardown_request(self._teardown)
+    
+    @staticmethod
+    def _start():
+        log = QueryLog()
+        _active_logs().append(log)
+        g._query_log = log
+    
+    def _finish(self, response):
+        log = g.get('_query_log')
+        if log is None:
+            return response
+        
+        response.headers['X-Query-Count'] = str(log.total)
+        for statement, count in log.repeated(self.repeat_threshold):
+            logger.warning(f"N+1 의심: {request.method} {request.path} 에서 같은 쿼리 {count}회 실행 "
+                           f"(총 {log.total}회): {statement[:300]}")
+        return response
+    
+    @staticmethod
+    def _teardown(exc):
+        log = g.pop('_query_log', None)
+        if log is not None and log in _active_logs():
+            _active_logs().remove(log)
+
+
+query_counter = QueryCounter()
@@ -0,0 +1,267 @@
+import heapq
+import math
+import random
+import unicodedata
+import zlib
+from array import array
+from collections import Counter, defaultdict
+from app.utils.per_worker_index import MusicIndex
+
+# 문자 n-gram 길이 (띄어쓰기가 일정하지 않은 한국어도 비교되도록 공백을 제거하고 추출)
+NGRAM_SIZES = (2, 3)
+
+# n-gram을 해시하여 매핑하는 특징 차원 수 (2의 거듭제곱)
+FEATURE_SLOTS = 1 << 14
+
+# 벡터화할 텍스트 최대 길이
+MAX_TEXT_LENGTH = 500
+
+# LSH 테이블 수와 테이블별 초평면(비트) 수
+LSH_TABLES = 16
+LSH_BITS = 12
+
+# 충돌 횟수 상위 후보만 정확한 코사인 유사도로 재정렬
+RERANK_CANDIDATES = 200
+
+# 부호 투영 누적용 필드 폭과 가중치 양자화 단계
+# (MAX_TEXT_LENGTH 기준 n-gram 수 * 양자화 최대값이 필드 절반을 넘지 않아야 함)
+FIELD_BITS = 16
+WEIGHT_LEVELS = 15
+
+_PLANES = LSH_TABLES * LSH_BITS
+_ONES = sum(1 << (FIELD_BITS * plane) for plane in range(_PLANES))
+_HALF = 1 << (FIELD_BITS - 1)
+_HIGH_BITS = _ONES << (FIELD_BITS - 1)
+_TABLE_MASK = (1 << (FIELD_BITS * LSH_BITS)) - 1
+
+
+def _spread_byte(value):
+    # 8비트를 FIELD_BITS 간격으로 펼침 (비트 j -> 필드 j의 최하위 비트)
+    return sum(1 << (FIELD_BITS * bit) for bit in range(8) if value >> bit & 1)
+
+
+_SPREAD = [_spread_byte(value) for value in range(256)]
+
+
+def normalize_text(text):
+    """벡터화용 텍스트 정규화 (유니코드 정규화, 소문자, 공백 제거)"""
+    return ''.join(unicodedata.normalize('NFKC', text).lower().split())[:MAX_TEXT_LENGTH]
+
+
+def text_slots(text):
+    """텍스트의 문자 n-gram을 특징 슬롯 번호 배열로 변환 (중복 포함)"""
+    normalized = normalize_text(text)
+    slots = array('H')
+    for size in NGRAM_SIZES:
+        for index in range(len(normalized) - size + 1):
+            slots.append(zlib.crc32(normalized[index:index + size].encode('utf-8')) & (FEATURE_SLOTS - 1))
+    if not slots and normalized:
+        slots.append(zlib.crc32(normalized.encode('utf-8')) & (FEATURE_SLOTS - 1))
+    return slots
+
+
+class RelatedMusicIndex(MusicIndex):
+    """제목/프롬프트 내용 기반 유사 음악 색인
+    
+    제목과 프롬프트의 문자 n-gram TF-IDF 벡터에 무작위 초평면 LSH를 적용해
+    테이블별 버킷에 음악 ID를 넣어 두고, 조회 시 같은 버킷(및 1비트 차이 버킷)에
+    모인 후보를 코사인 유사도로 재정렬합니다.
+    
+    워커 프로세스별로 music_tb를 스트리밍으로 읽어 백그라운드에서 만들고,
+    이 워커에서 커밋된 음악 추가/삭제는 바로 반영합니다. IDF는 구성 시점 값을 쓰며
+    RELATED_INDEX_REFRESH_SECONDS 주기의 백그라운드 재구성으로 갱신합니다.
+    """
+    
+    extension_name = 'related_music_index'
+    refresh_setting = 'RELATED_INDEX_REFRESH_SECONDS'
+    label = '유사 음악 색인'
+    
+    def __init__(self, app=None):
+        self._tables = [defaultdict(set) for _ in range(LSH_TABLES)]
+        self._signatures = {}  # 음악 ID -> LSH 서명
+        self._slots = {}  # 음악 ID -> 특징 슬롯 배열
+        self._idf = [1.0] * FEATURE_SLOTS  # 슬롯별 IDF (구성 시점 기준)
+        self._planes = []
+        super().__init__(app)
+    
+    def related(self, music_id, limit=10, text=None):
+        """내용이 비슷한 음악 조회
+        
+        Args:
+            music_id: 기준 음악 ID
+            limit: 최대 결과 수
+            text: 색인에 없는 음악일 때 사용할 제목/프롬프트 텍스트
+        
+        Returns:
+            (음악 ID, 코사인 유사도) 튜플 목록 (유사도 순), 기준 음악을 모르면 None
+            (색인 구성 전에는 빈 목록)
+        """
+        self.start()
+        
+        with self._lock:
+            slots = self._slots.get(music_id)
+            if slots is None:
+                if text is None:
+                    return None
+                if not self.ready:
+                    return []
+                slots = text_slots(text)
+            vector = self._vector(slots)
+            if not vector:
+                return []
+            signature = self._signature(vector)
+            
+            # 여러 테이블에서 자주 충돌한 후보일수록 유사할 가능성이 높음
+            hits = Counter()
+            for table, key in zip(self._tables, self._table_keys(signature)):
+                for probe in self._probes(key):
+                    bucket = table.get(probe)
+                    if bucket:
+                        hits.update(bucket)
+            hits.pop(music_id, None)
+            
+            scored = []
+            for candidate_id, _ in hits.most_common(RERANK_CANDIDATES):
+                score = self._cosine(vector, self._vector(self._slots[candidate_id]))
+                if score > 0:
+                    scored.append((score, candidate_id))
+        
+        return [(candidate_id, score) for score, candidate_id in heapq.nlargest(limit, scored)]
+    
+    def add(self, music_id, title, prompt=None):
+        """음악 추가 반영 (구성 전이면 무시하고 구성 시 DB에서 읽음)"""
+        if not self.ready:
+            return
+        
+        with self._lock:
+            self.remove(music_id)
+            slots = text_slots(self._document(title, prompt))
+            vector = self._vector(slots)
+            if not vector:
+                return
+            signature = self._signature(vector)
+            self._slots[music_id] = slots
+            self._signatures[music_id] = signature
+            for table, key in zip(self._tables, self._table_keys(signature)):
+                table[key].add(music_id)
+    
+    def remove(self, music_id):
+        """음악 삭제 반영"""
+        with self._lock:
+            signature = self._signatures.pop(music_id, None)
+            if signature is None:
+                return
+            del self._slots[music_id]
+            for table, key in zip(self._tables, self._table_keys(signature)):
+                bucket = table.get(key)
+                if bucket is not None:
+                    bucket.discard(music_id)
+                    if not bucket:
+                        del table[key]
+    
+    def _load(self):
+        """music_tb 전체를 스트리밍으로 읽어 새 색인 구성"""
+        from app import db
+        from app.models.music import Music
+        
+        slots_by_id = {}
+        df = array('I', bytes(4 * FEATURE_SLOTS))
+        
+        rows = db.session.query(Music.id, Music.title, Music.prompt)\
+                         .execution_options(yield_per=1000)
+        for row in rows:
+            slots = text_slots(self._document(row.title, row.prompt))
+            if not slots:
+                continue
+            slots_by_id[row.id] = slots
+            for slot in set(slots):
+                df[slot] += 1
+        
+        if not self._planes:
+            self._planes = self._random_planes()
+        
+        doc_count = len(slots_by_id)
+        idf = [math.log((doc_count + 1) / (count + 1)) + 1 for count in df]
+        
+        tables = [defaultdict(set) for _ in range(LSH_TABLES)]
+        signatures = {}
+        for music_id, slots in slots_by_id.items():
+            signature = self._signature(self._tfidf(slots, idf))
+            signatures[music_id] = signature
+            for table, key in zip(tables, self._table_keys(signature)):
+                table[key].add(music_id)
+        return idf, tables, signatures, slots_by_id
+    
+    def _install(self, state):
+        self._idf, self._tables, self._signatures, self._slots = state
+    
+    def _apply_change(self, change):
+        if change.action == 'add':
+            self.add(change.music_id, change.title, change.prompt)
+        else:
+            self.remove(change.music_id)
+    
+    def _size(self):
+        return len(self._slots)
+    
+    @staticmethod
+    def _document(title, prompt):
+        return f"{title} {prompt}" if prompt else title
+    
+    @staticmethod
+    def _random_planes():
+        # 슬롯별 무작위 ±1 초평면 (비트 1 = +1), 워커 간에 같도록 고정 시드 사용
+        rng = random.Random(0)
+        return [
+            sum(_SPREAD[byte] << (FIELD_BITS * 8 * index)
+                for index, byte in enumerate(rng.getrandbits(_PLANES).to_bytes(_PLANES // 8, 'little')))
+            for _ in range(FEATURE_SLOTS)
+        ]
+    
+    def _vector(self, slots):
+        return self._tfidf(slots, self._idf)
+    
+    @staticmethod
+    def _tfidf(slots, idf):
+        # 로그 TF * 평활 IDF, L2 정규화한 희소 벡터 {슬롯: 가중치}
+        vector = {}
+        for slot, count in Counter(slots).items():
+            vector[slot] = idf[slot] if count == 1 else (1 + math.log(count)) * idf[slot]
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if norm == 0:
+            return {}
+        return {slot: weight / norm for slot, weight in vector.items()}
+    
+    def _signature(self, vector):
+        # 모든 초평면의 투영을 정수 하나의 FIELD_BITS 필드에 동시에 누적
+        # 필드 j = 가중치 합 중 초평면 j가 +1인 부분, 2배가 전체 합보다 크면 투영 부호가 양수
+        top = max(vector.values())
+        planes = self._planes
+        total = 0
+        accumulated = 0
+        for slot, weight in vector.items():
+            level = max(1, round(WEIGHT_LEVELS * weight / top))
+            total += level
+            accumulated += level * planes[slot]
+        threshold = total // 2 + 1
+        return (accumulated + (_HALF - threshold) * _ONES) & _HIGH_BITS
+    
+    @staticmethod
+    def _table_keys(signature):
+        return [(signature >> (FIELD_BITS * LSH_BITS * table)) & _TABLE_MASK for table in range(LSH_TABLES)]
+    
+    @staticmethod
+    def _probes(key):
+        # 같은 버킷과 1비트만 다른 버킷까지 조회 (재현율 보완)
+        yield key
+        for bit in range(LSH_BITS):
+            yield key ^ (1 << (FIELD_BITS * bit + FIELD_BITS - 1))
+    
+    @staticmethod
+    def _cosine(left, right):
+        if len(left) > len(right):
+            left, right = right, left
+        return sum(weight * right.get(slot, 0.0) for slot, weight in left.items())
+
+
+related_music_index = RelatedMusicIndex()
@@ -0,0 +1,187 @@
+import cProfile
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+import logging
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_PATH = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+class SamplingProfiler:
+    """한 스레드의 호출 스택을 주기적으로 수집하는 샘플링 프로파일러
+    
+    결과는 flamegraph.pl / speedscope에서 바로 읽을 수 있는 folded 형식
+    ("바깥;...;안쪽 샘플 수")으로 저장합니다.
+    """
+    
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-profiler-sampler', daemon=True)
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+    
+    def dump(self, path):
+        with open(path, 'w') as output:
+            for stack, count in self.samples.most_common():
+                output.write(f'{stack} {count}\n')
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+
+
+class ProfiledResponse:
+    """응답 본문을 모두 보낸 뒤(close) 프로파일링을 끝내는 WSGI 응답 래퍼
+    
+    스트리밍 응답은 뷰 함수가 반환된 뒤 본문을 만들므로, 서버가 close()를 호출할 때까지
+    프로파일링을 유지해야 본문 생성 시간이 포함됩니다.
+    """
+    
+    def __init__(self, iterable, finish):
+        self._iterable = iterable
+        self._finish = finish
+    
+    def __iter__(self):
+        yield from self._iterable
+    
+    def close(self):
+        try:
+            close = getattr(self._iterable, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            self._finish()
+
+
+class ProfilingMiddleware:
+    """선택된 요청만 프로파일링하는 WSGI 미들웨어"""
+    
+    def __init__(self, wsgi_app, profiler):
+        self.wsgi_app = wsgi_app
+        self.profiler = profiler
+    
+    def __call__(self, environ, start_response):
+        if not self.profiler.should_profile(environ):
+            return self.wsgi_app(environ, start_response)
+        return self.profiler.profile(self.wsgi_app, environ, start_response)
+
+
+class RequestProfiler:
+    """요청 단위 온디맨드 프로파일러
+    
+    PROFILER_ENABLED일 때만 WSGI 미들웨어를 끼워 넣으므로, 꺼져 있으면 요청 처리 경로에
+    아무 코드도 추가되지 않습니다.
+    
+    PROFILER_HEADER 헤더 값이 PROFILER_TOKEN과 일치하는 요청, 또는 PROFILER_SAMPLE_RATE
+    비율로 무작위 선택된 요청을 프로파일링하여 PROFILER_DIR에 저장합니다.
+    - sampling (기본): 스택 샘플링 결과를 folded 형식(.folded)으로 저장 (flamegraph.pl, speedscope)
+    - cprofile: cProfile 결과를 pstats 형식(.prof)으로 저장 (snakeviz, flameprof)
+    저장한 파일 이름은 X-Profile-Id 응답 헤더로 알려줍니다.
+    """
+    
+    def __init__(self, app=None):
+        self.app = None
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('PROFILER_ENABLED', False)
+        app.extensions['request_profiler'] = self
+        
+        if not self.enabled:
+            return
+        
+        self.token = app.config.get('PROFILER_TOKEN')
+        self.header_key = 'HTTP_' + app.config.get('PROFILER_HEADER', 'X-Profile').upper().replace('-', '_')
+        self.sample_rate = app.config.get('PROFILER_SAMPLE_RATE', 0.0)
+        self.mode = app.config.get('PROFILER_MODE', 'sampling')
+        self.interval = app.config.get('PROFILER_INTERVAL_MS', 5) / 1000
+        self.output_dir = app.config.get('PROFILER_DIR') or os.path.join(app.instance_path, 'profiles')
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        app.wsgi_app = ProfilingMiddleware(app.wsgi_app, self)
+        logger.warning(f"요청 프로파일러 활성화: mode={self.mode}, sample_rate={self.sample_rate}, "
+                       f"dir={self.output_dir}")
+    
+    def should_profile(self, environ):
+        """프로파일링할 요청인지 판단 (토큰 헤더 또는 샘플링 비율)"""
+        header = environ.get(self.header_key)
+        if header is not None:
+            if self.token and hmac.compare_digest(header.encode(), self.token.encode()):
+                return True
+            logger.warning(f"프로파일링 요청 거부 (토큰 불일치): {environ.get('PATH_INFO')}")
+            return False
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+    
+    def profile(self, wsgi_app, environ, start_response):
+        """요청 하나를 프로파일링하여 파일로 저장 (응답 본문을 모두 보낸 뒤 저장)"""
+        path = self._output_path(environ)
+        profile_id = os.path.basename(path)
+        
+        def start_response_with_id(status, headers, exc_info=None):
+            headers.append(('X-Profile-Id', profile_id))
+            return start_response(status, headers, exc_info)
+        
+        if self.mode == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = SamplingProfiler(threading.get_ident(), self.interval)
+            profiler.start()
+        
+        started = time.perf_counter()
+        
+        def finish():
+            elapsed = time.perf_counter() - started
+            if self.mode == 'cprofile':
+                profiler.disable()
+                profiler.dump_stats(path)
+            else:
+                profiler.stop()
+                profiler.dump(path)
+            logger.info(f"요청 프로파일 저장: {environ.get('REQUEST_METHOD')} {environ.get('PATH_INFO')} "
+                        f"{elapsed * 1000:.1f}ms -> {path}")
+        
+        try:
+            iterable = wsgi_app(environ, start_response_with_id)
+        except BaseException:
+            finish()
+            raise
+        return ProfiledResponse(iterable, finish)
+    
+    def _output_path(self, environ):
+        # 시각_메서드_경로_pid_uuid.확장자 (같은 밀리초에 여러 스레드/워커가 저장해도 겹치지 않음)
+        route = _UNSAFE_PATH.sub('_', environ.get('PATH_INFO', '').strip('/'))[:80] or 'root'
+        extension = 'prof' if self.mode == 'cprofile' else 'folded'
+        filename = (f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}_"
+                    f"{environ.get('REQUEST_METHOD', 'GET')}_{route}_{os.getpid()}_{uuid.uuid4().hex}.{extension}")
+        return os.path.join(self.output_dir, filename)
+
+
+request_profiler = RequestProfiler()
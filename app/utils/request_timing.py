@@ -0,0 +1,171 @@
+import json
+import time
+from functools import wraps
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import logging
+
+access_logger = logging.getLogger('app.access')
+
+# Server-Timing 헤더에 내보낼 구간 순서 (헤더 값은 latin-1이므로 설명은 영문)
+PHASE_DESCRIPTIONS = {
+    'auth': 'JWT verification',
+    'db': 'SQL',
+    'ai': 'AI server',
+    's3': 'S3',
+    'serialize': 'JSON serialization'
+}
+
+# 구간 측정 결과를 받는 함수 목록 (메트릭 수집 등)
+_phase_observers = []
+
+
+def _current_timings():
+    # 요청 구간 기록이 활성화된 요청 안에서만 기록
+    if not has_request_context():
+        return None
+    return g.get('_server_timing')
+
+
+def record_phase(name, seconds):
+    """현재 요청의 구간 소요 시간 누적 (요청 밖이거나 비활성화 시 무시)"""
+    timings = _current_timings()
+    if timings is None:
+        return
+    entry = timings.get(name)
+    if entry is None:
+        timings[name] = [seconds, 1]
+    else:
+        entry[0] += seconds
+        entry[1] += 1
+
+
+def add_phase_observer(observer):
+    """구간 측정 결과를 받을 함수 등록 (요청 밖의 호출도 전달)
+    
+    Args:
+        observer: observer(구간, 작업 이름, 소요 시간(초), 실패 여부) 형태의 함수
+    """
+    if observer not in _phase_observers:
+        _phase_observers.append(observer)
+
+
+def timed_phase(name, operation=None):
+    """함수 실행 시간을 현재 요청의 구간으로 기록하는 데코레이터
+    
+    같은 구간 안에서 다시 호출되는 함수(예: 업로드 중 HEAD 확인)는 요청 구간에 중복 집계하지 않습니다.
+    
+    Args:
+        name: 구간 이름 (auth, ai, s3 등)
+        operation: 관찰자에게 전달할 작업 이름 (없으면 함수 이름, 함수를 주면 호출 인자로 계산)
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            timings = _current_timings()
+            nested = timings is not None and name in g._server_timing_active
+            if (timings is None or nested) and not _phase_observers:
+                return f(*args, **kwargs)
+            
+            if timings is not None and not nested:
+                g._server_timing_active.add(name)
+            started = time.perf_counter()
+            failed = True
+            try:
+                result = f(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed = time.perf_counter() - started
+                if timings is not None and not nested:
+                    g._server_timing_active.discard(name)
+                    record_phase(name, elapsed)
+                if _phase_observers:
+                    label = operation(*args, **kwargs) if callable(operation) else operation or f.__name__
+                    for observer in _phase_observers:
+                        observer(name, label, elapsed, failed)
+        return wrapper
+    return decorator
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_timings() is not None:
+        context._server_timing_started = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_server_timing_started', None)
+    if started is not None:
+        record_phase('db', time.perf_counter() - started)
+
+
+class RequestTiming:
+    """요청별 구간 소요 시간 측정
+    
+    인증, SQL 실행, AI 서버 호출, S3 호출, 응답 직렬화 시간을 요청마다 누적하여
+    Server-Timing 응답 헤더와 한 줄짜리 JSON 접근 로그(app.access 로거)로 남깁니다.
+    """
+    
+    def __init__(self, app=None):
+        self.app = None
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.header_enabled = app.config.get('SERVER_TIMING_ENABLED', False)
+        self.access_log_enabled = app.config.get('ACCESS_LOG_ENABLED', True)
+        app.extensions['request_timing'] = self
+        
+        if self.header_enabled or self.access_log_enabled:
+            app.before_request(self._start)
+            app.after_request(self._finish)
+    
+    @staticmethod
+    def _start():
+        g._server_timing = {}
+        g._server_timing_active = set()
+        g._server_timing_started = time.perf_counter()
+    
+    def _finish(self, response):
+        timings = g.pop('_server_timing', None)
+        if timings is None:
+            return response
+        total = time.perf_counter() - g._server_timing_started
+        
+        if self.header_enabled:
+            response.headers['Server-Timing'] = self._header_value(timings, total)
+        
+        if self.access_log_enabled:
+            access_logger.info(json.dumps({
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'duration_ms': round(total * 1000, 2),
+                'phases': {name: round(seconds * 1000, 2) for name, (seconds, _) in timings.items()},
+                'db_queries': timings.get('db', (0, 0))[1],
+                'remote_addr': request.remote_addr
+            }, ensure_ascii=False))
+        
+        return response
+    
+    @staticmethod
+    def _header_value(timings, total):
+        metrics = []
+        for name, description in PHASE_DESCRIPTIONS.items():
+            if name not in timings:
+                continue
+            seconds, count = timings[name]
+            if name == 'db':
+                description = f"SQL ({count})"
+            metrics.append(f'{name};dur={seconds * 1000:.2f};desc="{description}"')
+        metrics.append(f'total;dur={total * 1000:.2f}')
+        return ', '.join(metrics)
+
+
+request_timing = RequestTiming()
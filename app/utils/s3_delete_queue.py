@@ -0,0 +1,159 @@
+import os
+import threading
+from datetime import datetime, timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+# DeleteObjects 한 번에 보낼 최대 키 수 (S3 제한)
+DELETE_BATCH_SIZE = 1000
+
+
+class S3DeleteQueue:
+    """S3 객체 삭제 큐
+    
+    삭제할 객체 키를 s3_delete_queue_tb에 기록해 두고(호출한 쪽의 트랜잭션과 함께 커밋),
+    워커 프로세스별 백그라운드 스레드가 S3_DELETE_QUEUE_INTERVAL_SECONDS마다
+    최대 1000개씩 DeleteObjects로 묶어 삭제합니다.
+    
+    실패한 키는 지수 백오프로 재시도하고, S3_DELETE_MAX_ATTEMPTS번 실패하면
+    dead 상태로 남겨 수동으로 확인할 수 있게 합니다 (flask s3-delete-queue --retry-dead).
+    """
+    
+    def __init__(self, app=None):
+        self.app = None
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('S3_DELETE_QUEUE_ENABLED', True)
+        self.interval = app.config.get('S3_DELETE_QUEUE_INTERVAL_SECONDS', 10)
+        self.max_attempts = app.config.get('S3_DELETE_MAX_ATTEMPTS', 8)
+        self.lease_seconds = app.config.get('S3_DELETE_LEASE_SECONDS', 300)
+        app.extensions['s3_delete_queue'] = self
+        
+        if self.enabled:
+            # 이전 프로세스가 남긴 작업도 처리되도록 요청이 들어오면 워커 시작
+            app.before_request(self._ensure_worker)
+    
+    def enqueue(self, object_keys):
+        """삭제할 객체 키 추가 (커밋은 호출한 쪽에서)
+        
+        Args:
+            object_keys: 삭제할 S3 객체 키 목록
+        
+        Returns:
+            추가한 작업 수
+        """
+        from app.models.s3_delete_job import S3DeleteJob
+        
+        count = S3DeleteJob.enqueue(object_keys)
+        if count and self.enabled:
+            self._ensure_worker()
+        return count
+    
+    def wakeup(self):
+        """다음 주기를 기다리지 않고 바로 처리하도록 알림 (커밋 이후 호출)"""
+        self._wakeup.set()
+    
+    def drain(self, max_batches=None):
+        """처리할 시각이 된 작업을 DeleteObjects 단위로 처리
+        
+        Args:
+            max_batches: 최대 처리 배치 수 (없으면 처리할 작업이 없을 때까지)
+        
+        Returns:
+            (삭제 완료 수, 실패 수) 튜플
+        """
+        from app import db
+        from app.models.s3_delete_job import S3DeleteJob
+        
+        deleted = failed = batches = 0
+        with self.app.app_context():
+            try:
+                while max_batches is None or batches < max_batches:
+                    jobs = S3DeleteJob.claim_due(DELETE_BATCH_SIZE, self.lease_seconds)
+                    if not jobs:
+                        break
+                    batches += 1
+                    
+                    batch_deleted, batch_failed = self._process(jobs)
+                    deleted += batch_deleted
+                    failed += batch_failed
+                    
+                    if len(jobs) < DELETE_BATCH_SIZE:
+                        break
+            finally:
+                db.session.remove()
+        
+        if deleted or failed:
+            logger.info(f"S3 삭제 큐 처리: 삭제 {deleted}건, 실패 {failed}건")
+        return deleted, failed
+    
+    def _process(self, jobs):
+        from app import db
+        from app.models.s3_delete_job import S3DeleteJob
+        from app.utils.s3_uploader import S3Uploader
+        
+        # 같은 키가 여러 번 들어와도 한 번만 요청
+        keys = list(dict.fromkeys(key for _, key, _ in jobs))
+        try:
+            errors = S3Uploader.delete_objects(keys)
+        except Exception as e:
+            logger.warning(f"S3 일괄 삭제 요청 실패 (재시도 예약): {str(e)}")
+            errors = {key: str(e) for key in keys}
+        
+        now = datetime.utcnow()
+        completed = []
+        try:
+            for job_id, key, attempts in jobs:
+                if key not in errors:
+                    completed.append(job_id)
+                    continue
+                attempts += 1
+                if attempts >= self.max_attempts:
+                    logger.error(f"S3 객체 삭제 최종 실패 (dead): {key}, {errors[key]}")
+                S3DeleteJob.fail(job_id, attempts, errors[key], now + self._backoff(attempts),
+                                 self.max_attempts)
+            S3DeleteJob.complete(completed)
+            db.session.commit()
+        except Exception:
+            # 결과를 기록하지 못한 작업은 임대가 끝난 뒤 다시 처리됨 (삭제는 멱등)
+            db.session.rollback()
+            raise
+        
+        return len(completed), len(jobs) - len(completed)
+    
+    def _backoff(self, attempts):
+        # 주기 * 2^(시도 횟수 - 1), 최대 1시간
+        return timedelta(seconds=min(self.interval * 2 ** (attempts - 1), 3600))
+    
+    def _ensure_worker(self):
+        # fork 이후에는 부모 프로세스의 스레드가 없으므로 프로세스마다 새로 시작
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._wakeup = threading.Event()
+            self._thread = threading.Thread(target=self._run, name='s3-delete-drainer', daemon=True)
+            self._thread.start()
+    
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.drain()
+            except Exception as e:
+                logger.error(f"S3 삭제 큐 처리 스레드 오류: {str(e)}")
+
+
+s3_delete_queue = S3DeleteQueue()
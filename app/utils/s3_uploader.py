@@ -1,22 +1,216 @@
 import boto3
+import hashlib
+import threading
 import uuid
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
 from flask import current_app
 from werkzeug.utils import secure_filename
+from app.utils.ttl_cache import TTLCache
+from app.utils.request_timing import timed_phase
 import os
+import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+# DeleteObjects 요청 하나에 넣을 수 있는 최대 키 수
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+# 직접 업로드 경로 수명 주기 규칙 ID (같은 ID의 규칙만 교체)
+UPLOAD_LIFECYCLE_RULE_ID = 'expire-direct-uploads'
+
+# 프로세스별 S3 클라이언트 (boto3 클라이언트는 스레드 안전, 세션 생성은 아님)
+_client_lock = threading.Lock()
+_clients = {}
+
+# 내용 주소 모드로 존재를 확인한 객체 키 -> 크기 (워커별, HEAD 요청 생략용)
+_digest_index = TTLCache(maxsize=10000)
+
+# 내용 주소 모드 객체 키의 파일명 (<SHA-256><확장자>)
+_CONTENT_ADDRESSED_NAME = re.compile(r'^[0-9a-f]{64}(\.\w+)?$')
+
 class S3Uploader:
     """S3 파일 업로드 유틸리티"""
     
     @staticmethod
-    def upload_file_to_s3(file, folder="general"):
+    def get_client():
+        """S3 클라이언트 조회 (프로세스별로 한 번 생성하여 연결 풀 재사용)
+        
+        S3_ENDPOINT_URL을 설정하면 로컬 S3 호환 서버를 사용합니다.
+        
+        Returns:
+            boto3 S3 클라이언트
+        """
+        config = current_app.config
+        key = (
+            os.getpid(),
+            config.get('S3_ENDPOINT_URL'),
+            config.get('AWS_REGION', 'ap-northeast-2'),
+            config.get('AWS_ACCESS_KEY')
+        )
+        
+        client = _clients.get(key)
+        if client is None:
+            with _client_lock:
+                client = _clients.get(key)
+                if client is None:
+                    # fork 이전 프로세스의 클라이언트는 연결을 공유하지 않도록 버림
+                    for cached_key in [cached_key for cached_key in _clients if cached_key[0] != key[0]]:
+                        del _clients[cached_key]
+                    
+                    session = boto3.session.Session(
+                        aws_access_key_id=config.get('AWS_ACCESS_KEY'),
+                        aws_secret_access_key=config.get('AWS_SECRET_KEY'),
+                        region_name=key[2]
+                    )
+                    client = session.client(
+                        's3',
+                        endpoint_url=key[1],
+                        config=BotoConfig(
+                            max_pool_connections=config.get('S3_MAX_POOL_CONNECTIONS', 32),
+                            retries={'max_attempts': 3, 'mode': 'standard'}
+                        )
+                    )
+                    _clients[key] = client
+        return client
+    
+    @staticmethod
+    def get_transfer_config():
+        """큰 파일을 여러 파트로 나누어 동시에 올리는 전송 설정"""
+        config = current_app.config
+        return TransferConfig(
+            multipart_threshold=config.get('S3_MULTIPART_THRESHOLD_MB', 8) * MB,
+            multipart_chunksize=config.get('S3_MULTIPART_CHUNKSIZE_MB', 8) * MB,
+            max_concurrency=config.get('S3_MAX_CONCURRENCY', 8)
+        )
+    
+    @staticmethod
+    @timed_phase('s3')
+    def create_presigned_upload(folder, filename, content_type, max_size, method='POST'):
+        """클라이언트가 S3에 직접 업로드할 presigned URL 생성
+        
+        POST는 정책 조건으로 Content-Type과 크기 범위를 S3가 직접 검사하고,
+        PUT은 서명된 Content-Type만 강제하므로 크기는 사용 시점에 head_object()로 확인합니다.
+        
+        Args:
+            folder: S3 내 저장할 폴더 경로
+            filename: 원본 파일명
+            content_type: 업로드할 파일의 Content-Type
+            max_size: 허용할 최대 파일 크기 (바이트)
+            method: 'POST' 또는 'PUT'
+        
+        Returns:
+            업로드 방식, URL, 폼 필드/헤더, 객체 키, 만료 시간(초)을 담은 딕셔너리
+        """
+        config = current_app.config
+        s3_client = S3Uploader.get_client()
+        bucket = config['S3_BUCKET_NAME']
+        expires_in = config.get('S3_UPLOAD_URL_EXPIRES_SECONDS', 600)
+        object_key = f"{folder}/{uuid.uuid4().hex}_{secure_filename(filename)}"
+        
+        if method == 'PUT':
+            url = s3_client.generate_presigned_url(
+                'put_object',
+                Params={
+                    'Bucket': bucket,
+                    'Key': object_key,
+                    'ContentType': content_type
+                },
+                ExpiresIn=expires_in
+            )
+            upload = {
+                'method': 'PUT',
+                'url': url,
+                'headers': {'Content-Type': content_type}
+            }
+        else:
+            presigned = s3_client.generate_presigned_post(
+                Bucket=bucket,
+                Key=object_key,
+                Fields={'Content-Type': content_type},
+                Conditions=[
+                    {'Content-Type': content_type},
+                    ['content-length-range', 1, max_size]
+                ],
+                ExpiresIn=expires_in
+            )
+            upload = {
+                'method': 'POST',
+                'url': presigned['url'],
+                'fields': presigned['fields']
+            }
+        
+        upload['objectKey'] = object_key
+        upload['expiresIn'] = expires_in
+        logger.info(f"S3 presigned 업로드 URL 발급: {method} {object_key}")
+        return upload
+    
+    @staticmethod
+    @timed_phase('s3')
+    def head_object(object_key):
+        """S3 객체 메타데이터 조회
+        
+        Args:
+            object_key: 조회할 객체 키
+        
+        Returns:
+            크기와 Content-Type을 담은 딕셔너리, 객체가 없으면 None
+        """
+        try:
+            response = S3Uploader.get_client().head_object(
+                Bucket=current_app.config['S3_BUCKET_NAME'],
+                Key=object_key
+            )
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+        
+        return {
+            'size': response['ContentLength'],
+            'content_type': response.get('ContentType')
+        }
+    
+    @staticmethod
+    @timed_phase('s3')
+    def create_presigned_download_url(object_key, expires_in=None):
+        """S3 객체를 읽을 수 있는 presigned GET URL 생성
+        
+        Args:
+            object_key: 읽을 객체 키
+            expires_in: 만료 시간(초), 없으면 S3_MEDIA_URL_EXPIRES_SECONDS
+        
+        Returns:
+            presigned GET URL
+        """
+        config = current_app.config
+        return S3Uploader.get_client().generate_presigned_url(
+            'get_object',
+            Params={
+                'Bucket': config['S3_BUCKET_NAME'],
+                'Key': object_key
+            },
+            ExpiresIn=expires_in or config.get('S3_MEDIA_URL_EXPIRES_SECONDS', 3600)
+        )
+    
+    @staticmethod
+    @timed_phase('s3')
+    def upload_file_to_s3(file, folder="general", content_addressed=None):
         """파일을 S3에 업로드하고 URL 반환
         
+        내용 주소 모드에서는 파일을 한 번 읽어 SHA-256을 계산하고 다이제스트를 객체 키로
+        사용합니다. 같은 내용의 객체가 이미 있으면 (워커별 다이제스트 색인, 없으면 HEAD로 확인)
+        업로드를 생략하고 기존 URL을 반환합니다. 같은 객체를 여러 음악이 참조할 수 있으므로
+        삭제할 때는 다른 음악이 아직 참조하는지 확인합니다 (is_content_addressed_key).
+        
         Args:
             file: 업로드할 파일 객체
             folder: S3 내 저장할 폴더 경로
+            content_addressed: 내용 주소 모드 사용 여부 (없으면 S3_CONTENT_ADDRESSED_UPLOADS)
             
         Returns:
             업로드된 파일의 URL
@@ -28,18 +222,28 @@ class S3Uploader:
             logger.error("업로드할 파일이 없습니다.")
             return None
         
+        if content_addressed is None:
+            content_addressed = current_app.config.get('S3_CONTENT_ADDRESSED_UPLOADS', False)
+        # 다시 읽을 수 없는 스트림은 다이제스트를 먼저 계산할 수 없으므로 기존 방식으로 업로드
+        content_addressed = content_addressed and file.seekable()
+        
         try:
-            # S3 클라이언트 생성
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=current_app.config['AWS_ACCESS_KEY'],
-                aws_secret_access_key=current_app.config['AWS_SECRET_KEY'],
-                region_name=current_app.config.get('AWS_REGION', 'ap-northeast-2')
-            )
+            s3_client = S3Uploader.get_client()
             
             # 파일명 안전하게 변경 및 유니크한 이름 생성
             filename = secure_filename(file.filename)
-            unique_filename = f"{folder}/{uuid.uuid4().hex}_{filename}"
+            if content_addressed:
+                digest, size = S3Uploader._sha256(file)
+                extension = os.path.splitext(filename)[1].lower()
+                unique_filename = f"{folder}/{digest}{extension}"
+                
+                # 같은 내용이 이미 있으면 업로드 생략
+                if S3Uploader._digest_object_exists(unique_filename, size):
+                    s3_url = f"{current_app.config['S3_URL']}/{unique_filename}"
+                    logger.info(f"S3 업로드 생략 (같은 내용 존재): {filename} -> {s3_url}")
+                    return s3_url
+            else:
+                unique_filename = f"{folder}/{uuid.uuid4().hex}_{filename}"
             
             logger.info(f"S3 업로드 시작: {filename} -> {unique_filename}")
             
@@ -51,9 +255,13 @@ class S3Uploader:
                 ExtraArgs={
                     'ACL': 'public-read',
                     'ContentType': file.content_type
-                }
+                },
+                Config=S3Uploader.get_transfer_config()
             )
             
+            if content_addressed:
+                S3Uploader._remember_digest(unique_filename, size)
+            
             # S3 URL 생성
             s3_url = f"{current_app.config['S3_URL']}/{unique_filename}"
             logger.info(f"S3 업로드 완료: {s3_url}")
@@ -65,6 +273,7 @@ class S3Uploader:
             raise Exception(f"S3 업로드 실패: {str(e)}")
     
     @staticmethod
+    @timed_phase('s3')
     def delete_file_from_s3(file_url):
         """S3에서 파일 삭제
         
@@ -79,20 +288,19 @@ class S3Uploader:
         """
         try:
             # URL에서 키 추출
-            s3_base_url = current_app.config['S3_URL']
-            if not file_url or not file_url.startswith(s3_base_url):
+            s3_key = S3Uploader.object_key_from_url(file_url)
+            if not s3_key:
                 logger.warning(f"올바르지 않은 S3 URL: {file_url}")
                 return False
             
-            s3_key = file_url.replace(f"{s3_base_url}/", "")
+            # 내용 주소 객체는 다른 음악이 같은 객체를 참조할 수 있음
+            if S3Uploader.is_content_addressed_key(s3_key):
+                from app.models.music import Music
+                if Music.is_url_referenced(file_url):
+                    logger.info(f"S3 파일 삭제 생략 (다른 음악이 참조 중): {s3_key}")
+                    return False
             
-            # S3 클라이언트 생성
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=current_app.config['AWS_ACCESS_KEY'],
-                aws_secret_access_key=current_app.config['AWS_SECRET_KEY'],
-                region_name=current_app.config.get('AWS_REGION', 'ap-northeast-2')
-            )
+            s3_client = S3Uploader.get_client()
             
             logger.info(f"S3 파일 삭제 시작: {s3_key}")
             
@@ -101,10 +309,130 @@ class S3Uploader:
                 Bucket=current_app.config['S3_BUCKET_NAME'],
                 Key=s3_key
             )
+            _digest_index.pop(s3_key)
             
             logger.info(f"S3 파일 삭제 완료: {file_url}")
             return True
             
         except Exception as e:
             logger.error(f"S3 파일 삭제 실패: {str(e)}")
-            raise Exception(f"S3 파일 삭제 실패: {str(e)}")
\ No newline at end of file
+            raise Exception(f"S3 파일 삭제 실패: {str(e)}")
+    
+    @staticmethod
+    @timed_phase('s3')
+    def delete_objects(object_keys):
+        """S3 객체 일괄 삭제 (DeleteObjects 한 번에 최대 1000개)
+        
+        Args:
+            object_keys: 삭제할 객체 키 목록 (최대 1000개)
+        
+        Returns:
+            삭제에 실패한 {객체 키: 오류 메시지} 딕셔너리
+        
+        Raises:
+            ClientError: 요청 자체가 실패한 경우
+        """
+        if not object_keys:
+            return {}
+        if len(object_keys) > DELETE_OBJECTS_MAX_KEYS:
+            raise ValueError(f"한 번에 최대 {DELETE_OBJECTS_MAX_KEYS}개까지 삭제할 수 있습니다.")
+        
+        # Quiet 모드는 실패한 키만 응답에 포함
+        response = S3Uploader.get_client().delete_objects(
+            Bucket=current_app.config['S3_BUCKET_NAME'],
+            Delete={
+                'Objects': [{'Key': key} for key in object_keys],
+                'Quiet': True
+            }
+        )
+        
+        for key in object_keys:
+            _digest_index.pop(key)
+        
+        return {
+            error['Key']: f"{error.get('Code')}: {error.get('Message')}"
+            for error in response.get('Errors', [])
+        }
+    
+    @staticmethod
+    def put_upload_lifecycle_rule(prefix, expiration_days):
+        """직접 업로드 경로의 객체를 일정 기간 후 만료시키는 버킷 수명 주기 규칙 설정
+        
+        presigned URL로 올렸지만 음악 생성에 쓰이지 않은 객체와 완료되지 않은
+        멀티파트 업로드를 정리합니다. 버킷의 다른 규칙은 그대로 유지합니다.
+        
+        Args:
+            prefix: 규칙을 적용할 객체 키 접두사
+            expiration_days: 만료까지의 일수 (1 이상)
+        
+        Returns:
+            설정한 규칙
+        """
+        s3_client = S3Uploader.get_client()
+        bucket = current_app.config['S3_BUCKET_NAME']
+        
+        try:
+            rules = s3_client.get_bucket_lifecycle_configuration(Bucket=bucket)['Rules']
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'NoSuchLifecycleConfiguration':
+                raise
+            rules = []
+        
+        rule = {
+            'ID': UPLOAD_LIFECYCLE_RULE_ID,
+            'Filter': {'Prefix': prefix},
+            'Status': 'Enabled',
+            'Expiration': {'Days': expiration_days},
+            'AbortIncompleteMultipartUpload': {'DaysAfterInitiation': 1}
+        }
+        rules = [existing for existing in rules if existing.get('ID') != UPLOAD_LIFECYCLE_RULE_ID]
+        rules.append(rule)
+        
+        s3_client.put_bucket_lifecycle_configuration(
+            Bucket=bucket,
+            LifecycleConfiguration={'Rules': rules}
+        )
+        logger.info(f"S3 업로드 수명 주기 규칙 설정: {prefix} {expiration_days}일")
+        return rule
+    
+    @staticmethod
+    def object_key_from_url(file_url):
+        """S3 URL에서 객체 키 추출 (이 버킷의 URL이 아니면 None)"""
+        s3_base_url = current_app.config.get('S3_URL')
+        if not file_url or not s3_base_url or not file_url.startswith(f"{s3_base_url}/"):
+            return None
+        return file_url[len(s3_base_url) + 1:] or None
+    
+    @staticmethod
+    def is_content_addressed_key(object_key):
+        """내용 주소 모드로 올린 객체 키인지 확인 (같은 객체를 여러 음악이 공유할 수 있음)"""
+        return bool(object_key) and bool(_CONTENT_ADDRESSED_NAME.match(object_key.rsplit('/', 1)[-1]))
+    
+    @staticmethod
+    def _sha256(file):
+        # 파일을 청크 단위로 한 번 읽어 다이제스트 계산 후 처음 위치로 되돌림
+        sha256 = hashlib.sha256()
+        size = 0
+        file.seek(0)
+        for chunk in iter(lambda: file.read(MB), b''):
+            sha256.update(chunk)
+            size += len(chunk)
+        file.seek(0)
+        return sha256.hexdigest(), size
+    
+    @staticmethod
+    def _digest_object_exists(object_key, size):
+        # 워커별 다이제스트 색인에 없으면 HEAD로 확인 (중단된 업로드 등 크기가 다르면 다시 업로드)
+        if _digest_index.get(object_key) == size:
+            return True
+        
+        metadata = S3Uploader.head_object(object_key)
+        if metadata is None or metadata['size'] != size:
+            return False
+        
+        S3Uploader._remember_digest(object_key, size)
+        return True
+    
+    @staticmethod
+    def _remember_digest(object_key, size):
+        _digest_index.set(object_key, size, ttl=current_app.config.get('S3_DIGEST_INDEX_TTL_SECONDS', 3600))
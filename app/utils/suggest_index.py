@@ -0,0 +1,228 @@
+import bisect
+import heapq
+import unicodedata
+from collections import OrderedDict, defaultdict
+from app.utils.per_worker_index import MusicIndex
+
+# 제목 중간 단어로도 찾을 수 있도록 색인하는 단어 시작 위치 수
+MAX_WORD_STARTS = 8
+
+# 접두사별로 유지하는 상위 추천 수 (요청 limit 최대값)
+TOP_K = 20
+
+# 이 길이 이하의 접두사는 후보가 많으므로 상위 목록을 항상 유지
+SHORT_PREFIX_LENGTH = 2
+
+# 긴 접두사 추천 결과 캐시 크기
+PREFIX_CACHE_SIZE = 4096
+
+# 색인 키에서 단어 시작 부분과 정규화된 제목을 구분하는 문자
+KEY_SEPARATOR = '\x00'
+
+
+def normalize_title(title):
+    """검색용 제목 정규화 (유니코드 정규화, 소문자, 공백 정리)"""
+    return ' '.join(unicodedata.normalize('NFKC', title).lower().split())
+
+
+class TitleSuggestIndex(MusicIndex):
+    """음악 제목 자동완성용 접두사 색인
+    
+    정렬된 문자열 배열에 대한 이진 탐색으로 접두사를 찾습니다.
+    같은 제목(텍스트 생성 시 프롬프트가 제목이 됨)은 하나로 묶고,
+    좋아요 수 + 1을 합산한 가중치가 높은 순으로 추천합니다.
+    
+    워커 프로세스별로 music_tb를 스트리밍으로 읽어 백그라운드에서 만들고,
+    이후 Music 추가/삭제는 커밋 시점에 반영합니다. 좋아요 수 변화는
+    SUGGEST_INDEX_REFRESH_SECONDS 주기의 백그라운드 재구성으로 반영합니다.
+    """
+    
+    extension_name = 'title_suggest_index'
+    refresh_setting = 'SUGGEST_INDEX_REFRESH_SECONDS'
+    label = '제목 자동완성 색인'
+    
+    def __init__(self, app=None):
+        self._keys = []
+        self._groups = {}  # 정규화된 제목 -> [표시 제목, 가중치 합, 음악 수]
+        self._music = {}  # 음악 ID -> (정규화된 제목, 가중치)
+        self._top = {}  # 짧은 접두사 -> 상위 (가중치, 정규화된 제목) 목록
+        self._cache = OrderedDict()  # 긴 접두사 -> 상위 목록 (LRU)
+        super().__init__(app)
+    
+    def suggest(self, prefix, limit=10):
+        """접두사로 시작하는 제목 추천
+        
+        Args:
+            prefix: 입력 중인 검색어
+            limit: 최대 추천 수 (TOP_K 이하)
+        
+        Returns:
+            제목 문자열 목록 (가중치 순)
+        """
+        prefix = normalize_title(prefix)
+        if not prefix:
+            return []
+        
+        self.start()
+        
+        with self._lock:
+            if len(prefix) <= SHORT_PREFIX_LENGTH:
+                top = self._top.get(prefix)
+                if top is None:
+                    top = self._top[prefix] = self._scan(prefix)
+            else:
+                top = self._cache.get(prefix)
+                if top is None:
+                    top = self._cache[prefix] = self._scan(prefix)
+                    if len(self._cache) > PREFIX_CACHE_SIZE:
+                        self._cache.popitem(last=False)
+                else:
+                    self._cache.move_to_end(prefix)
+            
+            return [self._groups[normalized][0] for _, normalized in top[:limit]]
+    
+    def add(self, music_id, title, like_count=0):
+        """음악 추가 반영"""
+        with self._lock:
+            if music_id in self._music:
+                self.remove(music_id)
+            normalized = normalize_title(title)
+            if not normalized:
+                return
+            weight = like_count + 1
+            self._music[music_id] = (normalized, weight)
+            
+            group = self._groups.get(normalized)
+            if group:
+                group[1] += weight
+                group[2] += 1
+            else:
+                group = self._groups[normalized] = [title, weight, 1]
+                for key in self._index_keys(normalized):
+                    bisect.insort(self._keys, key)
+            
+            # 짧은 접두사의 상위 목록은 새 가중치로 갱신 (재탐색 없이)
+            entry = (group[1], normalized)
+            for prefix in self._short_prefixes(normalized):
+                top = self._top.get(prefix)
+                if top is None:
+                    continue
+                top = [item for item in top if item[1] != normalized]
+                top.append(entry)
+                top.sort(key=lambda item: (-item[0], item[1]))
+                self._top[prefix] = top[:TOP_K]
+            self._invalidate_long(normalized)
+    
+    def remove(self, music_id):
+        """음악 삭제 반영"""
+        with self._lock:
+            entry = self._music.pop(music_id, None)
+            if entry is None:
+                return
+            normalized, weight = entry
+            
+            group = self._groups[normalized]
+            group[1] -= weight
+            group[2] -= 1
+            if group[2] == 0:
+                del self._groups[normalized]
+                for key in self._index_keys(normalized):
+                    index = bisect.bisect_left(self._keys, key)
+                    if index < len(self._keys) and self._keys[index] == key:
+                        del self._keys[index]
+            
+            # 상위 목록에 있던 제목이면 다음 조회 때 다시 계산
+            for prefix in self._short_prefixes(normalized):
+                top = self._top.get(prefix)
+                if top is not None and any(item[1] == normalized for item in top):
+                    del self._top[prefix]
+            self._invalidate_long(normalized)
+    
+    def _load(self):
+        """music_tb 전체를 스트리밍으로 읽어 새 색인 구성"""
+        from app import db
+        from app.models.music import Music
+        
+        groups = {}
+        music = {}
+        rows = db.session.query(Music.id, Music.title, Music.like_count)\
+                         .execution_options(yield_per=1000)
+        for row in rows:
+            normalized = normalize_title(row.title)
+            if not normalized:
+                continue
+            weight = (row.like_count or 0) + 1
+            music[row.id] = (normalized, weight)
+            group = groups.setdefault(normalized, [row.title, 0, 0])
+            group[1] += weight
+            group[2] += 1
+        
+        keys = sorted(key for normalized in groups for key in self._index_keys(normalized))
+        
+        # 후보가 많은 짧은 접두사는 미리 상위 목록을 계산
+        buckets = defaultdict(set)
+        for key in keys:
+            suffix, normalized = key.split(KEY_SEPARATOR, 1)
+            for length in range(1, min(len(suffix), SHORT_PREFIX_LENGTH) + 1):
+                buckets[suffix[:length]].add(normalized)
+        top = {
+            prefix: self._rank(candidates, groups)
+            for prefix, candidates in buckets.items()
+        }
+        return keys, groups, music, top
+    
+    def _install(self, state):
+        self._keys, self._groups, self._music, self._top = state
+        self._cache.clear()
+    
+    def _apply_change(self, change):
+        if change.action == 'add':
+            self.add(change.music_id, change.title, change.like_count)
+        else:
+            self.remove(change.music_id)
+    
+    def _size(self):
+        return len(self._groups)
+    
+    def _scan(self, prefix):
+        keys = self._keys
+        candidates = set()
+        for index in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key = keys[index]
+            if not key.startswith(prefix):
+                break
+            candidates.add(key.split(KEY_SEPARATOR, 1)[1])
+        return self._rank(candidates, self._groups)
+    
+    @staticmethod
+    def _rank(candidates, groups):
+        # (가중치, 정규화된 제목) 목록 - 가중치 내림차순, 같으면 제목순
+        return heapq.nsmallest(TOP_K, ((groups[normalized][1], normalized) for normalized in candidates),
+                               key=lambda item: (-item[0], item[1]))
+    
+    def _short_prefixes(self, normalized):
+        prefixes = set()
+        for key in self._index_keys(normalized):
+            suffix = key.split(KEY_SEPARATOR, 1)[0]
+            for length in range(1, min(len(suffix), SHORT_PREFIX_LENGTH) + 1):
+                prefixes.add(suffix[:length])
+        return prefixes
+    
+    def _invalidate_long(self, normalized):
+        # 변경된 제목에 영향을 받는 긴 접두사 캐시만 제거
+        for key in self._index_keys(normalized):
+            suffix = key.split(KEY_SEPARATOR, 1)[0]
+            for length in range(SHORT_PREFIX_LENGTH + 1, len(suffix) + 1):
+                self._cache.pop(suffix[:length], None)
+    
+    @staticmethod
+    def _index_keys(normalized):
+        # 제목 전체와 각 단어 시작 위치를 키로 사용
+        words = normalized.split(' ')
+        keys = []
+        for index in range(min(len(words), MAX_WORD_STARTS)):
+            keys.append(' '.join(words[index:]) + KEY_SEPARATOR + normalized)
+        return keys
+
+
+title_suggest_index = TitleSuggestIndex()
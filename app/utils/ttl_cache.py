@@ -0,0 +1,51 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """스레드 안전한 크기 제한 LRU 캐시 (항목별 만료 시간)
+    
+    워커 프로세스 안에서만 공유되므로, 다른 워커의 변경은 만료 시간이
+    지나야 반영됩니다. 값이 바뀌는 쪽에서 pop()으로 무효화합니다.
+    """
+    
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # 키 -> (만료 시각, 값)
+    
+    def get(self, key, default=None):
+        """만료되지 않은 값 조회 (조회한 항목은 최근 사용으로 이동)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, value, ttl=None):
+        """값 저장 (ttl을 주면 이 항목만 다른 만료 시간 사용)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def pop(self, key, default=None):
+        """값 무효화"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[1]
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
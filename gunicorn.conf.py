@@ -0,0 +1,27 @@
+import os
+import shutil
+
+# Prometheus 지표를 워커 간에 합산하기 위한 공유 디렉터리
+# (prometheus_client를 불러오기 전에 설정되어야 하므로 앱보다 먼저 로드되는 이 파일에서 지정)
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus_multiproc')
+
+
+def on_starting(server):
+    """이전 실행에서 남은 지표 파일 정리"""
+    path = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 live 게이지 값 제거"""
+    from prometheus_client import multiprocess
+    
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    """워커가 앱을 불러온 직후 워커별 메모리 색인 구성 시작 (첫 요청을 기다리지 않도록 백그라운드에서)"""
+    from app.utils.per_worker_index import PerWorkerIndex
+    
+    PerWorkerIndex.start_all()
@@ -0,0 +1,43 @@
+"""add indexes for hot query paths
+
+Revision ID: 3f1a9c2e7b10
+Revises:
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c2e7b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 테이블, 컬럼 목록)
+INDEXES = [
+    ('ix_music_tb_created_at', 'music_tb', ['created_at']),
+    ('ix_mymusic_tb_member_id_created_at', 'mymusic_tb', ['member_id', 'created_at']),
+    ('ix_mymusic_tb_music_id_member_id', 'mymusic_tb', ['music_id', 'member_id']),
+    ('ix_like_tb_music_id', 'like_tb', ['music_id']),
+]
+
+
+def _existing_indexes(table_name):
+    inspector = sa.inspect(op.get_bind())
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade():
+    # db.create_all()로 만든 테이블에는 인덱스가 이미 있을 수 있으므로 없는 것만 생성
+    for name, table_name, columns in INDEXES:
+        if name not in _existing_indexes(table_name):
+            op.create_index(name, table_name, columns, unique=False)
+
+
+def downgrade():
+    for name, table_name, columns in reversed(INDEXES):
+        if name in _existing_indexes(table_name):
+            op.drop_index(name, table_name=table_name)
@@ -0,0 +1,34 @@
+"""add denormalized like_count to music_tb
+
+Revision ID: 8b2d4e6f1a23
+Revises: 3f1a9c2e7b10
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2d4e6f1a23'
+down_revision = '3f1a9c2e7b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('music_tb') as batch_op:
+        batch_op.add_column(sa.Column('like_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.create_index('ix_music_tb_like_count', ['like_count'], unique=False)
+
+    # 기존 좋아요 수 채우기
+    op.execute(
+        'UPDATE music_tb SET like_count = '
+        '(SELECT COUNT(*) FROM like_tb WHERE like_tb.music_id = music_tb.id)'
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('music_tb') as batch_op:
+        batch_op.drop_index('ix_music_tb_like_count')
+        batch_op.drop_column('like_count')
@@ -0,0 +1,38 @@
+"""add s3_delete_queue_tb for batched S3 object deletion
+
+Revision ID: a9c3e5f7b218
+Revises: f2b8d4a6c013
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c3e5f7b218'
+down_revision = 'f2b8d4a6c013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        's3_delete_queue_tb',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('object_key', sa.String(length=1024), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.String(length=1024), nullable=True),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_s3_delete_queue_tb_status_next_attempt_at', 's3_delete_queue_tb',
+                    ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_s3_delete_queue_tb_status_next_attempt_at', table_name='s3_delete_queue_tb')
+    op.drop_table('s3_delete_queue_tb')
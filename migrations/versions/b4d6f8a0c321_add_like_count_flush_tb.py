@@ -0,0 +1,32 @@
+"""add like_count_flush_tb for idempotent like count flushes
+
+Revision ID: b4d6f8a0c321
+Revises: a9c3e5f7b218
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4d6f8a0c321'
+down_revision = 'a9c3e5f7b218'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'like_count_flush_tb',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('journal_id', sa.String(length=64), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('journal_id', 'seq', name='unique_journal_seq')
+    )
+
+
+def downgrade():
+    op.drop_table('like_count_flush_tb')
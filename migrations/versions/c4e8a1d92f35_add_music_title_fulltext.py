@@ -0,0 +1,63 @@
+"""add full-text index on music_tb.title
+
+Revision ID: c4e8a1d92f35
+Revises: 8b2d4e6f1a23
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a1d92f35'
+down_revision = '8b2d4e6f1a23'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS music_fts USING fts5("
+    "title, content='music_tb', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS music_fts_ai AFTER INSERT ON music_tb BEGIN "
+    "INSERT INTO music_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER IF NOT EXISTS music_fts_ad AFTER DELETE ON music_tb BEGIN "
+    "INSERT INTO music_fts(music_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER IF NOT EXISTS music_fts_au AFTER UPDATE OF title ON music_tb BEGIN "
+    "INSERT INTO music_fts(music_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO music_fts(rowid, title) VALUES (new.id, new.title); END",
+    # 기존 제목으로 색인 재구성
+    "INSERT INTO music_fts(music_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS music_fts_au",
+    "DROP TRIGGER IF EXISTS music_fts_ad",
+    "DROP TRIGGER IF EXISTS music_fts_ai",
+    "DROP TABLE IF EXISTS music_fts",
+]
+
+
+def _fulltext_index_exists():
+    inspector = sa.inspect(op.get_bind())
+    return any(index['name'] == 'ft_music_tb_title' for index in inspector.get_indexes('music_tb'))
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    elif dialect == 'mysql' and not _fulltext_index_exists():
+        op.execute('CREATE FULLTEXT INDEX ft_music_tb_title ON music_tb (title) WITH PARSER ngram')
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    elif dialect == 'mysql' and _fulltext_index_exists():
+        op.drop_index('ft_music_tb_title', table_name='music_tb')
@@ -0,0 +1,51 @@
+"""add bigram full-text index for two-character title search
+
+Revision ID: c6e8f0a2d435
+Revises: b4d6f8a0c321
+Create Date: 2026-10-20 12:00:00.000000
+
+"""
+import re
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e8f0a2d435'
+down_revision = 'b4d6f8a0c321'
+branch_labels = None
+depends_on = None
+
+
+# app.models.music.title_bigrams와 같은 규칙 (마이그레이션 시점 동작 고정)
+_WORD = re.compile(r'[^\W_]+')
+
+
+def _title_bigrams(title):
+    bigrams = []
+    for word in _WORD.findall((title or '').lower()):
+        for index in range(len(word) - 1):
+            if word[index:index + 2] not in bigrams:
+                bigrams.append(word[index:index + 2])
+    return ' '.join(bigrams)
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS music_bigram_fts USING fts5("
+               "bigrams, tokenize='unicode61')")
+    # 기존 제목으로 색인 채우기
+    rows = bind.execute(sa.text('SELECT id, title FROM music_tb')).fetchall()
+    if rows:
+        bind.execute(
+            sa.text('INSERT INTO music_bigram_fts(rowid, bigrams) VALUES (:id, :bigrams)'),
+            [{'id': row.id, 'bigrams': _title_bigrams(row.title)} for row in rows]
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute('DROP TABLE IF EXISTS music_bigram_fts')
@@ -0,0 +1,35 @@
+"""add precomputed similar_music_tb
+
+Revision ID: d5f2b7c8e914
+Revises: c4e8a1d92f35
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5f2b7c8e914'
+down_revision = 'c4e8a1d92f35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'similar_music_tb',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('music_id', sa.Integer(), nullable=False),
+        sa.Column('similar_music_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['music_id'], ['music_tb.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['similar_music_id'], ['music_tb.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('music_id', 'rank', name='unique_music_rank')
+    )
+
+
+def downgrade():
+    op.drop_table('similar_music_tb')
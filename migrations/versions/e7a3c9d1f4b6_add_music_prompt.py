@@ -0,0 +1,26 @@
+"""add prompt to music_tb
+
+Revision ID: e7a3c9d1f4b6
+Revises: d5f2b7c8e914
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a3c9d1f4b6'
+down_revision = 'd5f2b7c8e914'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('music_tb') as batch_op:
+        batch_op.add_column(sa.Column('prompt', sa.String(length=1024), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('music_tb') as batch_op:
+        batch_op.drop_column('prompt')
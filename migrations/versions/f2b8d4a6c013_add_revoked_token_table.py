@@ -0,0 +1,34 @@
+"""add revoked_token_tb for logout
+
+Revision ID: f2b8d4a6c013
+Revises: e7a3c9d1f4b6
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b8d4a6c013'
+down_revision = 'e7a3c9d1f4b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'revoked_token_tb',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('jti', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('jti')
+    )
+    op.create_index('ix_revoked_token_tb_expires_at', 'revoked_token_tb', ['expires_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_revoked_token_tb_expires_at', table_name='revoked_token_tb')
+    op.drop_table('revoked_token_tb')
@@ -0,0 +1,101 @@
+import pytest
+from app import create_app, db as _db
+from app.config import TestingConfig
+from app.models.member import Member
+from app.models.music import Music
+
+
+@pytest.fixture
+def app():
+    """테스트마다 새 인메모리 SQLite DB를 쓰는 앱 (앱 컨텍스트 유지)"""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.session.remove()
+        _db.drop_all()
+
+
+@pytest.fixture
+def file_app(tmp_path):
+    """스레드마다 별도 연결을 쓰는 파일 SQLite 앱 (동시성 테스트용, 앱 컨텍스트 없음)
+    
+    인메모리 DB는 모든 스레드가 연결 하나를 공유하므로 실제 쓰기 경합을 재현하지 못합니다.
+    """
+    class FileDatabaseConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+    
+    app = create_app(FileDatabaseConfig)
+    with app.app_context():
+        _db.create_all()
+    yield app
+    with app.app_context():
+        _db.drop_all()
+        _db.engine.dispose()
+
+
+@pytest.fixture
+def db(app):
+    return _db
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_member(db):
+    """회원 생성 함수"""
+    def make_member(google_id='google-1', name='테스트 회원'):
+        member = Member(google_id, name)
+        db.session.add(member)
+        db.session.commit()
+        return member
+    return make_member
+
+
+@pytest.fixture
+def make_music(db):
+    """음악 생성 함수"""
+    def make_music(title='테스트 음악', music_url=None, prompt=None):
+        music = Music(music_url or f'https://bucket.s3.amazonaws.com/music/{title}.mp3', title, prompt)
+        db.session.add(music)
+        db.session.commit()
+        return music
+    return make_music
+
+
+@pytest.fixture
+def auth_headers(app):
+    """회원의 액세스 토큰을 담은 요청 헤더 생성 함수"""
+    from app.auth.token_auth import generate_token
+    
+    def auth_headers(member):
+        return {'Authorization': f'Bearer {generate_token(member)}'}
+    return auth_headers
+
+
+@pytest.fixture
+def s3_bucket(app):
+    """moto 가짜 S3 버킷을 쓰도록 S3 설정 (boto3 S3 클라이언트 반환)"""
+    from moto import mock_s3
+    from app.utils import s3_uploader
+    
+    app.config.update(
+        S3_BUCKET_NAME='test-bucket',
+        S3_URL='https://test-bucket.s3.amazonaws.com',
+        AWS_ACCESS_KEY='testing',
+        AWS_SECRET_KEY='testing',
+        AWS_REGION='us-east-1',
+        S3_ENDPOINT_URL=None
+    )
+    with mock_s3():
+        # 다른 테스트에서 만든 클라이언트와 다이제스트 색인은 쓰지 않음
+        s3_uploader._clients.clear()
+        s3_uploader._digest_index.clear()
+        client = s3_uploader.S3Uploader.get_client()
+        client.create_bucket(Bucket='test-bucket')
+        yield client
+        s3_uploader._clients.clear()
+        s3_uploader._digest_index.clear()
@@ -0,0 +1,55 @@
+import io
+from werkzeug.datastructures import FileStorage
+from app.models.s3_delete_job import S3DeleteJob
+from app.services.music_service import MusicService
+from app.utils.s3_uploader import S3Uploader
+
+
+def file_storage(data, filename='song.mp3', content_type='audio/mpeg'):
+    return FileStorage(io.BytesIO(data), filename=filename, content_type=content_type)
+
+
+def test_content_addressed_upload_skips_same_content(app, s3_bucket, monkeypatch):
+    first = S3Uploader.upload_file_to_s3(file_storage(b'same'), 'music', content_addressed=True)
+    
+    def fail_upload(*args, **kwargs):
+        raise AssertionError('같은 내용은 다시 업로드하지 않아야 합니다.')
+    monkeypatch.setattr(s3_bucket, 'upload_fileobj', fail_upload)
+    second = S3Uploader.upload_file_to_s3(file_storage(b'same', 'copy.mp3'), 'music', content_addressed=True)
+    
+    assert first == second
+    assert S3Uploader.is_content_addressed_key(S3Uploader.object_key_from_url(first))
+    assert s3_bucket.list_objects_v2(Bucket='test-bucket')['KeyCount'] == 1
+
+
+def test_uuid_named_key_is_not_content_addressed():
+    assert not S3Uploader.is_content_addressed_key('music/0123abcd_song.mp3')
+    assert not S3Uploader.is_content_addressed_key(None)
+
+
+def test_delete_keeps_object_shared_with_other_music(app, db, s3_bucket, make_member, make_music):
+    member = make_member()
+    url = S3Uploader.upload_file_to_s3(file_storage(b'same'), 'music', content_addressed=True)
+    first = make_music('첫 번째', music_url=url)
+    second = make_music('두 번째', music_url=url)
+    user_info = {'google_id': member.google_id}
+    
+    MusicService.delete_music_completely(first.id, user_info)
+    assert S3DeleteJob.query.count() == 0
+    
+    # 마지막으로 참조하던 음악을 지우면 객체도 삭제 대상
+    MusicService.delete_music_completely(second.id, user_info)
+    assert [job.object_key for job in S3DeleteJob.query.all()] == [S3Uploader.object_key_from_url(url)]
+
+
+def test_delete_file_skips_referenced_content_addressed_object(app, db, s3_bucket, make_music):
+    url = S3Uploader.upload_file_to_s3(file_storage(b'same'), 'music', content_addressed=True)
+    music = make_music(music_url=url)
+    
+    assert S3Uploader.delete_file_from_s3(url) is False
+    assert s3_bucket.list_objects_v2(Bucket='test-bucket')['KeyCount'] == 1
+    
+    db.session.delete(music)
+    db.session.commit()
+    assert S3Uploader.delete_file_from_s3(url) is True
+    assert s3_bucket.list_objects_v2(Bucket='test-bucket')['KeyCount'] == 0
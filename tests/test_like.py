@@ -0,0 +1,65 @@
+import threading
+import pytest
+from app import db as _db
+from app.models.like import Like
+from app.models.member import Member
+from app.models.music import Music
+from app.services.music_service import MusicService
+from app.utils.exceptions import DuplicateDataException, MusicNotFoundException
+
+
+def test_like_and_unlike_are_idempotent(db, make_member, make_music):
+    member = make_member()
+    music = make_music()
+    user_info = {'google_id': member.google_id}
+    
+    assert MusicService.like_music(music.id, user_info) is True
+    with pytest.raises(DuplicateDataException):
+        MusicService.like_music(music.id, user_info)
+    assert MusicService.unlike_music(music.id, user_info) is True
+    assert MusicService.unlike_music(music.id, user_info) is True
+    
+    assert Like.query.count() == 0
+    assert db.session.get(Music, music.id).like_count == 0
+
+
+def test_like_missing_music(db, make_member):
+    member = make_member()
+    with pytest.raises(MusicNotFoundException):
+        MusicService.like_music(12345, {'google_id': member.google_id})
+
+
+def test_concurrent_likes_on_same_pair_insert_once(file_app):
+    with file_app.app_context():
+        member = Member('google-race', '회원')
+        music = Music('https://bucket.s3.amazonaws.com/music/race.mp3', '경합')
+        _db.session.add_all([member, music])
+        _db.session.commit()
+        user_info, music_id = {'google_id': member.google_id}, music.id
+    
+    workers = 16
+    barrier = threading.Barrier(workers)
+    outcomes = []
+    
+    def like():
+        with file_app.app_context():
+            barrier.wait()
+            try:
+                outcomes.append(MusicService.like_music(music_id, user_info))
+            except DuplicateDataException:
+                outcomes.append('duplicate')
+            except Exception as e:
+                outcomes.append(e)
+    
+    threads = [threading.Thread(target=like) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # 유니크 제약조건 충돌(IntegrityError) 없이 한 요청만 추가
+    assert outcomes.count(True) == 1
+    assert outcomes.count('duplicate') == workers - 1
+    with file_app.app_context():
+        assert Like.query.filter_by(music_id=music_id).count() == 1
+        assert _db.session.get(Music, music_id).like_count == 1
@@ -0,0 +1,161 @@
+import threading
+from app.models.like import Like
+from app.models.music import Music
+from app.models.member import Member
+from app.services.music_service import MusicService
+from app import db as _db
+
+
+def results_by_music(response):
+    return {(item['musicId'], item['action']): item['result'] for item in response['results']}
+
+
+def test_batch_like_results_come_from_statements(db, make_member, make_music):
+    member = make_member()
+    liked, fresh, unliked = make_music('a'), make_music('b'), make_music('c')
+    db.session.add(Like(member.id, liked.id))
+    db.session.add(Like(member.id, unliked.id))
+    liked.like_count = unliked.like_count = 1
+    db.session.commit()
+    user_info = {'google_id': member.google_id}
+    
+    response = MusicService.batch_like_music([
+        {'musicId': liked.id, 'action': 'like'},
+        {'musicId': fresh.id, 'action': 'unlike'},
+        {'musicId': fresh.id, 'action': 'like'},
+        {'musicId': unliked.id, 'action': 'unlike'},
+        {'musicId': 9999, 'action': 'like'},
+        {'musicId': 8888, 'action': 'unlike'}
+    ], user_info)
+    
+    assert [item['result'] for item in response['results']] == [
+        'ALREADY_LIKED', 'SUPERSEDED', 'LIKED', 'UNLIKED', 'MUSIC_NOT_FOUND', 'NOT_LIKED'
+    ]
+    assert Like.find_music_ids_by_member(member.id, [liked.id, fresh.id, unliked.id]) == {liked.id, fresh.id}
+    
+    # 좋아요 수는 실제로 바뀐 행에 대해서만 증감
+    counts = {music.id: music.like_count for music in Music.query.all()}
+    assert counts == {liked.id: 1, fresh.id: 1, unliked.id: 0}
+
+
+def test_bulk_statements_report_only_changed_rows(db, make_member, make_music):
+    member = make_member()
+    first, second = make_music('a'), make_music('b')
+    db.session.add(Like(member.id, first.id))
+    db.session.commit()
+    
+    assert Like.bulk_insert_ignore(member.id, [first.id, second.id]) == {second.id}
+    assert Like.bulk_insert_ignore(member.id, [first.id, second.id]) == set()
+    assert Like.bulk_delete(member.id, [first.id, 12345]) == {first.id}
+    assert Like.bulk_delete(member.id, [first.id]) == set()
+
+
+def test_concurrent_batch_likes_count_once(file_app):
+    with file_app.app_context():
+        member = Member('google-race', '회원')
+        music = Music('https://bucket.s3.amazonaws.com/music/race.mp3', '경합')
+        _db.session.add_all([member, music])
+        _db.session.commit()
+        member_google_id, music_id = member.google_id, music.id
+    
+    workers = 8
+    barrier = threading.Barrier(workers)
+    results = []
+    errors = []
+    
+    def like_and_unlike():
+        try:
+            with file_app.app_context():
+                barrier.wait()
+                for action in ('like', 'unlike', 'like'):
+                    response = MusicService.batch_like_music([{'musicId': music_id, 'action': action}],
+                                                             {'google_id': member_google_id})
+                    results.append(response['results'][0]['result'])
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=like_and_unlike) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert not errors
+    with file_app.app_context():
+        like_count = Like.query.filter_by(music_id=music_id).count()
+        stored_count = _db.session.get(Music, music_id).like_count
+    
+    # 실제로 추가/삭제된 횟수만 집계되므로 저장된 좋아요 수는 like_tb와 항상 일치
+    assert results.count('LIKED') - results.count('UNLIKED') == like_count
+    assert stored_count == like_count
+
+
+def test_insert_ignore_falls_back_to_savepoints_on_other_dialects(db, make_member, make_music, monkeypatch):
+    from app.models.base import insert_ignore
+    
+    member = make_member()
+    first, second = make_music('a'), make_music('b')
+    db.session.add(Like(member.id, first.id))
+    db.session.commit()
+    
+    # ON CONFLICT 구문이 없는 DB로 가정
+    monkeypatch.setattr(db.engine.dialect, 'name', 'other')
+    rows = [{'member_id': member.id, 'music_id': first.id}, {'member_id': member.id, 'music_id': second.id}]
+    assert insert_ignore(Like, rows) == rows[1:]
+    db.session.commit()
+    
+    assert Like.find_music_ids_by_member(member.id, [first.id, second.id]) == {first.id, second.id}
+
+
+def test_mysql_insert_ignore_sends_one_statement_per_chunk(db, monkeypatch):
+    from sqlalchemy.dialects import mysql
+    from app.models.base import insert_ignore
+    
+    statements = []
+    
+    def execute(stmt, *args, **kwargs):
+        sql = str(stmt.compile(dialect=mysql.dialect()))
+        statements.append(sql)
+        # 음악 3의 좋아요는 이미 있음
+        return [(1, 3)] if sql.startswith('SELECT') else None
+    
+    monkeypatch.setattr(db.engine.dialect, 'name', 'mysql')
+    monkeypatch.setattr(db.session, 'execute', execute)
+    rows = [{'member_id': 1, 'music_id': music_id} for music_id in range(1, 251)]
+    
+    inserted = insert_ignore(Like, rows)
+    
+    assert [row['music_id'] for row in inserted] == [music_id for music_id in range(1, 251) if music_id != 3]
+    # 200개 단위로 잠금 조회 한 번과 여러 행 INSERT IGNORE 한 번
+    assert [sql.split()[0] for sql in statements] == ['SELECT', 'INSERT', 'SELECT', 'INSERT']
+    assert all(sql.endswith('FOR UPDATE') for sql in statements[::2])
+    assert statements[1].startswith('INSERT IGNORE INTO like_tb')
+    assert statements[1].count('), (') == 199
+
+
+def test_bulk_delete_without_returning_locks_then_deletes_once(db, make_member, make_music, monkeypatch):
+    from app.utils.query_counter import count_queries
+    
+    member = make_member()
+    musics = [make_music(f'음악 {index}') for index in range(3)]
+    for music in musics[:2]:
+        db.session.add(Like(member.id, music.id))
+    db.session.commit()
+    member_id, music_ids = member.id, [music.id for music in musics]
+    
+    # DELETE ... RETURNING이 없는 DB(MySQL)로 가정
+    monkeypatch.setattr(db.engine.dialect, 'delete_returning', False)
+    with count_queries() as queries:
+        deleted = Like.bulk_delete(member_id, music_ids)
+    db.session.commit()
+    
+    assert deleted == set(music_ids[:2])
+    assert queries.total == 2
+    assert Like.query.count() == 0
+
+
+def test_batch_like_rejects_non_json_body(client, make_member, auth_headers):
+    response = client.post('/api/music/likes/batch', data='operations', content_type='text/plain',
+                           headers=auth_headers(make_member()))
+    
+    assert response.status_code == 400
@@ -0,0 +1,145 @@
+import os
+import pytest
+from app.models.like import Like
+from app.models.like_count_flush import LikeCountFlush
+from app.models.music import Music
+from app.utils import like_count_buffer as buffer_module
+from app.utils.like_count_buffer import LikeCountBuffer
+
+
+class IdleThread:
+    """반영 스레드 대신 사용 (테스트에서 직접 flush 호출)"""
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    def start(self):
+        pass
+
+
+@pytest.fixture
+def make_buffer(app, tmp_path, monkeypatch):
+    """write-behind를 켠 버퍼 생성 함수 (저널은 임시 디렉터리)"""
+    monkeypatch.setattr(buffer_module.threading, 'Thread', IdleThread)
+    monkeypatch.setattr(buffer_module.atexit, 'register', lambda f: None)
+    app.config.update(LIKE_COUNT_WRITE_BEHIND=True, LIKE_COUNT_JOURNAL_DIR=str(tmp_path))
+    
+    def make_buffer():
+        buffer = LikeCountBuffer()
+        buffer.init_app(app)
+        return buffer
+    return make_buffer
+
+
+@pytest.fixture
+def liked_music(db, make_member, make_music):
+    """좋아요 3개가 커밋되었지만 like_count에는 아직 반영되지 않은 음악"""
+    music = make_music()
+    for index in range(3):
+        member = make_member(f'google-{index}')
+        db.session.add(Like(member.id, music.id))
+    db.session.commit()
+    return music.id
+
+
+def like_count(db, music_id):
+    db.session.expire_all()
+    return db.session.get(Music, music_id).like_count
+
+
+def write_dead_journal(directory, journal_id, seq, lines):
+    with open(os.path.join(directory, f'like_count_{journal_id}_{seq}.journal'), 'w') as journal:
+        journal.write(''.join(f'{music_id} {delta}\n' for music_id, delta in lines))
+
+
+def test_replay_applies_dead_deltas_without_clobbering_live_ones(db, make_buffer, liked_music, tmp_path):
+    live = make_buffer()
+    live.add(liked_music, 1)
+    live.add(liked_music, 1)
+    
+    # 반영 전에 죽은 다른 워커의 저널 (증감분 +1)
+    write_dead_journal(tmp_path, '424242-0badc0de', 1, [(liked_music, 1)])
+    make_buffer()  # 기동 시 저널 복구
+    
+    assert like_count(db, liked_music) == 1
+    live.flush()
+    assert like_count(db, liked_music) == 3
+    assert not [name for name in os.listdir(tmp_path) if name.startswith('like_count_424242')]
+
+
+def test_replay_skips_batches_already_flushed(db, make_buffer, liked_music, tmp_path, monkeypatch):
+    worker = make_buffer()
+    for _ in range(3):
+        worker.add(liked_music, 1)
+    
+    # 반영은 커밋했지만 저널을 지우기 전에 죽은 경우
+    monkeypatch.setattr(worker, '_remove', lambda path: None)
+    worker.flush()
+    worker._owner_lock.close()
+    assert like_count(db, liked_music) == 3
+    
+    make_buffer()  # 기동 시 저널 복구
+    assert like_count(db, liked_music) == 3
+    assert LikeCountFlush.query.count() == 0
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.journal')]
+
+
+def test_journal_of_recycled_pid_is_replayed(db, make_buffer, liked_music, tmp_path):
+    # 같은 pid(현재 프로세스)지만 기동 nonce가 다른, 잠금을 잡고 있지 않은 저널
+    write_dead_journal(tmp_path, f'{os.getpid()}-feedface', 1, [(liked_music, 1), (liked_music, 1)])
+    write_dead_journal(tmp_path, f'{os.getpid()}-feedface', 2, [(liked_music, 1)])
+    
+    replayer = make_buffer()  # 기동 시 저널 복구
+    assert like_count(db, liked_music) == 3
+    assert replayer.replay() == 0
+
+
+def test_live_journal_is_not_replayed(db, make_buffer, liked_music):
+    live = make_buffer()
+    live.add(liked_music, 1)
+    
+    assert make_buffer().replay() == 0
+    assert like_count(db, liked_music) == 0
+    live.flush()
+    assert like_count(db, liked_music) == 1
+
+
+def test_reconcile_skips_music_with_pending_deltas(db, make_buffer, make_music, liked_music, tmp_path):
+    other = make_music('other')
+    worker = make_buffer()
+    worker.add(liked_music, 1)
+    worker.add(other.id, 1)
+    worker.flush()
+    
+    # 어긋난 좋아요 수 (실제 like_tb: liked_music 3개, other 0개)
+    db.session.get(Music, other.id).like_count = 5
+    db.session.commit()
+    # 다른 워커가 liked_music의 증감분을 아직 반영하지 않음
+    write_dead_journal(tmp_path, '1-0badc0de', 1, [(liked_music, 1)])
+    
+    assert worker.reconcile() == 1
+    assert like_count(db, other.id) == 0
+    assert like_count(db, liked_music) == 1
+    assert worker._touched == {liked_music}
+
+
+def test_replay_cleans_up_workers_that_died_with_nothing_pending(db, make_buffer, tmp_path):
+    # 마지막 배치까지 반영하고 죽은 워커: 반영 표시와 잠금 파일만 남음
+    LikeCountFlush.claim('31337-0badc0de', 7)
+    db.session.commit()
+    open(os.path.join(tmp_path, 'like_count_31337-0badc0de.lock'), 'a').close()
+    
+    make_buffer()  # 기동 시 저널 복구
+    assert LikeCountFlush.query.count() == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_buffer_before_init_app_applies_immediately(app, db, make_music):
+    music = make_music()
+    buffer = LikeCountBuffer()
+    
+    assert buffer.stats()['pending'] == 0
+    buffer.add(music.id, 1)
+    
+    db.session.expire_all()
+    assert Music.find_by_id(music.id).like_count == 1
@@ -0,0 +1,122 @@
+import base64
+import json
+from app.clients.ai_client import AIClient
+from app.models.mymusic import MyMusic
+from app.models.s3_delete_job import S3DeleteJob
+
+
+def upload_request(client, headers, **overrides):
+    data = {'mediaType': 'image', 'filename': 'cover.png', 'contentType': 'image/png'}
+    data.update(overrides)
+    return client.post('/api/uploads/presigned', json=data, headers=headers)
+
+
+def presigned_policy(upload):
+    return json.loads(base64.b64decode(upload['fields']['policy']))
+
+
+def test_presigned_upload_requires_auth(client, s3_bucket):
+    response = upload_request(client, {})
+    
+    assert response.status_code == 401
+
+
+def test_presigned_post_policy_limits_type_and_size(app, client, s3_bucket, make_member, auth_headers):
+    member = make_member()
+    
+    response = upload_request(client, auth_headers(member))
+    
+    assert response.status_code == 200
+    upload = response.get_json()['data']
+    assert upload['method'] == 'POST'
+    assert upload['objectKey'].startswith(f'uploads/image/{member.id}/')
+    assert upload['objectKey'].endswith('_cover.png')
+    assert upload['maxSize'] == app.config['MAX_IMAGE_SIZE']
+    conditions = presigned_policy(upload)['conditions']
+    assert {'Content-Type': 'image/png'} in conditions
+    assert ['content-length-range', 1, app.config['MAX_IMAGE_SIZE']] in conditions
+    assert {'key': upload['objectKey']} in conditions
+
+
+def test_presigned_post_policy_uses_video_size_limit(app, client, s3_bucket, make_member, auth_headers):
+    response = upload_request(client, auth_headers(make_member()),
+                              mediaType='video', filename='clip.mp4', contentType='video/mp4')
+    
+    upload = response.get_json()['data']
+    assert upload['maxSize'] == app.config['MAX_VIDEO_SIZE']
+    assert ['content-length-range', 1, app.config['MAX_VIDEO_SIZE']] in presigned_policy(upload)['conditions']
+
+
+def test_presigned_put_signs_content_type(client, s3_bucket, make_member, auth_headers):
+    response = upload_request(client, auth_headers(make_member()), method='PUT')
+    
+    upload = response.get_json()['data']
+    assert upload['headers'] == {'Content-Type': 'image/png'}
+    assert 'content-type' in upload['url'].lower()
+
+
+def test_presigned_upload_rejects_mismatched_type(client, s3_bucket, make_member, auth_headers):
+    headers = auth_headers(make_member())
+    
+    assert upload_request(client, headers, filename='cover.exe').status_code == 400
+    assert upload_request(client, headers, contentType='video/mp4').status_code == 400
+
+
+def test_generate_rejects_other_member_object(client, s3_bucket, make_member, auth_headers):
+    owner = make_member('google-1')
+    other = make_member('google-2')
+    object_key = upload_request(client, auth_headers(owner)).get_json()['data']['objectKey']
+    s3_bucket.put_object(Bucket='test-bucket', Key=object_key, Body=b'png', ContentType='image/png')
+    
+    response = client.post('/api/generate-music/upload', headers=auth_headers(other),
+                           json={'mediaType': 'image', 'objectKey': object_key})
+    
+    assert response.status_code == 400
+
+
+def test_generate_rejects_oversized_object(app, client, s3_bucket, make_member, auth_headers):
+    member = make_member()
+    headers = auth_headers(member)
+    app.config['MAX_IMAGE_SIZE'] = 16
+    object_key = upload_request(client, headers, method='PUT').get_json()['data']['objectKey']
+    # PUT 업로드는 크기 조건이 서명되지 않으므로 S3에는 올라감
+    s3_bucket.put_object(Bucket='test-bucket', Key=object_key, Body=b'x' * 17, ContentType='image/png')
+    
+    response = client.post('/api/generate-music/upload', headers=headers,
+                           json={'mediaType': 'image', 'objectKey': object_key})
+    
+    assert response.status_code == 400
+    assert '너무 큽니다' in response.get_json()['message']
+
+
+def test_generate_enqueues_used_upload_for_deletion(client, s3_bucket, make_member, auth_headers, monkeypatch):
+    member = make_member()
+    headers = auth_headers(member)
+    object_key = upload_request(client, headers).get_json()['data']['objectKey']
+    s3_bucket.put_object(Bucket='test-bucket', Key=object_key, Body=b'png', ContentType='image/png')
+    monkeypatch.setattr(AIClient, 'generate_music_with_media_url', lambda self, media_type, media_url, key: {
+        'music_url': 'https://test-bucket.s3.amazonaws.com/music/new.mp3', 'title': '새 음악'
+    })
+    
+    response = client.post('/api/generate-music/upload', headers=headers,
+                           json={'mediaType': 'image', 'objectKey': object_key})
+    
+    assert response.status_code == 200
+    assert [job.object_key for job in S3DeleteJob.query.all()] == [object_key]
+    assert MyMusic.query.filter_by(member_id=member.id).count() == 1
+
+
+def test_upload_lifecycle_rule_keeps_other_rules(app, s3_bucket):
+    s3_bucket.put_bucket_lifecycle_configuration(Bucket='test-bucket', LifecycleConfiguration={'Rules': [
+        {'ID': 'archive-music', 'Filter': {'Prefix': 'music/'}, 'Status': 'Enabled',
+         'Transitions': [{'Days': 30, 'StorageClass': 'GLACIER'}]}
+    ]})
+    
+    runner = app.test_cli_runner()
+    assert runner.invoke(args=['s3-upload-lifecycle']).exit_code == 0
+    assert runner.invoke(args=['s3-upload-lifecycle', '--days', '2']).exit_code == 0
+    
+    rules = {rule['ID']: rule for rule in s3_bucket.get_bucket_lifecycle_configuration(Bucket='test-bucket')['Rules']}
+    assert set(rules) == {'archive-music', 'expire-direct-uploads'}
+    assert rules['expire-direct-uploads']['Filter'] == {'Prefix': 'uploads/'}
+    assert rules['expire-direct-uploads']['Expiration'] == {'Days': 2}
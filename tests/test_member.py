@@ -0,0 +1,69 @@
+import threading
+from app import db as _db
+from app.models.member import Member
+
+
+def test_upsert_creates_member_once_and_updates_name(db):
+    member_id, google_id, name = Member.upsert_by_google_id('google-1', '홍길동')
+    db.session.commit()
+    
+    assert Member.upsert_by_google_id('google-1', '홍길동') == (member_id, google_id, '홍길동')
+    assert Member.upsert_by_google_id('google-1', '새 이름') == (member_id, google_id, '새 이름')
+    db.session.commit()
+    assert Member.query.count() == 1
+    assert Member.find_by_id(member_id).name == '새 이름'
+
+
+def test_upsert_without_name_keeps_stored_name(db):
+    member_id, _, _ = Member.upsert_by_google_id('google-1', '홍길동')
+    db.session.commit()
+    updated_at = Member.find_by_id(member_id).updated_at
+    
+    assert Member.upsert_by_google_id('google-1', None, 'user@example.com') == (member_id, 'google-1', '홍길동')
+    db.session.commit()
+    db.session.expire_all()
+    member = Member.find_by_id(member_id)
+    assert (member.name, member.updated_at) == ('홍길동', updated_at)
+    
+    # 이름이 없는 새 회원만 대체 이름 사용
+    assert Member.upsert_by_google_id('google-2', None, 'user@example.com')[2] == 'user@example.com'
+
+
+def test_upsert_savepoint_fallback_for_other_databases(db, monkeypatch):
+    monkeypatch.setattr(db.engine.dialect, 'name', 'other')
+    
+    member_id, _, name = Member.upsert_by_google_id('google-1', None)
+    assert name == '사용자'
+    assert Member.upsert_by_google_id('google-1', None) == (member_id, 'google-1', '사용자')
+    assert Member.upsert_by_google_id('google-1', '홍길동') == (member_id, 'google-1', '홍길동')
+    db.session.commit()
+    assert Member.query.count() == 1
+
+
+def test_concurrent_first_logins_create_one_member(file_app):
+    workers = 8
+    barrier = threading.Barrier(workers)
+    outcomes = []
+    
+    def login():
+        with file_app.app_context():
+            barrier.wait()
+            try:
+                member_id, _, _ = Member.upsert_by_google_id('google-race', '홍길동')
+                _db.session.commit()
+                outcomes.append(member_id)
+            except Exception as e:
+                _db.session.rollback()
+                outcomes.append(e)
+    
+    threads = [threading.Thread(target=login) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # 유니크 제약조건 충돌 없이 모두 같은 회원 ID를 받음
+    assert len(set(outcomes)) == 1, outcomes
+    with file_app.app_context():
+        assert Member.query.filter_by(google_id='google-race').count() == 1
+        assert Member.query.one().id == outcomes[0]
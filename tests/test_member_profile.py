@@ -0,0 +1,33 @@
+import time
+from app.auth.identity import MemberIdentityCache, MemberIdentity
+from app.models.member import Member
+from app.utils import ttl_cache
+
+
+def test_me_answers_not_modified_for_same_etag(client, make_member, auth_headers):
+    headers = auth_headers(make_member())
+    
+    response = client.get('/api/me', headers=headers)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    
+    response = client.get('/api/me', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+
+
+def test_other_worker_sees_rename_after_ttl(app, db, make_member, monkeypatch):
+    member = make_member('google-1', '이전 이름')
+    here, other = MemberIdentityCache(app), MemberIdentityCache(app)
+    assert other.profile(member.id).name == '이전 이름'
+    
+    # 이 워커에서 로그인하며 이름 변경 (무효화는 이 워커의 캐시에만 적용)
+    Member.upsert_by_google_id('google-1', '새 이름')
+    db.session.commit()
+    here.prime(MemberIdentity(member.id, 'google-1', '새 이름'))
+    assert here.profile(member.id).name == '새 이름'
+    assert other.profile(member.id).name == '이전 이름'
+    
+    now = time.monotonic()
+    ttl = app.config['MEMBER_IDENTITY_CACHE_TTL_SECONDS']
+    monkeypatch.setattr(ttl_cache.time, 'monotonic', lambda: now + ttl + 1)
+    assert other.profile(member.id).name == '새 이름'
@@ -0,0 +1,60 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app import create_app
+from app.config import TestingConfig
+from app.utils import metrics as metrics_module
+from app.utils.like_count_buffer import like_count_buffer
+
+
+def test_db_listeners_registered_only_when_enabled():
+    for name in ('before_cursor_execute', 'after_cursor_execute'):
+        listener = getattr(metrics_module, f'_{name}')
+        if event.contains(Engine, name, listener):
+            event.remove(Engine, name, listener)
+    
+    class DisabledConfig(TestingConfig):
+        METRICS_ENABLED = False
+    
+    create_app(DisabledConfig)
+    assert not event.contains(Engine, 'before_cursor_execute', metrics_module._before_cursor_execute)
+    
+    create_app(TestingConfig)
+    assert event.contains(Engine, 'before_cursor_execute', metrics_module._before_cursor_execute)
+    assert event.contains(Engine, 'after_cursor_execute', metrics_module._after_cursor_execute)
+
+
+def test_metrics_allowed_from_local_address(client):
+    response = client.get('/metrics')
+    
+    assert response.status_code == 200
+    assert b'http_requests_total' in response.data
+
+
+def test_metrics_rejects_other_addresses_without_token(client):
+    response = client.get('/metrics', environ_base={'REMOTE_ADDR': '10.0.0.5'})
+    
+    assert response.status_code == 403
+
+
+def test_metrics_accepts_token_from_any_address(app, client, monkeypatch):
+    monkeypatch.setattr(metrics_module.metrics, 'token', 'scrape-secret')
+    remote = {'REMOTE_ADDR': '10.0.0.5'}
+    
+    assert client.get('/metrics', environ_base=remote,
+                      headers={'Authorization': 'Bearer wrong'}).status_code == 403
+    assert client.get('/metrics', environ_base=remote,
+                      headers={'Authorization': 'Bearer scrape-secret'}).status_code == 200
+
+
+def test_like_flushes_are_counted(client, monkeypatch):
+    client.get('/metrics')
+    before = REGISTRY.get_sample_value('like_count_buffer_flushes_total') or 0
+    
+    # 테스트가 끝나면 반영 횟수와 기록한 횟수를 함께 되돌림
+    monkeypatch.setattr(metrics_module.metrics, '_flushes_reported', metrics_module.metrics._flushes_reported)
+    monkeypatch.setattr(like_count_buffer, 'flush_count', like_count_buffer.flush_count + 2)
+    client.get('/metrics')
+    client.get('/metrics')
+    
+    assert REGISTRY.get_sample_value('like_count_buffer_flushes_total') == before + 2
@@ -0,0 +1,58 @@
+from app.models import base
+from app.models.like import Like
+
+
+def get_batch(client, ids, headers=None, include_likes=False):
+    query = ','.join(str(music_id) for music_id in ids)
+    url = f'/api/music?ids={query}' + ('&includeLikes=true' if include_likes else '')
+    return client.get(url, headers=headers or {})
+
+
+def test_batch_lookup_keeps_request_order_and_reports_missing_ids(client, make_music):
+    first, second, third = (make_music(f'음악 {index}') for index in range(3))
+    missing = third.id + 100
+    
+    response = get_batch(client, [third.id, missing, first.id, third.id, second.id])
+    
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert [item['id'] for item in data['musicList']] == [third.id, first.id, second.id]
+    assert [item['title'] for item in data['musicList']] == ['음악 2', '음악 0', '음악 1']
+    assert data['missingIds'] == [missing]
+
+
+def test_batch_lookup_includes_like_counts_and_pressed(client, db, make_member, make_music, auth_headers):
+    member = make_member()
+    other = make_member('google-2', '다른 회원')
+    liked, unliked = make_music('좋아요'), make_music('안 누름')
+    db.session.add_all([Like(member.id, liked.id), Like(other.id, liked.id), Like(other.id, unliked.id)])
+    db.session.commit()
+    
+    response = get_batch(client, [unliked.id, liked.id], auth_headers(member), include_likes=True)
+    
+    items = response.get_json()['data']['musicList']
+    assert [(item['id'], item['likeCount'], item['pressed']) for item in items] == [
+        (unliked.id, 1, False),
+        (liked.id, 2, True),
+    ]
+
+
+def test_batch_lookup_chunks_long_id_lists(client, make_music, monkeypatch):
+    # IN 절을 2개씩 나누도록 chunked 기본 크기 변경
+    monkeypatch.setattr(base.chunked, '__defaults__', (2,))
+    musics = [make_music(f'음악 {index}') for index in range(5)]
+    ids = [music.id for music in reversed(musics)]
+    
+    response = get_batch(client, ids, include_likes=True)
+    
+    assert [item['id'] for item in response.get_json()['data']['musicList']] == ids
+    # 음악 조회 3번 + 좋아요 수 조회 3번
+    assert int(response.headers['X-Query-Count']) == 6
+
+
+def test_batch_lookup_rejects_invalid_ids(client, app):
+    assert client.get('/api/music?ids=1,a').status_code == 400
+    assert client.get('/api/music?ids=').status_code == 400
+    
+    app.config['MUSIC_BATCH_MAX_IDS'] = 2
+    assert get_batch(client, [1, 2, 3]).status_code == 400
@@ -0,0 +1,49 @@
+import pytest
+from app.models.music import Music
+from app.models.mymusic import MyMusic
+from app.models.s3_delete_job import S3DeleteJob
+from app.services.music_service import MusicService
+
+
+@pytest.fixture
+def owned_music(db, make_member, make_music):
+    member = make_member()
+    music = make_music('삭제할 음악', music_url='https://test-bucket.s3.amazonaws.com/music/delete.mp3')
+    db.session.add(MyMusic(music.id, member.id))
+    db.session.commit()
+    return member, music
+
+
+def test_delete_enqueues_object_with_music_delete(app, db, owned_music):
+    app.config['S3_URL'] = 'https://test-bucket.s3.amazonaws.com'
+    member, music = owned_music
+    
+    MusicService.delete_music_completely(music.id, {'google_id': member.google_id})
+    
+    assert Music.find_by_id(music.id) is None
+    assert MyMusic.query.count() == 0
+    assert [job.object_key for job in S3DeleteJob.query.all()] == ['music/delete.mp3']
+
+
+def test_failed_delete_commit_leaves_no_delete_job(app, db, owned_music, monkeypatch):
+    app.config['S3_URL'] = 'https://test-bucket.s3.amazonaws.com'
+    member, music = owned_music
+    music_id = music.id
+    
+    commit = db.session.commit
+    
+    def fail_music_delete_commit():
+        # Music 삭제를 커밋할 때만 실패 (그 전에 따로 커밋된 변경이 있으면 남음)
+        if any(isinstance(obj, Music) for obj in db.session.deleted):
+            raise RuntimeError('commit failed')
+        commit()
+    monkeypatch.setattr(db.session, 'commit', fail_music_delete_commit)
+    
+    with pytest.raises(RuntimeError):
+        MusicService.delete_music_completely(music_id, {'google_id': member.google_id})
+    
+    monkeypatch.undo()
+    db.session.expire_all()
+    assert S3DeleteJob.query.count() == 0
+    assert Music.find_by_id(music_id) is not None
+    assert MyMusic.query.filter_by(music_id=music_id).count() == 1
@@ -0,0 +1,101 @@
+from sqlalchemy import event
+from app.models import music as music_module
+from app.models.music import Music, title_bigrams
+
+
+def search_plan(db, query):
+    """Music.search가 실행한 SELECT 문의 EXPLAIN QUERY PLAN 결과(detail 목록)"""
+    statements = []
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+    
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        Music.search(query)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+    
+    statement, parameters = statements[-1]
+    connection = db.session.connection()
+    return [row[-1] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+
+
+def titles(musics):
+    return sorted(music.title for music in musics)
+
+
+def test_title_bigrams_split_words():
+    assert title_bigrams('사랑 노래') == '사랑 노래'
+    assert title_bigrams('Love-Song') == 'lo ov ve so on ng'
+    assert title_bigrams('가 나다라') == '나다 다라'
+
+
+def test_two_character_search_uses_bigram_index(db, make_music):
+    make_music('사랑 노래')
+    make_music('이별 노래')
+    make_music('여름밤')
+    
+    assert titles(Music.search('노래')) == ['사랑 노래', '이별 노래']
+    assert titles(Music.search('름밤')) == ['여름밤']
+    assert titles(Music.search('사랑 노래')) == ['사랑 노래']
+    
+    plan = search_plan(db, '노래')
+    assert any('music_bigram_fts' in detail for detail in plan), plan
+    assert not any(detail.startswith('SCAN music_tb') for detail in plan), plan
+
+
+def test_mixed_search_filters_with_bigram_index(db, make_music):
+    make_music('사랑 노래 모음')
+    make_music('사랑 이야기 모음')
+    
+    assert titles(Music.search('이야기 사랑')) == ['사랑 이야기 모음']
+    plan = search_plan(db, '이야기 사랑')
+    assert any('music_fts' in detail for detail in plan), plan
+    assert any('music_bigram_fts' in detail for detail in plan), plan
+
+
+def test_bigram_index_follows_title_changes(db, make_music):
+    music = make_music('사랑 노래')
+    
+    music.title = '여름 바다'
+    db.session.commit()
+    assert Music.search('노래') == []
+    assert titles(Music.search('바다')) == ['여름 바다']
+    
+    db.session.delete(music)
+    db.session.commit()
+    assert Music.search('바다') == []
+
+
+def test_single_character_search_scans_recent_only(db, make_music, monkeypatch):
+    old = make_music('별 헤는 밤')
+    make_music('별빛')
+    make_music('달빛')
+    
+    assert titles(Music.search('별')) == ['별 헤는 밤', '별빛']
+    
+    # LIKE 검색은 최근 음악 일부만 확인
+    monkeypatch.setattr(music_module, 'SEARCH_LIKE_SCAN_LIMIT', 2)
+    assert old.title not in titles(Music.search('별'))
+    assert titles(Music.search('별')) == ['별빛']
+
+
+def test_mysql_single_character_search_uses_recent_like_scan(db, make_music, monkeypatch):
+    make_music('별 헤는 밤')
+    make_music('달빛')
+    statements = []
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    # ngram_token_size(2)보다 짧은 검색어만 있으면 MATCH ... AGAINST를 보내지 않음
+    monkeypatch.setattr(db.engine.dialect, 'name', 'mysql')
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        assert titles(Music.search('별')) == ['별 헤는 밤']
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+    
+    assert not any('MATCH' in statement for statement in statements)
@@ -0,0 +1,127 @@
+import json
+import time
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from app.auth.google_id_token import google_id_token_verifier
+from app.clients.oauth_client import OAuthClient
+from app.models.member import Member
+from app.services.member_service import MemberService
+from app.services.oauth_service import OAuthService
+from app.utils.exceptions import UnauthorizedException
+
+CLIENT_ID = 'test-client.apps.googleusercontent.com'
+
+
+def make_signing_key(kid):
+    """RSA 개인키와 그 공개키 JWK"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update(kid=kid, alg='RS256', use='sig')
+    return private_key, jwk
+
+
+@pytest.fixture(scope='module')
+def signing_key():
+    return make_signing_key('test-key')
+
+
+@pytest.fixture
+def verifier(app, signing_key, monkeypatch):
+    """로컬 공개키를 등록한 ID 토큰 검증기 (테스트가 끝나면 원래 상태로 되돌림)"""
+    for name in ('client_id', '_keys', '_fetched_at', '_expires_at', '_refresh_at'):
+        monkeypatch.setattr(google_id_token_verifier, name, getattr(google_id_token_verifier, name))
+    google_id_token_verifier.client_id = CLIENT_ID
+    google_id_token_verifier.load_jwks({'keys': [signing_key[1]]})
+    
+    def fail_fetch():
+        raise AssertionError('공개키를 다시 조회하지 않아야 합니다.')
+    monkeypatch.setattr(OAuthClient, 'get_google_jwks', staticmethod(fail_fetch))
+    return google_id_token_verifier
+
+
+@pytest.fixture
+def sign_id_token(signing_key):
+    """로컬 개인키로 서명한 ID 토큰 생성 함수 (클레임은 덮어쓰거나 None으로 제거)"""
+    def sign_id_token(key=None, kid='test-key', **overrides):
+        now = int(time.time())
+        claims = {'iss': 'https://accounts.google.com', 'aud': CLIENT_ID, 'sub': 'google-1',
+                  'iat': now, 'exp': now + 3600}
+        claims.update(overrides)
+        claims = {name: value for name, value in claims.items() if value is not None}
+        return jwt.encode(claims, key or signing_key[0], algorithm='RS256', headers={'kid': kid})
+    return sign_id_token
+
+
+def test_valid_id_token_is_verified_locally(verifier, sign_id_token):
+    claims = verifier.verify(sign_id_token(name='홍길동', email='user@example.com'))
+    
+    assert claims['sub'] == 'google-1'
+    assert claims['name'] == '홍길동'
+
+
+@pytest.mark.parametrize('overrides', [
+    {'aud': 'other-client.apps.googleusercontent.com'},
+    {'iss': 'https://evil.example.com'},
+    {'exp': int(time.time()) - 60, 'iat': int(time.time()) - 3660},
+], ids=['wrong-aud', 'wrong-iss', 'expired'])
+def test_invalid_claims_are_rejected(verifier, sign_id_token, overrides):
+    with pytest.raises(UnauthorizedException):
+        verifier.verify(sign_id_token(**overrides))
+
+
+def test_bad_signature_is_rejected(verifier, sign_id_token):
+    # 같은 kid로 다른 키가 서명한 토큰
+    other_key, _ = make_signing_key('test-key')
+    
+    with pytest.raises(UnauthorizedException):
+        verifier.verify(sign_id_token(key=other_key))
+
+
+def test_unknown_kid_refetches_jwks_once(verifier, sign_id_token, signing_key, monkeypatch):
+    rotated_key, rotated_jwk = make_signing_key('rotated-key')
+    fetches = []
+    
+    def fetch_jwks():
+        fetches.append(1)
+        return {'keys': [signing_key[1], rotated_jwk]}, 3600
+    monkeypatch.setattr(OAuthClient, 'get_google_jwks', staticmethod(fetch_jwks))
+    # 마지막 조회 후 최소 갱신 간격이 지난 상태
+    verifier._fetched_at -= verifier.min_refresh_seconds
+    
+    token = sign_id_token(key=rotated_key, kid='rotated-key')
+    assert verifier.verify(token)['sub'] == 'google-1'
+    assert verifier.verify(token)['sub'] == 'google-1'
+    assert len(fetches) == 1
+
+
+def test_unknown_kid_within_refresh_interval_is_rejected_without_fetch(verifier, sign_id_token):
+    rotated_key, _ = make_signing_key('rotated-key')
+    
+    with pytest.raises(UnauthorizedException):
+        verifier.verify(sign_id_token(key=rotated_key, kid='rotated-key'))
+
+
+def test_missing_name_claim_is_not_replaced(verifier, sign_id_token):
+    user_info = OAuthService.get_google_user_info_from_id_token(sign_id_token(email='user@example.com'))
+    
+    assert user_info == {'id': 'google-1', 'name': None, 'email': 'user@example.com'}
+
+
+def test_login_without_name_claim_keeps_stored_name(db, make_member, verifier, sign_id_token):
+    member = make_member('google-1', '홍길동')
+    id_token = sign_id_token(email='user@example.com')
+    
+    MemberService.find_or_create_member_by_google_id(OAuthService.get_google_user_info_from_id_token(id_token))
+    
+    db.session.expire_all()
+    assert Member.find_by_id(member.id).name == '홍길동'
+
+
+def test_first_login_without_name_claim_uses_email(verifier, sign_id_token):
+    id_token = sign_id_token(sub='google-2', email='user@example.com')
+    
+    MemberService.find_or_create_member_by_google_id(OAuthService.get_google_user_info_from_id_token(id_token))
+    
+    assert Member.find_by_google_id('google-2').name == 'user@example.com'
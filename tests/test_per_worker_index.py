@@ -0,0 +1,148 @@
+import threading
+import pytest
+from app.utils import per_worker_index
+from app.utils.per_worker_index import PerWorkerIndex, MusicIndex
+from app.utils.prompt_index import PromptMinHashIndex
+from app.utils.related_index import RelatedMusicIndex
+from app.utils.suggest_index import TitleSuggestIndex
+
+
+class SetIndex(PerWorkerIndex):
+    """구성 시 load()가 돌려준 값을 집합으로 보관하는 테스트용 색인"""
+    
+    extension_name = 'set_index'
+    
+    def __init__(self, load):
+        self.items = set()
+        self.load = load
+        super().__init__()
+    
+    def _load(self):
+        return self.load()
+    
+    def _install(self, state):
+        self.items = set(state)
+    
+    def _apply_change(self, change):
+        self.items.add(change)
+    
+    def _size(self):
+        return len(self.items)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    # 테스트에서 만든 색인이 전역 등록 목록에 남지 않도록 함
+    monkeypatch.setattr(PerWorkerIndex, '_instances', [])
+    monkeypatch.setattr(MusicIndex, '_music_indexes', [])
+
+
+def test_background_build_does_not_block_and_serves_empty_until_ready(app):
+    release = threading.Event()
+    loaded = threading.Event()
+    
+    def load():
+        loaded.set()
+        release.wait(5)
+        return {'a', 'b'}
+    
+    index = SetIndex(load)
+    index.init_app(app)
+    index.background = True
+    
+    index.start()
+    assert loaded.wait(5)
+    assert not index.ready
+    assert index.items == set()
+    
+    # 구성 중에는 새 구성을 시작하지 않음
+    index.start()
+    
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == 'set_index-rebuild':
+            thread.join(5)
+    assert index.ready
+    assert index.items == {'a', 'b'}
+
+
+def test_failed_build_is_retried_after_backoff(app, monkeypatch):
+    calls = []
+    
+    def load():
+        calls.append(1)
+        raise RuntimeError('db down')
+    
+    index = SetIndex(load)
+    index.init_app(app)
+    
+    for _ in range(5):
+        index.start()
+    assert len(calls) == 1
+    assert not index.ready
+    assert not index._rebuilding
+    
+    # 재시도 간격이 지나면 다시 구성
+    monkeypatch.setattr(per_worker_index, 'REBUILD_RETRY_SECONDS', 0)
+    index.start()
+    assert len(calls) == 2
+
+
+def test_changes_during_build_are_replayed_on_new_index(app):
+    index = SetIndex(lambda: None)
+    index.init_app(app)
+    
+    def load():
+        # DB를 읽는 동안 이 워커에서 커밋된 변경
+        index.apply(['committed-during-build'])
+        return {'from-db'}
+    
+    index.load = load
+    index.start()
+    assert index.items == {'from-db', 'committed-during-build'}
+    
+    index.apply(['after'])
+    assert 'after' in index.items
+
+
+def test_music_indexes_follow_session_commits(app, db, make_music):
+    suggest = TitleSuggestIndex(app)
+    related = RelatedMusicIndex(app)
+    first = make_music('잔잔한 피아노 연주')
+    suggest.start()
+    related.start()
+    assert suggest.ready and related.ready
+    
+    second = make_music('잔잔한 피아노 소품')
+    assert suggest.suggest('잔잔') == ['잔잔한 피아노 소품', '잔잔한 피아노 연주']
+    assert second.id in [music_id for music_id, _ in related.related(first.id)]
+    
+    second.title = '신나는 기타'
+    db.session.commit()
+    assert suggest.suggest('잔잔') == ['잔잔한 피아노 연주']
+    assert suggest.suggest('신나') == ['신나는 기타']
+    
+    db.session.delete(first)
+    db.session.commit()
+    assert suggest.suggest('잔잔') == []
+    assert related.related(first.id) is None
+    
+    # 롤백된 변경은 반영하지 않음
+    db.session.add(type(first)('https://bucket.s3.amazonaws.com/music/x.mp3', '롤백 음악'))
+    db.session.flush()
+    db.session.rollback()
+    assert suggest.suggest('롤백') == []
+
+
+def test_prompt_index_follows_session_commits(app, db, make_music):
+    prompts = PromptMinHashIndex(app)
+    prompts.start()
+    assert prompts.find_similar('잔잔한 피아노 연주곡') == (None, 0.0)
+    
+    music = make_music('피아노', prompt='잔잔한 피아노 연주곡')
+    music_id, similarity = prompts.find_similar('잔잔한 피아노 연주곡')
+    assert (music_id, similarity) == (music.id, 1.0)
+    
+    db.session.delete(music)
+    db.session.commit()
+    assert prompts.find_similar('잔잔한 피아노 연주곡') == (None, 0.0)
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+import pytest
+from app.models.member import Member
+from app.models.mymusic import MyMusic
+
+
+@pytest.fixture
+def library(db, make_member, make_music):
+    """제목에 쉼표/따옴표/한글이 섞인 음악 3곡을 담은 회원"""
+    member = make_member()
+    titles = ['첫 번째 곡', 'Hello, "World"', '줄\n바꿈']
+    created = datetime(2024, 1, 1)
+    for index, title in enumerate(titles):
+        music = make_music(title)
+        my_music = MyMusic(music.id, member.id)
+        my_music.created_at = created + timedelta(minutes=index)
+        db.session.add(my_music)
+    db.session.commit()
+    return member
+
+
+def playlist_ids(client, headers):
+    return [music['id'] for music in client.get('/api/myplaylist', headers=headers).get_json()['data']['musicList']]
+
+
+def test_ndjson_export_streams_rows_in_playlist_order(client, library, auth_headers):
+    headers = auth_headers(library)
+    
+    response = client.get('/api/myplaylist/export?format=ndjson', headers=headers)
+    
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.headers['Content-Disposition'] == 'attachment; filename=myplaylist.ndjson'
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['id'] for row in rows] == playlist_ids(client, headers)
+    assert rows[1]['title'] == 'Hello, "World"'
+    assert set(rows[0]) == {'id', 'musicUrl', 'title', 'createdAt'}
+
+
+def test_csv_export_has_header_and_quotes_fields(client, library, auth_headers):
+    headers = auth_headers(library)
+    
+    response = client.get('/api/myplaylist/export?format=csv', headers=headers)
+    
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    body = response.get_data(as_text=True)
+    assert '"Hello, ""World"""' in body
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0] == ['id', 'musicUrl', 'title', 'createdAt']
+    assert [int(row[0]) for row in rows[1:]] == playlist_ids(client, headers)
+    assert [row[2] for row in rows[1:]] == ['줄\n바꿈', 'Hello, "World"', '첫 번째 곡']
+
+
+@pytest.mark.parametrize('export_format, expected', [('ndjson', ''), ('csv', 'id,musicUrl,title,createdAt\r\n')])
+def test_empty_library_export(client, make_member, auth_headers, export_format, expected):
+    response = client.get(f'/api/myplaylist/export?format={export_format}', headers=auth_headers(make_member()))
+    
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == expected
+
+
+def test_unsupported_format_is_rejected(client, library, auth_headers):
+    response = client.get('/api/myplaylist/export?format=xml', headers=auth_headers(library))
+    
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_errors_are_returned_before_streaming(client, db, library, auth_headers):
+    assert client.get('/api/myplaylist/export').status_code == 401
+    
+    headers = auth_headers(library)
+    db.session.delete(Member.find_by_id(library.id))
+    db.session.commit()
+    
+    response = client.get('/api/myplaylist/export?format=csv', headers=headers)
+    
+    # 스트리밍 응답 도중이 아니라 JSON 오류 응답으로 반환
+    assert response.status_code == 404
+    assert response.is_json
+    assert response.get_json()['success'] is False
@@ -0,0 +1,42 @@
+import pytest
+from app.models.like import Like
+from app.utils.query_counter import count_queries
+
+
+@pytest.fixture
+def liked_playlist(db, make_member, make_music):
+    """좋아요가 섞인 음악 목록을 만드는 함수"""
+    def liked_playlist(size):
+        member = make_member()
+        musics = [make_music(f'음악 {index}') for index in range(size)]
+        for music in musics[::2]:
+            Like.insert_if_absent(member.id, music.id)
+        db.session.commit()
+        return member
+    return liked_playlist
+
+
+@pytest.mark.parametrize('size', [2, 12])
+def test_playlist_query_count_does_not_grow_with_rows(client, liked_playlist, size):
+    liked_playlist(size)
+    
+    with count_queries() as queries:
+        response = client.get('/api/playlist')
+    
+    assert response.status_code == 200
+    assert queries.total <= 3
+    assert int(response.headers['X-Query-Count']) == queries.total
+
+
+@pytest.mark.parametrize('size', [2, 12])
+def test_authenticated_playlist_query_count_does_not_grow_with_rows(client, liked_playlist, auth_headers, size):
+    member = liked_playlist(size)
+    headers = auth_headers(member)
+    # 워커별 토큰 취소 필터 구성과 회원 식별 정보 캐시는 첫 요청에서 한 번만 조회
+    client.get('/api/playlist', headers=headers)
+    
+    with count_queries() as queries:
+        response = client.get('/api/playlist', headers=headers)
+    
+    assert response.status_code == 200
+    assert queries.total <= 3
@@ -0,0 +1,89 @@
+import re
+import pytest
+from sqlalchemy import event
+from app.models.like import Like
+from app.models.music import Music
+from app.models.mymusic import MyMusic
+
+# 색인 없이 테이블 전체를 읽는 실행 계획 (SCAN 테이블 / SCAN 테이블 AS 별칭)
+FULL_SCAN = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+
+
+@pytest.fixture
+def seeded(db, make_member, make_music):
+    """실행 계획 확인용 데이터 (회원 3명, 음악 60개, 좋아요/내 음악 일부)"""
+    members = [make_member(f'google-{index}', f'회원{index}') for index in range(3)]
+    musics = [make_music(f'음악 {index}') for index in range(60)]
+    for index, music in enumerate(musics):
+        member = members[index % len(members)]
+        db.session.add(MyMusic(music.id, member.id))
+        if index % 2 == 0:
+            db.session.add(Like(member.id, music.id))
+    db.session.commit()
+    db.session.execute(db.text('ANALYZE'))
+    # 실행 계획 수집 중 만료된 객체를 다시 읽지 않도록 ID만 반환
+    return [member.id for member in members], [music.id for music in musics]
+
+
+def query_plans(db, finder):
+    """finder가 실행한 SELECT 문마다 EXPLAIN QUERY PLAN 결과(detail 목록) 반환"""
+    statements = []
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+    
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        finder()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+    
+    assert statements, '실행된 SELECT 문이 없습니다'
+    connection = db.session.connection()
+    return [
+        [row[-1] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+        for statement, parameters in statements
+    ]
+
+
+def assert_uses_index(plans, index_name):
+    for details in plans:
+        scans = [detail for detail in details if FULL_SCAN.match(detail)]
+        assert not scans, f'전체 테이블 스캔: {scans} (계획: {details})'
+        assert any(index_name in detail for detail in details), f'{index_name} 미사용: {details}'
+
+
+def test_find_recent_uses_created_at_index(db, seeded):
+    plans = query_plans(db, lambda: Music.find_recent(5))
+    assert_uses_index(plans, 'ix_music_tb_created_at')
+
+
+def test_find_popular_uses_like_count_index(db, seeded):
+    plans = query_plans(db, lambda: Music.find_popular(5))
+    assert_uses_index(plans, 'ix_music_tb_like_count')
+
+
+def test_my_playlist_uses_member_created_at_index(db, seeded):
+    member_ids, _ = seeded
+    plans = query_plans(db, lambda: MyMusic.find_by_member_id(member_ids[0], 10))
+    assert_uses_index(plans, 'ix_mymusic_tb_member_id_created_at')
+
+
+def test_mymusic_lookup_uses_music_member_index(db, seeded):
+    member_ids, music_ids = seeded
+    plans = query_plans(db, lambda: MyMusic.find_by_music_id_and_member_id(music_ids[0], member_ids[0]))
+    assert_uses_index(plans, 'ix_mymusic_tb_music_id_member_id')
+
+
+def test_like_counts_use_music_id_index(db, seeded):
+    _, music_ids = seeded
+    assert_uses_index(query_plans(db, lambda: Like.count_by_music_ids(music_ids[:10])), 'ix_like_tb_music_id')
+    assert_uses_index(query_plans(db, lambda: Like.count_by_music(music_ids[0])), 'ix_like_tb_music_id')
+
+
+def test_member_like_lookup_uses_unique_index(db, seeded):
+    member_ids, music_ids = seeded
+    # unique_member_music 제약조건의 자동 색인
+    plans = query_plans(db, lambda: Like.find_music_ids_by_member(member_ids[0], music_ids[:10]))
+    assert_uses_index(plans, 'sqlite_autoindex_like_tb_1')
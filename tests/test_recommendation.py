@@ -0,0 +1,94 @@
+import math
+import pytest
+from app.models.like import Like
+from app.models.similar_music import SimilarMusic
+from app.services.recommendation_service import RecommendationService
+from app.utils.query_counter import count_queries
+
+
+@pytest.fixture
+def like_matrix(db, make_member, make_music):
+    """회원 4명 x 음악 4곡 좋아요 행렬
+        
+        회원 1: A B C / 회원 2: A B / 회원 3: B C / 회원 4: D
+        n(A)=2, n(B)=3, n(C)=2, n(D)=1
+        co(A,B)=2, co(A,C)=1, co(B,C)=2
+    """
+    musics = {title: make_music(title) for title in 'ABCD'}
+    members = [make_member(f'google-{index}') for index in range(1, 5)]
+    for member, titles in zip(members, ['ABC', 'AB', 'BC', 'D']):
+        for title in titles:
+            db.session.add(Like(member.id, musics[title].id))
+    db.session.commit()
+    return members, musics
+
+
+def similar_scores(music):
+    rows = SimilarMusic.query.filter_by(music_id=music.id).order_by(SimilarMusic.rank).all()
+    return [(row.similar_music_id, row.rank, row.score) for row in rows]
+
+
+def test_rebuild_scores_are_cosine_of_co_likes(app, like_matrix):
+    _, musics = like_matrix
+    A, B, C, D = (musics[title] for title in 'ABCD')
+    
+    assert RecommendationService.rebuild_similar_music() == 3
+    
+    assert similar_scores(A) == [(B.id, 1, pytest.approx(2 / math.sqrt(6))),
+                                 (C.id, 2, pytest.approx(1 / math.sqrt(4)))]
+    assert similar_scores(C) == [(B.id, 1, pytest.approx(2 / math.sqrt(6))),
+                                 (A.id, 2, pytest.approx(0.5))]
+    assert {other_id for other_id, _, _ in similar_scores(B)} == {A.id, C.id}
+    # 다른 회원과 함께 좋아요한 적이 없는 음악은 목록이 없음
+    assert similar_scores(D) == []
+
+
+def test_rebuild_keeps_top_n(app, like_matrix):
+    _, musics = like_matrix
+    
+    RecommendationService.rebuild_similar_music(top_n=1)
+    
+    assert similar_scores(musics['A']) == [(musics['B'].id, 1, pytest.approx(2 / math.sqrt(6)))]
+    assert SimilarMusic.query.count() == 3
+
+
+def test_incremental_rebuild_updates_only_targets(app, db, like_matrix):
+    members, musics = like_matrix
+    A, B, D = musics['A'], musics['B'], musics['D']
+    RecommendationService.rebuild_similar_music()
+    before_b = similar_scores(B)
+    # 회원 4가 A를 좋아요: n(A)=3, co(A,D)=1
+    db.session.add(Like(members[3].id, A.id))
+    db.session.commit()
+    
+    with count_queries() as queries:
+        result = app.test_cli_runner().invoke(args=['rebuild-similar-music', '--music-id', str(A.id)])
+    
+    assert result.exit_code == 0
+    assert similar_scores(A) == [(B.id, 1, pytest.approx(2 / math.sqrt(9))),
+                                 (D.id, 2, pytest.approx(1 / math.sqrt(3))),
+                                 (musics['C'].id, 3, pytest.approx(1 / math.sqrt(6)))]
+    assert similar_scores(B) == before_b
+    # 대상 음악을 좋아한 회원의 좋아요만 읽음
+    scans = [statement for statement in queries.fingerprints
+             if statement.startswith('SELECT like_tb.member_id AS like_tb_member_id')]
+    assert len(scans) == 1 and 'IN (SELECT like_tb.member_id' in scans[0]
+
+
+def test_similar_music_endpoint_returns_ranked_scores(app, client, like_matrix):
+    _, musics = like_matrix
+    A, B, C = musics['A'], musics['B'], musics['C']
+    RecommendationService.rebuild_similar_music()
+    
+    response = client.get(f'/api/music/{A.id}/similar')
+    
+    assert response.status_code == 200
+    music_list = response.get_json()['data']['musicList']
+    assert [(music['id'], music['title'], music['score']) for music in music_list] == [
+        (B.id, 'B', round(2 / math.sqrt(6), 4)), (C.id, 'C', 0.5)
+    ]
+    
+    response = client.get(f'/api/music/{A.id}/similar?limit=1')
+    assert [music['id'] for music in response.get_json()['data']['musicList']] == [B.id]
+    
+    assert client.get(f'/api/music/{A.id}/similar?limit=0').status_code == 400
@@ -0,0 +1,56 @@
+import os
+import pstats
+import pytest
+from flask import Flask, Response
+from app.utils.request_profiler import RequestProfiler
+
+
+def stream_body():
+    for index in range(3):
+        yield f'{index}\n'
+
+
+@pytest.fixture
+def profiled_app(tmp_path):
+    """cProfile 모드로 토큰 요청을 프로파일링하는 앱"""
+    app = Flask(__name__, instance_path=str(tmp_path))
+    app.config.update(PROFILER_ENABLED=True, PROFILER_TOKEN='profile-secret',
+                      PROFILER_MODE='cprofile', PROFILER_DIR=str(tmp_path / 'profiles'))
+    
+    @app.route('/stream')
+    def stream():
+        return Response(stream_body())
+    
+    RequestProfiler(app)
+    return app
+
+
+def test_streamed_body_is_profiled_and_saved_on_close(profiled_app, tmp_path):
+    client = profiled_app.test_client()
+    
+    response = client.get('/stream', headers={'X-Profile': 'profile-secret'}, buffered=False)
+    profile_path = tmp_path / 'profiles' / response.headers['X-Profile-Id']
+    assert not profile_path.exists()
+    
+    assert b''.join(response.response) == b'0\n1\n2\n'
+    response.close()
+    
+    functions = {name for _, _, name in pstats.Stats(str(profile_path)).stats}
+    assert 'stream_body' in functions
+
+
+def test_profile_file_names_are_unique_per_request(profiled_app):
+    profiler = profiled_app.extensions['request_profiler']
+    environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': '/stream'}
+    
+    paths = {profiler._output_path(environ) for _ in range(100)}
+    
+    assert len(paths) == 100
+    assert all(f'_{os.getpid()}_' in os.path.basename(path) for path in paths)
+
+
+def test_request_without_token_is_not_profiled(profiled_app, tmp_path):
+    response = profiled_app.test_client().get('/stream', headers={'X-Profile': 'wrong'})
+    
+    assert 'X-Profile-Id' not in response.headers
+    assert os.listdir(tmp_path / 'profiles') == []
@@ -0,0 +1,56 @@
+import json
+import logging
+import re
+from app import create_app, db as _db
+from app.config import Config, TestingConfig
+
+
+def test_server_timing_off_by_default():
+    assert Config.SERVER_TIMING_ENABLED is False
+
+
+def test_server_timing_header_reports_phases_and_db_count(client, make_member, auth_headers):
+    headers = auth_headers(make_member())
+    # 토큰 취소 필터 구성은 별도 앱 컨텍스트에서 한 번만 실행되므로 요청 구간에서 제외
+    client.get('/api/myplaylist', headers=headers)
+    
+    response = client.get('/api/myplaylist', headers=headers)
+    
+    assert response.status_code == 200
+    header = response.headers['Server-Timing']
+    phases = [metric.split(';')[0] for metric in header.split(', ')]
+    assert phases[-1] == 'total'
+    assert {'auth', 'db', 'serialize'} <= set(phases)
+    db_count = re.search(r'db;dur=[0-9.]+;desc="SQL \((\d+)\)"', header).group(1)
+    assert int(db_count) == int(response.headers['X-Query-Count'])
+
+
+def test_server_timing_header_absent_when_disabled():
+    class HeaderDisabledConfig(TestingConfig):
+        SERVER_TIMING_ENABLED = False
+    
+    app = create_app(HeaderDisabledConfig)
+    with app.app_context():
+        _db.create_all()
+        response = app.test_client().get('/api/playlist')
+        _db.session.remove()
+        _db.drop_all()
+    
+    assert response.status_code == 200
+    assert 'Server-Timing' not in response.headers
+
+
+def test_access_log_writes_one_json_line(client, caplog):
+    with caplog.at_level(logging.INFO, logger='app.access'):
+        response = client.get('/api/playlist')
+    
+    records = [record for record in caplog.records if record.name == 'app.access']
+    assert len(records) == 1
+    line = records[0].getMessage()
+    assert '\n' not in line
+    entry = json.loads(line)
+    assert entry['method'] == 'GET'
+    assert entry['path'] == '/api/playlist'
+    assert entry['status'] == response.status_code
+    assert entry['db_queries'] == int(response.headers['X-Query-Count'])
+    assert 'serialize' in entry['phases']
@@ -0,0 +1,49 @@
+import time
+import pytest
+from datetime import datetime, timedelta
+from app.auth.revocation import TokenRevocationStore
+from app.models.revoked_token import RevokedToken
+from app.utils.per_worker_index import PerWorkerIndex
+
+
+@pytest.fixture
+def store(app, monkeypatch):
+    monkeypatch.setattr(PerWorkerIndex, '_instances', [])
+    return TokenRevocationStore(app)
+
+
+def revoke_in_db(db, jti):
+    """다른 워커에서 취소한 토큰 (이 워커의 필터에는 없음)"""
+    RevokedToken.revoke(jti, datetime.utcnow() + timedelta(hours=1))
+    db.session.commit()
+
+
+def test_revoked_token_is_rejected_while_filter_is_not_built(db, store, monkeypatch):
+    revoke_in_db(db, 'revoked-jti')
+    
+    def fail():
+        raise RuntimeError('db down')
+    
+    monkeypatch.setattr(RevokedToken, 'find_active_jtis', fail)
+    
+    # 필터 구성에 실패해도 모든 토큰을 DB에서 확인
+    assert store.is_revoked('revoked-jti') is True
+    assert store.is_revoked('other-jti') is False
+    assert not store.ready
+
+
+def test_filter_answers_without_db_once_built(db, store, monkeypatch):
+    revoke_in_db(db, 'revoked-jti')
+    assert store.is_revoked('revoked-jti') is True
+    assert store.ready
+    
+    monkeypatch.setattr(RevokedToken, 'exists', lambda jti: pytest.fail('DB 조회'))
+    assert store.is_revoked('other-jti') is False
+
+
+def test_local_revoke_is_visible_immediately(db, store):
+    store.is_revoked('warm-up')
+    store.revoke('logout-jti', time.time() + 3600)
+    
+    assert 'logout-jti' in store._bloom
+    assert store.is_revoked('logout-jti') is True
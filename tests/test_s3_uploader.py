@@ -0,0 +1,36 @@
+import io
+from werkzeug.datastructures import FileStorage
+from app.utils.s3_uploader import S3Uploader, MB
+
+
+def file_storage(data, filename='cover.png', content_type='image/png'):
+    return FileStorage(io.BytesIO(data), filename=filename, content_type=content_type)
+
+
+def test_client_is_reused_per_process(s3_bucket):
+    assert S3Uploader.get_client() is s3_bucket
+    assert S3Uploader.get_client() is s3_bucket
+
+
+def test_upload_stores_object_with_content_type(app, s3_bucket):
+    url = S3Uploader.upload_file_to_s3(file_storage(b'png-data'), 'images', content_addressed=False)
+    
+    object_key = S3Uploader.object_key_from_url(url)
+    assert object_key.startswith('images/') and object_key.endswith('_cover.png')
+    stored = s3_bucket.get_object(Bucket='test-bucket', Key=object_key)
+    assert stored['Body'].read() == b'png-data'
+    assert stored['ContentType'] == 'image/png'
+
+
+def test_large_upload_uses_multipart(app, s3_bucket):
+    app.config.update(S3_MULTIPART_THRESHOLD_MB=5, S3_MULTIPART_CHUNKSIZE_MB=5)
+    data = b'x' * (11 * MB)
+    
+    url = S3Uploader.upload_file_to_s3(file_storage(data, 'clip.mp4', 'video/mp4'), 'videos',
+                                       content_addressed=False)
+    
+    stored = s3_bucket.head_object(Bucket='test-bucket', Key=S3Uploader.object_key_from_url(url))
+    assert stored['ContentLength'] == len(data)
+    # 멀티파트 업로드 객체의 ETag는 "<다이제스트>-<파트 수>" 형식
+    assert stored['ETag'].strip('"').endswith('-3')
+
@@ -0,0 +1,65 @@
+import time
+import flask_jwt_extended
+import pytest
+from flask_jwt_extended import decode_token
+from app.auth.revocation import token_revocation_store
+from app.auth.token_cache import VerifiedTokenCache, verified_token_cache
+from app.utils import ttl_cache
+
+
+@pytest.fixture
+def member_token(make_member, auth_headers):
+    """회원의 요청 헤더와 원본 토큰"""
+    headers = auth_headers(make_member())
+    return headers, headers['Authorization'][len('Bearer '):]
+
+
+def test_cache_hit_skips_signature_verification(client, member_token, monkeypatch):
+    headers, _ = member_token
+    assert client.get('/api/me', headers=headers).status_code == 200
+    
+    def fail_verify(*args, **kwargs):
+        raise AssertionError('캐시된 토큰은 다시 검증하지 않아야 합니다.')
+    monkeypatch.setattr(flask_jwt_extended, 'verify_jwt_in_request', fail_verify)
+    
+    assert client.get('/api/me', headers=headers).status_code == 200
+
+
+def test_entry_expires_at_token_exp(monkeypatch):
+    cache = VerifiedTokenCache()
+    now = time.monotonic()
+    cache.set('token', {'id': 1}, jti='jti-1', exp=time.time() + 10)
+    assert cache.get('token') == {'id': 1}
+    
+    monkeypatch.setattr(ttl_cache.time, 'monotonic', lambda: now + 11)
+    assert cache.get('token') is None
+
+
+def test_expired_token_is_not_stored():
+    cache = VerifiedTokenCache()
+    cache.set('token', {'id': 1}, jti='jti-1', exp=time.time() - 1)
+    
+    assert cache.get('token') is None
+
+
+def test_revoked_jti_is_rejected_on_cache_hit(client, member_token):
+    headers, raw_token = member_token
+    assert client.get('/api/me', headers=headers).status_code == 200
+    
+    # 다른 경로(다른 워커의 로그아웃 등)로 취소되어 캐시 항목은 남아 있는 상태
+    claims = decode_token(raw_token)
+    token_revocation_store.revoke(claims['jti'], claims['exp'])
+    assert verified_token_cache._cache.get(VerifiedTokenCache._key(raw_token)) is not None
+    
+    assert client.get('/api/me', headers=headers).status_code == 401
+
+
+def test_logout_evicts_cache_entry(client, member_token):
+    headers, raw_token = member_token
+    assert client.get('/api/me', headers=headers).status_code == 200
+    assert verified_token_cache._cache.get(VerifiedTokenCache._key(raw_token)) is not None
+    
+    assert client.post('/api/auth/logout', headers=headers).status_code == 200
+    
+    assert verified_token_cache._cache.get(VerifiedTokenCache._key(raw_token)) is None
+    assert client.get('/api/me', headers=headers).status_code == 401